@@ -0,0 +1,78 @@
+"""
+Dichotomy: binary search, its variants, and tools to visualize and benchmark them.
+
+Importing the package runs nothing and imports no submodule: every public
+name below is loaded from its submodule on first access, so NumPy,
+multiprocessing and the benchmark code are only paid for when used.
+Use `python -m dichotomy` for the search, bench, tikz and test commands.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "binary_search": "core",
+    "linear_search": "core",
+    "lower_bound": "bounds",
+    "upper_bound": "bounds",
+    "equal_range": "bounds",
+    "first_occurrence": "bounds",
+    "last_occurrence": "bounds",
+    "count_occurrences": "bounds",
+    "floor_search": "bounds",
+    "ceiling_search": "bounds",
+    "nearest_search": "bounds",
+    "binary_search_many": "batch_search",
+    "lower_bound_many": "batch_search",
+    "upper_bound_many": "batch_search",
+    "equal_range_many": "batch_search",
+    "count_many": "batch_search",
+    "floor_many": "batch_search",
+    "ceiling_many": "batch_search",
+    "nearest_many": "batch_search",
+    "ArithmeticRange": "lazy_range",
+    "SortedIntArray": "sorted_array",
+    "SortedBlockList": "sorted_blocks",
+    "RunLengthKeys": "run_length",
+    "SortedKeyFile": "sorted_file",
+    "write_sorted_file": "sorted_file",
+    "EytzingerIndex": "eytzinger",
+    "LearnedIndex": "learned_index",
+    "STRATEGIES": "search_strategies",
+    "register_strategy": "search_strategies",
+    "interpolation_search": "search_strategies",
+    "galloping_search": "search_strategies",
+    "exponential_search": "search_strategies",
+    "ParallelScanner": "parallel_scan",
+    "merge_join_search": "merge_join",
+    "FractionalCascade": "fractional_cascading",
+    "CachedSearch": "lookup_cache",
+    "LookupServer": "lookup_server",
+    "find_roots": "root_finding",
+    "invert": "root_finding",
+    "SearchInstrument": "instrumentation",
+    "instrument_strategies": "instrumentation",
+    "SearchTrace": "trace",
+    "trace_search": "trace",
+    "Scenario": "workloads",
+    "SCENARIOS": "workloads",
+    "generate_tikz": "visualization",
+    "write_tikz": "visualization",
+    "write_tikz_window": "visualization",
+    "performance_comparison": "comparison",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache it so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,243 @@
+"""
+Command-Line Interface Module.
+
+Usage:
+    python -m dichotomy search [--target T --low L --high H]
+    python -m dichotomy search --batch FILE|- (--low L --high H | --keys PATH) [--binary]
+    python -m dichotomy bench [BENCHMARK] [options]   (BENCHMARK: see BENCHMARKS below)
+    python -m dichotomy serve (--low L --high H | --keys [NAME=]PATH ...) [--port P | --unix PATH]
+    python -m dichotomy tikz [--target T] [--delta | --window N] [--output PATH] [VALUE ...]
+    python -m dichotomy tikz --window N (--low L --high H | --keys PATH) [--target T]
+    python -m dichotomy test [--skip-slow]
+
+Each command imports only the modules it needs, when it runs.
+"""
+import argparse
+import contextlib
+import importlib
+import os
+import sys
+
+# Benchmark name -> (submodule, function)
+BENCHMARKS = {
+    "comparison": ("comparison", "performance_comparison"),
+    "workloads": ("workloads", "workload_comparison"),
+    "strategies": ("search_strategies", "strategy_comparison"),
+    "eytzinger": ("eytzinger", "eytzinger_comparison"),
+    "learned": ("learned_index", "learned_index_comparison"),
+    "scan": ("parallel_scan", "parallel_scan_comparison"),
+    "join": ("merge_join", "merge_join_comparison"),
+    "cascade": ("fractional_cascading", "fractional_cascade_comparison"),
+    "array": ("sorted_array", "sorted_array_comparison"),
+    "blocks": ("sorted_blocks", "sorted_blocks_comparison"),
+    "rle": ("run_length", "run_length_comparison"),
+    "cache": ("lookup_cache", "lookup_cache_comparison"),
+    "stream": ("interactive", "stream_throughput"),
+    "server": ("lookup_server", "lookup_server_benchmark"),
+    "instrument": ("instrumentation", "instrumentation_report"),
+    "roots": ("root_finding", "root_finding_comparison"),
+    "tikz": ("visualization", "tikz_comparison"),
+}
+
+# Self-tests run by `test`, as (submodule, function, slow)
+TESTS = [
+    ("core", "test_binary_search", False),
+    ("bounds", "test_bounds", False),
+    ("trace", "test_search_trace", False),
+    ("lazy_range", "test_arithmetic_range", False),
+    ("sorted_file", "test_sorted_key_file", False),
+    ("sorted_array", "test_sorted_int_array", False),
+    ("interactive", "test_stream_search", False),
+    ("sorted_blocks", "test_sorted_block_list", False),
+    ("run_length", "test_run_length_keys", False),
+    ("lookup_cache", "test_cached_search", False),
+    ("lookup_server", "test_lookup_server", False),
+    ("search_strategies", "test_search_strategies", False),
+    ("eytzinger", "test_eytzinger_search", False),
+    ("learned_index", "test_learned_index", False),
+    ("batch_search", "test_binary_search_many", False),
+    ("root_finding", "test_root_finding", False),
+    ("merge_join", "test_merge_join_search", False),
+    ("fractional_cascading", "test_fractional_cascade", False),
+    ("visualization", "test_write_tikz", False),
+    ("benchmark", "test_benchmark", False),
+    ("workloads", "test_workloads", False),
+    ("instrumentation", "test_instrumentation", False),
+    ("parallel_scan", "test_parallel_scan", True),
+    ("import_time", "test_import_time", True),
+]
+
+
+def _load(module_name, function_name):
+    """Import dichotomy.<module_name> and return one of its functions."""
+    return getattr(importlib.import_module(f"{__package__}.{module_name}"), function_name)
+
+
+def run_search(args):
+    try:
+        _load("interactive", "main")(args.target, args.low, args.high, batch=args.batch,
+                                     key_file=args.keys, binary=args.binary)
+    except ValueError as error:
+        # Bad arguments or a malformed target line
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # The reader (e.g. `head`) went away; stop quietly like other filters
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except OSError as error:
+        # Missing or unreadable key or target file
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def run_bench(args):
+    benchmark = _load(*BENCHMARKS[args.benchmark])
+    if args.benchmark == "comparison":
+        benchmark(batched=args.batched, results_path=args.results, baseline_path=args.baseline,
+                  parallel=args.parallel, pin_cpus=args.pin_cpus)
+    elif args.benchmark == "workloads":
+        benchmark(results_path=args.results)
+    elif args.benchmark == "instrument":
+        benchmark(json_path=args.results)
+    else:
+        benchmark()
+    return 0
+
+
+def run_serve(args):
+    key_sets = {}
+    if args.low is not None and args.high is not None:
+        lazy_range = importlib.import_module(f"{__package__}.lazy_range")
+        key_sets["range"] = lazy_range.ArithmeticRange(min(args.low, args.high), max(args.low, args.high) + 1)
+    sorted_file = importlib.import_module(f"{__package__}.sorted_file")
+    for spec in args.keys:
+        name, _, path = spec.rpartition("=")
+        key_sets[name or os.path.splitext(os.path.basename(path))[0]] = sorted_file.SortedKeyFile(path)
+    if not key_sets:
+        print("error: serve needs --low and --high, or --keys", file=sys.stderr)
+        return 2
+
+    _load("lookup_server", "run_server")(key_sets, args.host, args.port, args.unix,
+                                         args.window_ms / 1000, args.max_batch)
+    return 0
+
+
+def run_tikz(args):
+    visualization = importlib.import_module(f"{__package__}.visualization")
+    target = visualization.DEMONSTRATION_TARGET if args.target is None else args.target
+    large = args.keys is not None or args.low is not None or args.high is not None
+    if large and args.window is None:
+        print("error: --low/--high and --keys need --window", file=sys.stderr)
+        return 2
+    if args.window is None and not args.delta:
+        visualization.generate_tikz(sorted(args.values or visualization.DEMONSTRATION_LIST), target)
+        return 0
+
+    with contextlib.ExitStack() as stack:
+        # Ranges and key files are searched in place, never materialized
+        if args.keys is not None:
+            values = stack.enter_context(_load("sorted_file", "SortedKeyFile")(args.keys))
+        elif args.low is not None and args.high is not None:
+            values = _load("lazy_range", "ArithmeticRange")(args.low, args.high + 1)
+        elif large:
+            print("error: --low and --high go together", file=sys.stderr)
+            return 2
+        else:
+            values = sorted(args.values or visualization.DEMONSTRATION_LIST)
+
+        sink = None if args.output is None else stack.enter_context(open(args.output, "w", buffering=1 << 16))
+        if args.window is None:
+            visualization.write_tikz(values, target, sink)
+            return 0
+        try:
+            visualization.write_tikz_window(values, target, args.window, sink)
+        except ValueError as error:
+            print(f"error: {error}", file=sys.stderr)
+            return 2
+    return 0
+
+
+def run_test(args):
+    skipped = []
+    for module_name, function_name, slow in TESTS:
+        if slow and args.skip_slow:
+            skipped.append(module_name)
+            continue
+        try:
+            test = _load(module_name, function_name)
+        except ImportError as error:
+            # Optional dependencies (NumPy) may be missing; report, don't fail
+            skipped.append(f"{module_name} ({error.name} not installed)")
+            continue
+        test()
+
+    if skipped:
+        print(f"Skipped: {', '.join(skipped)}")
+    return 0
+
+
+def build_parser():
+    """Build the argument parser with one subparser per command."""
+    parser = argparse.ArgumentParser(prog="python -m dichotomy", description="Search, benchmark and visualize binary search.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="search a target in the range [low, high]")
+    search.add_argument("--target", type=int, help="value to search for (asked if omitted)")
+    search.add_argument("--low", type=int, help="lower bound of the range (asked if omitted)")
+    search.add_argument("--high", type=int, help="upper bound of the range (asked if omitted)")
+    search.add_argument("--batch", metavar="FILE", help="answer every target in FILE ('-' for stdin), one per line")
+    search.add_argument("--keys", metavar="PATH", help="search a sorted key file instead of [low, high]")
+    search.add_argument("--binary", action="store_true", help="batch targets are little-endian int64, not text")
+    search.set_defaults(handler=run_search)
+
+    bench = commands.add_parser("bench", help="run a benchmark")
+    bench.add_argument("benchmark", nargs="?", default="comparison", choices=sorted(BENCHMARKS))
+    bench.add_argument("--batched", action="store_true", help="comparison: time binary_search_many")
+    bench.add_argument("--parallel", action="store_true", help="comparison: run on a process pool")
+    bench.add_argument("--pin-cpus", action="store_true", help="comparison: pin parallel workers to CPUs")
+    bench.add_argument("--results", metavar="PATH",
+                       help="comparison, workloads, instrument: write JSON results to PATH")
+    bench.add_argument("--baseline", metavar="PATH", help="comparison: flag regressions against PATH")
+    bench.set_defaults(handler=run_bench)
+
+    serve = commands.add_parser("serve", help="serve lookups over localhost TCP or a Unix socket")
+    serve.add_argument("--low", type=int, help="serve the range [low, high] as key set 'range'")
+    serve.add_argument("--high", type=int, help="upper bound of the served range")
+    serve.add_argument("--keys", metavar="[NAME=]PATH", action="append", default=[],
+                       help="serve a sorted key file (repeatable; NAME defaults to the file name)")
+    serve.add_argument("--host", default="127.0.0.1", help="TCP host (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="TCP port, 0 for any (default: 8765)")
+    serve.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    serve.add_argument("--window-ms", type=float, default=0.0,
+                       help="extra time a request waits for its batch to fill (default: 0)")
+    serve.add_argument("--max-batch", type=int, default=1024, help="batch size cap (default: 1024)")
+    serve.set_defaults(handler=run_serve)
+
+    tikz = commands.add_parser("tikz", help="print the TikZ animation of a search")
+    tikz.add_argument("--target", type=int, help="value to search for (default: the demonstration target)")
+    tikz.add_argument("--delta", action="store_true",
+                      help="draw each box once and encode the steps as overlay ranges")
+    tikz.add_argument("--window", type=int, metavar="N",
+                      help="draw only N keys around each mid, for lists too large to draw whole")
+    tikz.add_argument("--low", type=int, help="with --window, search the range [LOW, HIGH]")
+    tikz.add_argument("--high", type=int, help="with --window, search the range [LOW, HIGH]")
+    tikz.add_argument("--keys", metavar="PATH", help="with --window, search this sorted key file")
+    tikz.add_argument("--output", metavar="PATH", help="with --delta or --window, write to PATH instead of stdout")
+    tikz.add_argument("values", nargs="*", type=int, help="list to search (default: the demonstration list)")
+    tikz.set_defaults(handler=run_tikz)
+
+    test = commands.add_parser("test", help="run the self-tests and the import-time guard")
+    test.add_argument("--skip-slow", action="store_true", help="skip the multi-process and import-time tests")
+    test.set_defaults(handler=run_test)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Batched Binary Search Module.
+
+This module answers many binary search lookups in a single vectorized pass
+using NumPy, instead of one Python-level `while` loop per target.
+"""
+import numpy as np
+
+
+def binary_search_many(sorted_keys, targets):
+    """
+    Perform binary search for a whole batch of targets at once.
+
+    Every target follows exactly the same low/high/mid sequence as the scalar
+    `binary_search`, but the loop runs once per tree level over all targets
+    that are still active, so the interpreter overhead is paid about log2(n)
+    times per batch instead of log2(n) times per target.
+
+    Unsorted target batches are sorted internally before searching so that
+    neighbouring targets probe neighbouring keys, and the results are put back
+    in the caller's order afterwards.
+
+    Args:
+        sorted_keys: An array-like sorted in ascending order.
+        targets: An array-like of values to search for, in any order.
+
+    Returns:
+        A tuple of (indices, steps) NumPy int64 arrays, one entry per target:
+            - indices: Position of each target in sorted_keys, or -1 if not found.
+            - steps: Number of iterations performed for each target.
+    """
+    keys = np.asarray(sorted_keys)
+    queries = np.asarray(targets).ravel()
+    count = queries.size
+
+    indices = np.full(count, -1, dtype=np.int64)
+    steps = np.zeros(count, dtype=np.int64)
+    if count == 0 or keys.size == 0:
+        return indices, steps
+
+    # Search sorted targets for memory locality, then scatter results back
+    order = None
+    if count > 1 and np.any(queries[1:] < queries[:-1]):
+        order = np.argsort(queries, kind="stable")
+        queries = queries[order]
+
+    low = np.zeros(count, dtype=np.int64)
+    high = np.full(count, keys.size - 1, dtype=np.int64)
+    # Positions (into the batch) of targets whose interval is still non-empty
+    active = np.arange(count)
+
+    while active.size:
+        mid = (low[active] + high[active]) // 2
+        mid_value = keys[mid]
+        query = queries[active]
+        steps[active] += 1
+
+        found = mid_value == query
+        indices[active[found]] = mid[found]
+
+        # Target is in the upper half; discard lower half
+        go_right = ~found & (query > mid_value)
+        low[active[go_right]] = mid[go_right] + 1
+        # Target is in the lower half; discard upper half
+        go_left = ~found & ~go_right
+        high[active[go_left]] = mid[go_left] - 1
+
+        active = active[~found]
+        active = active[low[active] <= high[active]]
+
+    if order is not None:
+        unsorted_indices = np.empty_like(indices)
+        unsorted_steps = np.empty_like(steps)
+        unsorted_indices[order] = indices
+        unsorted_steps[order] = steps
+        return unsorted_indices, unsorted_steps
+
+    return indices, steps
+
+
+def _bound_many(keys, queries, side, low=None, high=None):
+    """
+    Vectorized `lower_bound` (side="left") or `upper_bound` (side="right").
+
+    Args:
+        keys: NumPy array sorted in ascending order.
+        queries: NumPy array of values to compare against.
+        side: "left" for the first value >= query, "right" for the first > query.
+        low: Optional array of per-query starting positions (defaults to 0).
+        high: Optional array of per-query exclusive end positions (defaults
+            to the number of keys).
+
+    Returns:
+        A tuple of (positions, steps) NumPy int64 arrays matching the scalar
+        functions in `bounds`, including their step counts.
+    """
+    count = queries.size
+    low = np.zeros(count, dtype=np.int64) if low is None else low.astype(np.int64)
+    high = np.full(count, keys.size, dtype=np.int64) if high is None else high.astype(np.int64)
+    steps = np.zeros(count, dtype=np.int64)
+    active = np.flatnonzero(low < high)
+
+    while active.size:
+        mid = (low[active] + high[active]) // 2
+        query = queries[active]
+        steps[active] += 1
+
+        if side == "left":
+            go_right = keys[mid] < query
+        else:
+            go_right = ~(query < keys[mid])
+        low[active[go_right]] = mid[go_right] + 1
+        high[active[~go_right]] = mid[~go_right]
+
+        active = active[low[active] < high[active]]
+
+    return low, steps
+
+
+def lower_bound_many(sorted_keys, targets):
+    """
+    Batched `bounds.lower_bound`: first position with a value >= each target.
+
+    Returns:
+        A tuple of (positions, steps) NumPy int64 arrays.
+    """
+    return _bound_many(np.asarray(sorted_keys), np.asarray(targets).ravel(), "left")
+
+
+def upper_bound_many(sorted_keys, targets):
+    """
+    Batched `bounds.upper_bound`: first position with a value > each target.
+
+    Returns:
+        A tuple of (positions, steps) NumPy int64 arrays.
+    """
+    return _bound_many(np.asarray(sorted_keys), np.asarray(targets).ravel(), "right")
+
+
+def equal_range_many(sorted_keys, targets):
+    """
+    Batched `bounds.equal_range`.
+
+    Returns:
+        A tuple of ((starts, stops), steps) NumPy int64 arrays, where
+        sorted_keys[starts[i]:stops[i]] holds exactly the values equal to targets[i].
+    """
+    keys = np.asarray(sorted_keys)
+    queries = np.asarray(targets).ravel()
+    starts, lower_steps = _bound_many(keys, queries, "left")
+    stops, upper_steps = _bound_many(keys, queries, "right", starts)
+    return (starts, stops), lower_steps + upper_steps
+
+
+def count_many(sorted_keys, targets):
+    """
+    Batched `bounds.count_occurrences`.
+
+    Returns:
+        A tuple of (counts, steps) NumPy int64 arrays.
+    """
+    (starts, stops), steps = equal_range_many(sorted_keys, targets)
+    return stops - starts, steps
+
+
+def floor_many(sorted_keys, targets):
+    """
+    Batched `bounds.floor_search`: last index with a value <= each target, or -1.
+
+    Returns:
+        A tuple of (indices, steps) NumPy int64 arrays.
+    """
+    positions, steps = upper_bound_many(sorted_keys, targets)
+    return positions - 1, steps
+
+
+def ceiling_many(sorted_keys, targets):
+    """
+    Batched `bounds.ceiling_search`: first index with a value >= each target, or -1.
+
+    Returns:
+        A tuple of (indices, steps) NumPy int64 arrays.
+    """
+    keys = np.asarray(sorted_keys)
+    positions, steps = lower_bound_many(keys, targets)
+    return np.where(positions < keys.size, positions, -1), steps
+
+
+def nearest_many(sorted_keys, targets):
+    """
+    Batched `bounds.nearest_search`: index of the closest value to each target.
+
+    Ties go to the first occurrence of the smaller neighbour; every index is
+    -1 for empty keys.
+
+    Returns:
+        A tuple of (indices, steps) NumPy int64 arrays.
+    """
+    keys = np.asarray(sorted_keys)
+    queries = np.asarray(targets).ravel()
+    positions, steps = _bound_many(keys, queries, "left")
+    if keys.size == 0:
+        return np.full(queries.size, -1, dtype=np.int64), steps
+
+    below = keys[np.maximum(positions - 1, 0)]
+    above = keys[np.minimum(positions, keys.size - 1)]
+    inner = (positions > 0) & (positions < keys.size)
+    take_below = (positions == keys.size) | (inner & (queries - below <= above - queries))
+    indices = np.where(take_below, positions - 1, positions)
+
+    # Step back to the first occurrence of the smaller neighbour (the largest
+    # key beyond the end), as the scalar does
+    back = np.flatnonzero(take_below)
+    if back.size:
+        first_below, back_steps = _bound_many(keys, below[back], "left", high=positions[back])
+        indices[back] = first_below
+        steps[back] += back_steps
+    return indices, steps
+
+
+def test_binary_search_many():
+    """
+    Run unit tests to verify binary_search_many correctness.
+
+    Mirrors the edge cases of `test_binary_search` and checks that unsorted
+    batches keep the caller's order and the scalar step counts.
+    """
+    # Test empty list and empty batch
+    assert binary_search_many([], [5])[0].tolist() == [-1]
+    assert binary_search_many([1, 2, 3], [])[0].tolist() == []
+
+    # Targets at the boundaries, absent, and in unsorted order
+    indices, steps = binary_search_many([1, 2, 3, 4, 5], [5, 1, 6, 3])
+    assert indices.tolist() == [4, 0, -1, 2]
+    # Same step counts as binary_search([1, 2, 3, 4, 5], target)[1]
+    assert steps.tolist() == [3, 2, 3, 1]
+
+    # With duplicates, any valid index containing the target is acceptable
+    assert binary_search_many([1, 2, 2, 2, 3], [2])[0][0] in [1, 2, 3]
+
+    # Bound queries count duplicates and locate absent keys
+    assert count_many([1, 2, 2, 2, 3], [2, 4, 0])[0].tolist() == [3, 0, 0]
+    assert floor_many([1, 2, 2, 2, 3], [2, 0])[0].tolist() == [3, -1]
+    assert nearest_many([1, 3, 7], [5, 6, 100])[0].tolist() == [1, 2, 2]
+
+    # Nearest agrees with the scalar search, steps included, on duplicated ends
+    from .bounds import nearest_search
+    keys = [1, 1, 2, 2, 2, 5, 9, 9]
+    targets = [-3, 1, 1.5, 3, 3.5, 7, 9, 20]
+    indices, steps = nearest_many(keys, targets)
+    assert list(zip(indices.tolist(), steps.tolist())) == [nearest_search(keys, target) for target in targets]
+
+    print("All batch tests passed.")
+
+
+if __name__ == "__main__":
+    test_binary_search_many()
@@ -0,0 +1,454 @@
+"""
+Benchmark Harness Module.
+
+This module times search functions with enough care that the numbers can be
+compared across runs: warm-up calls, loop counts calibrated so each sample is
+far above the timer resolution, many samples, and median/p95/p99 with a
+confidence interval for the median. Results can be written to JSON and
+compared against a saved baseline to flag regressions.
+"""
+import gc
+import json
+import math
+import platform
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class Measurement:
+    """Timing statistics of one algorithm at one size, in seconds per search."""
+
+    size: int
+    algorithm: str
+    median: float
+    mean: float
+    p95: float
+    p99: float
+    ci_low: float
+    ci_high: float
+    samples: int
+    loops: int
+    steps: float | None = None
+    memory_bytes: int | None = None
+
+
+def percentile(sorted_samples, fraction):
+    """
+    Return the interpolated percentile of already sorted samples.
+
+    Args:
+        sorted_samples: Non-empty list of numbers in ascending order.
+        fraction: Percentile as a fraction, e.g. 0.95 for p95.
+    """
+    position = (len(sorted_samples) - 1) * fraction
+    below = math.floor(position)
+    above = min(below + 1, len(sorted_samples) - 1)
+    weight = position - below
+    return sorted_samples[below] * (1 - weight) + sorted_samples[above] * weight
+
+
+def median_confidence_interval(sorted_samples, z=1.96):
+    """
+    Distribution-free confidence interval for the median (95% by default).
+
+    Uses the order statistics whose ranks lie z standard deviations either
+    side of n / 2 under the binomial distribution of samples below the median.
+
+    Returns:
+        A tuple of (low, high) sample values.
+    """
+    count = len(sorted_samples)
+    half_width = z * math.sqrt(count) / 2
+    low = max(0, math.floor(count / 2 - half_width))
+    high = min(count - 1, math.ceil(count / 2 + half_width) - 1)
+    return sorted_samples[low], sorted_samples[high]
+
+
+def calibrate_loops(call, min_sample_time=2e-4, max_loops=1 << 20):
+    """
+    Find how many calls one sample needs to last at least min_sample_time.
+
+    Args:
+        call: Zero-argument callable to time.
+        min_sample_time: Minimum duration of one sample, in seconds.
+        max_loops: Upper bound on the loop count.
+
+    Returns:
+        The loop count to use per sample.
+    """
+    loops = 1
+    while loops < max_loops:
+        start_time = timeit.default_timer()
+        for _ in range(loops):
+            call()
+        elapsed = timeit.default_timer() - start_time
+        if elapsed >= min_sample_time:
+            break
+        # Jump close to the target instead of doubling from 1 every time
+        loops = min(max_loops, max(loops * 2, int(loops * min_sample_time / max(elapsed, 1e-9))))
+    return loops
+
+
+def summarize(samples, loops, size, algorithm, steps):
+    """
+    Turn per-search sample times into a Measurement.
+
+    Samples from several runs (e.g. parallel chunks of the same targets) can
+    be concatenated before summarizing.
+    """
+    samples = sorted(samples)
+    ci_low, ci_high = median_confidence_interval(samples)
+    return Measurement(
+        size=size,
+        algorithm=algorithm,
+        median=percentile(samples, 0.5),
+        mean=sum(samples) / len(samples),
+        p95=percentile(samples, 0.95),
+        p99=percentile(samples, 0.99),
+        ci_low=ci_low,
+        ci_high=ci_high,
+        samples=len(samples),
+        loops=loops,
+        steps=steps,
+    )
+
+
+def collect_search_samples(search, sorted_list, targets, repeats=20, warmup=3, max_time=1.0,
+                           min_sample_time=2e-4, count_steps=True):
+    """
+    Take raw timing samples of search(sorted_list, target) over a list of targets.
+
+    Each sample times `loops` calls for one target; every repeat takes one
+    sample per target, so the percentiles cover the spread across targets.
+    Repeats stop early once max_time is spent (after at least one repeat),
+    which keeps slow baselines such as linear search affordable.
+
+    Args:
+        search: Function(sorted_list, target), e.g. `binary_search`.
+        sorted_list: The sequence to search.
+        targets: Non-empty list of targets.
+        repeats: Maximum number of passes over the targets.
+        warmup: Number of untimed calls before calibration.
+        max_time: Time budget for the timed passes, in seconds.
+        min_sample_time: Minimum duration of one sample, in seconds.
+        count_steps: If True, search returns (index, steps) and the total
+            steps of the first timed pass are recorded.
+
+    Returns:
+        A tuple of (samples, loops, total_steps) where samples are seconds
+        per search and total_steps is None unless count_steps.
+    """
+    for call_index in range(warmup):
+        search(sorted_list, targets[call_index % len(targets)])
+
+    loops = calibrate_loops(lambda: search(sorted_list, targets[0]), min_sample_time)
+
+    samples = []
+    total_steps = 0 if count_steps else None
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        budget_start = timeit.default_timer()
+        for repeat_index in range(repeats):
+            for target in targets:
+                start_time = timeit.default_timer()
+                for _ in range(loops):
+                    result = search(sorted_list, target)
+                samples.append((timeit.default_timer() - start_time) / loops)
+                # Steps come from the timed calls' own results, never a second pass
+                if count_steps and repeat_index == 0:
+                    total_steps += result[1]
+            if timeit.default_timer() - budget_start >= max_time:
+                break
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return samples, loops, total_steps
+
+
+def measure_search(search, sorted_list, targets, algorithm, size=None, count_steps=True, **options):
+    """
+    Time search(sorted_list, target) over a list of targets.
+
+    Args:
+        search: Function(sorted_list, target), e.g. `binary_search`.
+        sorted_list: The sequence to search.
+        targets: Non-empty list of targets.
+        algorithm: Name recorded in the results.
+        size: Size recorded in the results (defaults to len(sorted_list)).
+        count_steps: If True, search returns (index, steps) and the average
+            steps are recorded.
+        **options: Sampling options of `collect_search_samples` (repeats,
+            warmup, max_time, min_sample_time).
+
+    Returns:
+        A Measurement with per-search times in seconds.
+    """
+    samples, loops, total_steps = collect_search_samples(
+        search, sorted_list, targets, count_steps=count_steps, **options)
+    steps = None if total_steps is None else total_steps / len(targets)
+    return summarize(samples, loops, len(sorted_list) if size is None else size, algorithm, steps)
+
+
+def measure_batch(search_many, sorted_keys, targets, algorithm, size=None, repeats=50, warmup=1,
+                  max_time=1.0, min_sample_time=2e-4):
+    """
+    Time one batched call search_many(sorted_keys, targets), per target.
+
+    Args:
+        search_many: Function returning (indices, steps) arrays, e.g.
+            `binary_search_many`.
+        sorted_keys: The keys to search, already in the function's format.
+        targets: Non-empty batch of targets.
+        algorithm: Name recorded in the results.
+        size: Size recorded in the results (defaults to len(sorted_keys)).
+        repeats: Maximum number of samples.
+        warmup: Number of untimed batch calls.
+        max_time: Time budget for the samples, in seconds.
+        min_sample_time: Minimum duration of one sample, in seconds.
+
+    Returns:
+        A Measurement with the batch time divided by the number of targets.
+    """
+    for _ in range(warmup):
+        search_many(sorted_keys, targets)
+
+    loops = calibrate_loops(lambda: search_many(sorted_keys, targets), min_sample_time)
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        budget_start = timeit.default_timer()
+        for _ in range(repeats):
+            start_time = timeit.default_timer()
+            for _ in range(loops):
+                search_many(sorted_keys, targets)
+            samples.append((timeit.default_timer() - start_time) / (loops * len(targets)))
+            if timeit.default_timer() - budget_start >= max_time:
+                break
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    _, steps = search_many(sorted_keys, targets)
+    steps = float(sum(steps)) / len(targets)
+    return summarize(samples, loops, len(sorted_keys) if size is None else size, algorithm, steps)
+
+
+def measure_memory(build):
+    """
+    Build a data structure and measure the memory it allocated.
+
+    Args:
+        build: Zero-argument callable returning the structure.
+
+    Returns:
+        A tuple of (structure, bytes) where bytes is the memory still
+        allocated by the build when it returns, as traced by tracemalloc.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        structure = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return structure, after - before
+
+
+def write_results(path, measurements, metadata=None):
+    """
+    Write measurements and run metadata to a JSON file.
+
+    Args:
+        path: Destination file path.
+        measurements: List of Measurement objects.
+        metadata: Optional dict of extra fields stored under "metadata".
+    """
+    document = {
+        "metadata": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            **(metadata or {}),
+        },
+        "results": [asdict(measurement) for measurement in measurements],
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+
+
+def load_results(path):
+    """
+    Read measurements written by `write_results`.
+
+    Returns:
+        A list of Measurement objects.
+    """
+    with open(path, encoding="utf-8") as file:
+        document = json.load(file)
+    return [Measurement(**result) for result in document["results"]]
+
+
+def find_regressions(measurements, baseline, threshold=0.10):
+    """
+    Compare measurements against a baseline run.
+
+    A result regresses when its median is more than threshold slower than the
+    baseline median and the two medians' confidence intervals do not overlap,
+    so noise alone does not trigger a flag.
+
+    Args:
+        measurements: Current list of Measurement objects.
+        baseline: Baseline list of Measurement objects.
+        threshold: Relative slowdown tolerated, e.g. 0.10 for 10%.
+
+    Returns:
+        A list of (current, baseline, ratio) tuples, ratio = current / baseline median.
+    """
+    baseline_by_key = {(item.size, item.algorithm): item for item in baseline}
+    regressions = []
+
+    for current in measurements:
+        reference = baseline_by_key.get((current.size, current.algorithm))
+        if reference is None or reference.median <= 0:
+            continue
+        ratio = current.median / reference.median
+        if ratio > 1 + threshold and current.ci_low > reference.ci_high:
+            regressions.append((current, reference, ratio))
+
+    return regressions
+
+
+def render_table(measurements, baseline="linear", contender="binary", show_steps=True):
+    """
+    Render the classic speedup table of `performance_comparison`.
+
+    Time columns show the median time per search.
+
+    Args:
+        measurements: List of Measurement objects.
+        baseline: Algorithm shown in the first (slow) columns.
+        contender: Algorithm shown in the second columns.
+        show_steps: If True, include the step columns (115 wide layout),
+            otherwise use the narrower 80 wide layout of tasks.py.
+
+    Returns:
+        The table as a string.
+    """
+    by_key = {(item.size, item.algorithm): item for item in measurements}
+    sizes = sorted({item.size for item in measurements})
+    width = 115 if show_steps else 80
+    lines = ["=" * width, "PERFORMANCE COMPARISON (Median time per search)", "=" * width]
+
+    if show_steps:
+        lines.append(
+            f"{'List Size (N)':<15} {'Lin. Time(s)':<15} {'Lin. Steps':<15}"
+            f" {'Bin. Time(s)':<15} {'Bin. Steps':<15} {'Speedup'}")
+    else:
+        lines.append(f"{'List Size (N)':<20} {'Linear Search (s)':<25} {'Binary Search (s)':<25} {'Speedup'}")
+    lines.append("-" * width)
+
+    for size in sizes:
+        slow = by_key.get((size, baseline))
+        fast = by_key.get((size, contender))
+        if slow is None or fast is None:
+            continue
+        speedup = (slow.median / fast.median) if fast.median > 0 else float('inf')
+
+        if show_steps:
+            lines.append(
+                f"{size:<15,d} {slow.median:<15.6f} {slow.steps or 0:<15.0f}"
+                f" {fast.median:<15.6f} {fast.steps or 0:<15.0f} {speedup:,.0f}x")
+        else:
+            lines.append(f"{size:<20,d} {slow.median:<25.6f} {fast.median:<25.6f} {speedup:,.0f}x")
+
+    lines.append("=" * width)
+    return "\n".join(lines)
+
+
+def render_statistics(measurements):
+    """
+    Render every measurement with its full statistics, one row each.
+
+    Returns:
+        The table as a string.
+    """
+    width = 140
+    lines = [
+        "=" * width,
+        "BENCHMARK STATISTICS (seconds per search)",
+        "=" * width,
+        f"{'List Size (N)':<15} {'Algorithm':<15} {'Median':<12} {'95% CI':<25} {'p95':<12}"
+        f" {'p99':<12} {'Samples':<9} {'Loops':<9} {'Steps':<9} {'Bytes/Key'}",
+        "-" * width,
+    ]
+
+    for item in sorted(measurements, key=lambda m: (m.size, m.algorithm)):
+        interval = f"[{item.ci_low:.3g}, {item.ci_high:.3g}]"
+        steps = "-" if item.steps is None else f"{item.steps:.1f}"
+        per_key = "-" if item.memory_bytes is None else f"{item.memory_bytes / max(item.size, 1):.2f}"
+        lines.append(
+            f"{item.size:<15,d} {item.algorithm:<15} {item.median:<12.3g} {interval:<25}"
+            f" {item.p95:<12.3g} {item.p99:<12.3g} {item.samples:<9d} {item.loops:<9d}"
+            f" {steps:<9} {per_key}")
+
+    lines.append("=" * width)
+    return "\n".join(lines)
+
+
+def render_regressions(regressions):
+    """
+    Render the output of `find_regressions`.
+
+    Returns:
+        The report as a string.
+    """
+    if not regressions:
+        return "No regressions against the baseline."
+
+    lines = [f"{len(regressions)} regression(s) against the baseline:"]
+    for current, reference, ratio in regressions:
+        lines.append(
+            f"  {current.algorithm} at N={current.size:,d}: median {current.median:.3g}s"
+            f" vs {reference.median:.3g}s ({ratio:.2f}x slower)")
+    return "\n".join(lines)
+
+
+def test_benchmark():
+    """
+    Run unit tests to verify the statistics, JSON round trip and regressions.
+    """
+    import os
+    import tempfile
+
+    samples = list(range(1, 102))
+    assert percentile(samples, 0.5) == 51
+    assert percentile(samples, 0.99) == 100
+    low, high = median_confidence_interval(samples)
+    assert low < 51 < high
+
+    fast = summarize([1.0] * 20, 1, 10, "binary", 3.0)
+    slow = summarize([2.0] * 20, 1, 10, "binary", 3.0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results.json")
+        write_results(path, [fast])
+        assert load_results(path) == [fast]
+
+    assert find_regressions([slow], [fast])[0][2] == 2.0
+    assert find_regressions([fast], [slow]) == []
+
+    print("All benchmark tests passed.")
+
+
+if __name__ == "__main__":
+    test_benchmark()
@@ -0,0 +1,228 @@
+"""
+Bound Queries Module.
+
+This module answers ordered queries on sorted lists that `binary_search`
+cannot: the first and last occurrence of a duplicated key, the range and count
+of its occurrences, and the floor, ceiling and nearest key of a value that may
+be absent. Every query runs in O(log n), whatever the number of duplicates,
+and returns its result together with a step count like `binary_search`.
+"""
+
+
+def lower_bound(sorted_list, target, low=0, high=None):
+    """
+    Find the first position whose value is not less than target.
+
+    Args:
+        sorted_list: A list sorted in ascending order.
+        target: The value to compare against.
+        low: First position of the search interval (defaults to the start).
+        high: End of the search interval, exclusive (defaults to the length).
+
+    Returns:
+        A tuple of (position, steps) where:
+            - position: Index of the first value >= target, or high (len of
+                the list by default) if every value is smaller.
+            - steps: Number of iterations performed.
+    """
+    if high is None:
+        high = len(sorted_list)
+    steps = 0
+
+    while low < high:
+        mid = (low + high) // 2
+        steps += 1
+
+        if sorted_list[mid] < target:
+            # mid and everything before it are too small
+            low = mid + 1
+        else:
+            # mid is a candidate; keep it in the interval
+            high = mid
+
+    return low, steps
+
+
+def upper_bound(sorted_list, target, low=0, high=None):
+    """
+    Find the first position whose value is greater than target.
+
+    Args:
+        sorted_list: A list sorted in ascending order.
+        target: The value to compare against.
+        low: First position of the search interval (defaults to the start).
+        high: End of the search interval, exclusive (defaults to the length).
+
+    Returns:
+        A tuple of (position, steps) where:
+            - position: Index of the first value > target, or high (len of
+                the list by default) if no value is greater.
+            - steps: Number of iterations performed.
+    """
+    if high is None:
+        high = len(sorted_list)
+    steps = 0
+
+    while low < high:
+        mid = (low + high) // 2
+        steps += 1
+
+        if target < sorted_list[mid]:
+            high = mid
+        else:
+            low = mid + 1
+
+    return low, steps
+
+
+def equal_range(sorted_list, target):
+    """
+    Find the half-open range of positions holding target.
+
+    The upper bound search starts from the lower bound, so it only covers the
+    part of the list that can still contain the end of the run.
+
+    Args:
+        sorted_list: A list sorted in ascending order.
+        target: The value to search for.
+
+    Returns:
+        A tuple of ((start, stop), steps) where:
+            - start, stop: sorted_list[start:stop] are exactly the values equal
+                to target; start == stop (the insertion point) if absent.
+            - steps: Total iterations of both bound searches.
+    """
+    start, lower_steps = lower_bound(sorted_list, target)
+    stop, upper_steps = upper_bound(sorted_list, target, start)
+    return (start, stop), lower_steps + upper_steps
+
+
+def first_occurrence(sorted_list, target):
+    """
+    Find the first index of target.
+
+    Returns:
+        A tuple of (index, steps) where index is -1 if target is absent.
+    """
+    position, steps = lower_bound(sorted_list, target)
+    if position < len(sorted_list) and sorted_list[position] == target:
+        return position, steps
+    return -1, steps
+
+
+def last_occurrence(sorted_list, target):
+    """
+    Find the last index of target.
+
+    Returns:
+        A tuple of (index, steps) where index is -1 if target is absent.
+    """
+    position, steps = upper_bound(sorted_list, target)
+    if position > 0 and sorted_list[position - 1] == target:
+        return position - 1, steps
+    return -1, steps
+
+
+def count_occurrences(sorted_list, target):
+    """
+    Count how many times target occurs, in O(log n) regardless of the count.
+
+    Returns:
+        A tuple of (count, steps).
+    """
+    (start, stop), steps = equal_range(sorted_list, target)
+    return stop - start, steps
+
+
+def floor_search(sorted_list, target):
+    """
+    Find the last index whose value is less than or equal to target.
+
+    Returns:
+        A tuple of (index, steps) where index is -1 if every value is greater.
+    """
+    position, steps = upper_bound(sorted_list, target)
+    return position - 1, steps
+
+
+def ceiling_search(sorted_list, target):
+    """
+    Find the first index whose value is greater than or equal to target.
+
+    Returns:
+        A tuple of (index, steps) where index is -1 if every value is smaller.
+    """
+    position, steps = lower_bound(sorted_list, target)
+    if position < len(sorted_list):
+        return position, steps
+    return -1, steps
+
+
+def nearest_search(sorted_list, target):
+    """
+    Find the index of the value closest to target.
+
+    Ties between a smaller and a larger neighbour go to the smaller one.
+    The first occurrence of the chosen value is returned, also for targets
+    above every key when the largest key is duplicated.
+
+    Returns:
+        A tuple of (index, steps) where index is -1 only for an empty list.
+    """
+    size = len(sorted_list)
+    position, steps = lower_bound(sorted_list, target)
+    if size == 0:
+        return -1, steps
+    if position == 0:
+        return 0, steps
+
+    below = sorted_list[position - 1]
+    if position == size or target - below <= sorted_list[position] - target:
+        # Step back to the first occurrence of the smaller neighbour (or of
+        # the largest key, for targets above every key)
+        first_below, back_steps = lower_bound(sorted_list, below, 0, position)
+        return first_below, steps + back_steps
+    return position, steps
+
+
+def test_bounds():
+    """
+    Run unit tests to verify the bound queries.
+
+    Tests cover an empty list, a duplicated key, absent keys between,
+    below and above the values, and ties for the nearest key.
+    """
+    values = [1, 2, 2, 2, 3, 7]
+
+    # Test empty list
+    assert equal_range([], 5)[0] == (0, 0)
+    assert floor_search([], 5)[0] == ceiling_search([], 5)[0] == nearest_search([], 5)[0] == -1
+
+    # Duplicates: first, last, range and count
+    assert first_occurrence(values, 2)[0] == 1
+    assert last_occurrence(values, 2)[0] == 3
+    assert equal_range(values, 2)[0] == (1, 4)
+    assert count_occurrences(values, 2)[0] == 3
+
+    # Absent keys
+    assert first_occurrence(values, 5)[0] == last_occurrence(values, 5)[0] == -1
+    assert equal_range(values, 5)[0] == (5, 5)
+    assert count_occurrences(values, 0)[0] == count_occurrences(values, 8)[0] == 0
+
+    # Floor, ceiling and nearest around gaps and boundaries
+    assert floor_search(values, 5)[0] == 4 and ceiling_search(values, 5)[0] == 5
+    assert floor_search(values, 0)[0] == -1 and ceiling_search(values, 8)[0] == -1
+    assert floor_search(values, 2)[0] == 3 and ceiling_search(values, 2)[0] == 1
+    assert nearest_search(values, 4)[0] == 4
+    assert nearest_search(values, 5)[0] == 4  # tie between 3 and 7
+    assert nearest_search(values, 6)[0] == 5
+    assert nearest_search(values, 2.4)[0] == 1  # first of the duplicated 2s
+    assert nearest_search(values, -10)[0] == 0 and nearest_search(values, 10)[0] == 5
+    # Above a duplicated maximum, the first occurrence of it
+    assert nearest_search([1, 2, 2], 5) == (1, lower_bound([1, 2, 2], 5)[1] + lower_bound([1, 2, 2], 2)[1])
+
+    print("All bound tests passed.")
+
+
+if __name__ == "__main__":
+    test_bounds()
@@ -0,0 +1,95 @@
+"""
+Binary Search vs Linear Search Performance Comparison Module.
+
+This module demonstrates the efficiency difference between binary search (O(log n))
+and linear search (O(n)) algorithms through benchmarking.
+"""
+import random
+from array import array
+
+from .benchmark import (find_regressions, load_results, measure_batch, measure_memory, measure_search,
+                        render_regressions, render_statistics, render_table, write_results)
+from .core import binary_search, linear_search
+
+
+def performance_comparison(batched=False, strategies=False, results_path=None, baseline_path=None,
+                           parallel=False, pin_cpus=False):
+    """
+    Benchmark binary search vs linear search across varying list sizes.
+
+    Runs multiple searches for each list size through the `benchmark`
+    harness and reports median time per search, step count, relative
+    speedup, and the full statistics of every measurement.
+
+    Args:
+        batched: If True, time the binary searches as one call to
+            `binary_search_many` over all targets (requires NumPy) and
+            report the per-search share of that call.
+        strategies: If True, instead run every registered search strategy
+            on the same targets and report time and steps for each.
+        results_path: Optional path of a JSON file to write the results to.
+        baseline_path: Optional path of a previous JSON results file; slower
+            results are flagged as regressions.
+        parallel: If True, spread the (size, algorithm, target chunk) work
+            units over a process pool with the keys in shared memory
+            (the scalar binary search is timed; batched does not apply).
+        pin_cpus: With parallel, pin each worker process to its own CPU.
+    """
+    list_sizes = [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+    num_searches = 100
+
+    if strategies:
+        # Imported lazily so that importing this module stays cheap
+        from .search_strategies import strategy_comparison
+        strategy_comparison(list_sizes, num_searches)
+        return
+
+    if batched:
+        # Imported lazily so the scalar benchmark does not require NumPy
+        import numpy as np
+        from .batch_search import binary_search_many
+
+    if parallel:
+        # Imported lazily: multiprocessing is only needed for this mode
+        from .parallel_benchmark import parallel_comparison
+        measurements = parallel_comparison(list_sizes, ("linear", "binary"), num_searches, pin_cpus=pin_cpus)
+    else:
+        measurements = []
+        for size in list_sizes:
+            # Materialized int64 keys (8 bytes each, like the parallel key
+            # block), so Bytes/Key reports the structure actually searched
+            sorted_list, memory_bytes = measure_memory(lambda: array("q", range(size)))
+            targets = [random.randint(0, size - 1) for _ in range(num_searches)]
+
+            linear = measure_search(linear_search, sorted_list, targets, "linear")
+
+            if batched:
+                # A view of the same buffer, so the memory measured above applies
+                sorted_keys = np.frombuffer(sorted_list, dtype=np.int64)
+                binary = measure_batch(binary_search_many, sorted_keys, targets, "binary")
+            else:
+                binary = measure_search(binary_search, sorted_list, targets, "binary")
+
+            linear.memory_bytes = binary.memory_bytes = memory_bytes
+            measurements += [linear, binary]
+
+    print(render_table(measurements))
+    print(render_statistics(measurements))
+
+    if results_path is not None:
+        write_results(results_path, measurements, {"batched": batched, "num_searches": num_searches})
+    if baseline_path is not None:
+        print(render_regressions(find_regressions(measurements, load_results(baseline_path))))
+
+
+# Output example (render_table; the full statistics from render_statistics follow it):
+# ===================================================================================================================
+# PERFORMANCE COMPARISON (Median time per search)
+# ===================================================================================================================
+# List Size (N)   Lin. Time(s)    Lin. Steps      Bin. Time(s)    Bin. Steps      Speedup
+# -------------------------------------------------------------------------------------------------------------------
+# 10,000          0.000483        5012            0.000003        12              175x
+# 100,000         0.004440        50911           0.000004        16              1,168x
+# 1,000,000       0.049426        504300          0.000004        19              11,014x
+# 10,000,000      0.487539        5001798         0.000005        22              96,639x
+# ===================================================================================================================
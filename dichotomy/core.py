@@ -0,0 +1,100 @@
+"""
+Core Search Kernels Module.
+
+This module holds the two searches everything else is compared against:
+binary search (O(log n)) on a sorted list and linear search (O(n)).
+"""
+
+
+def binary_search(sorted_list, target, low=0, high=None, trace=None):
+    """
+    Perform binary search on a sorted list to find a target value.
+
+    Uses the divide-and-conquer approach by repeatedly halving the search space,
+    resulting in O(log n) time complexity.
+
+    Args:
+        sorted_list: A list sorted in ascending order.
+        target: The value to search for.
+        low: First index of the search interval (defaults to the start).
+        high: Last index of the search interval, inclusive (defaults to the end).
+        trace: Optional `SearchTrace` that records (low, high, mid, comparison)
+            for every step; None (the default) records nothing.
+
+    Returns:
+        A tuple of (index, steps) where:
+            - index: Position of target in list, or -1 if not found.
+            - steps: Number of iterations performed.
+    """
+    if high is None:
+        high = len(sorted_list) - 1
+    steps = 0
+
+    while low <= high:
+        # Use integer division to find the midpoint, avoiding overflow
+        mid = (low + high) // 2
+        mid_value = sorted_list[mid]
+        steps += 1
+        if trace is not None:
+            trace.record(low, high, mid, (target > mid_value) - (target < mid_value))
+
+        if mid_value == target:
+            return mid, steps
+        elif target > mid_value:
+            # Target is in the upper half; discard lower half
+            low = mid + 1
+        else:
+            # Target is in the lower half; discard upper half
+            high = mid - 1
+
+    return -1, steps
+
+
+def linear_search(sorted_list, target):
+    """
+    Perform linear search by checking each element sequentially.
+
+    This O(n) algorithm serves as a baseline for comparing against binary search.
+
+    Args:
+        sorted_list: A list to search through (sorting not required).
+        target: The value to search for.
+
+    Returns:
+        A tuple of (index, steps) where:
+            - index: Position of target in list, or -1 if not found.
+            - steps: Number of elements examined.
+    """
+    steps = 0
+    for index, value in enumerate(sorted_list):
+        steps += 1
+        if value == target:
+            return index, steps
+    return -1, steps
+
+
+def test_binary_search():
+    """
+    Run unit tests to verify binary_search correctness.
+
+    Tests cover edge cases: empty list, target at boundaries,
+    absent target, and duplicate values.
+    """
+    # Access [0] because binary_search returns (index, steps) tuple
+
+    # Test empty list
+    assert binary_search([], 5)[0] == -1
+
+    # Test target at the beginning
+    assert binary_search([1, 2, 3, 4, 5], 1)[0] == 0
+
+    # Test target at the end
+    assert binary_search([1, 2, 3, 4, 5], 5)[0] == 4
+
+    # Test target absent
+    assert binary_search([1, 2, 3, 4, 5], 6)[0] == -1
+
+    # With duplicates, any valid index containing the target is acceptable
+    assert binary_search([1, 2, 2, 2, 3], 2)[0] in [1, 2, 3]
+
+    print("All tests passed.")
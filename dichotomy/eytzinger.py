@@ -0,0 +1,248 @@
+"""
+Eytzinger Layout Search Module.
+
+This module rearranges a sorted array of 64-bit integer keys into Eytzinger
+(BFS, heap-like) order: the root at position 1 and the children of node k at
+2k and 2k + 1. The first levels of the tree then share a few cache lines, and
+each probe's two possible successors are adjacent in memory, unlike the
+scattered midpoints of the classic low/high/mid loop.
+"""
+import random
+import timeit
+from array import array
+from collections.abc import Sequence
+
+from .benchmark import measure_batch
+from .core import binary_search
+
+
+class EytzingerIndex:
+    """
+    Search index over sorted int64 keys stored in Eytzinger order.
+
+    Lookups return positions in the original sorted sequence, so results are
+    interchangeable with `binary_search`.
+    """
+
+    def __init__(self, sorted_keys: Sequence[int]) -> None:
+        """
+        Args:
+            sorted_keys: Integer keys sorted in ascending order. Any sequence
+                is accepted (list, ArithmeticRange, SortedKeyFile, ...); it is
+                read once, front to back.
+        """
+        size = len(sorted_keys)
+        self._size = size
+        # Slot 0 is unused so that the children of node k are 2k and 2k + 1
+        self._layout = array("q", bytes(8 * (size + 1)))
+        self._ranks = array("q", bytes(8 * (size + 1)))
+
+        # Walk the implicit tree in order; the i-th node visited gets the i-th key
+        k = 1
+        while 2 * k <= size:
+            k *= 2
+        for rank, key in enumerate(sorted_keys):
+            self._layout[k] = key
+            self._ranks[k] = rank
+
+            # Move to the in-order successor of node k
+            if 2 * k + 1 <= size:
+                k = 2 * k + 1
+                while 2 * k <= size:
+                    k *= 2
+            else:
+                # Climb while k is a right child, then once more to its parent
+                while k & 1:
+                    k >>= 1
+                k >>= 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def search(self, target: int) -> tuple[int, int]:
+        """
+        Find target by descending the Eytzinger tree.
+
+        The descent never exits early: every lookup walks one root-to-leaf
+        path with a single comparison per level and no data-dependent branch
+        on equality, then recovers the lower-bound node from the path bits.
+
+        Args:
+            target: The value to search for.
+
+        Returns:
+            A tuple of (index, steps) where:
+                - index: Position of target in the original sorted keys (the
+                    first occurrence for duplicates), or -1 if not found.
+                - steps: Number of tree levels probed.
+        """
+        layout = self._layout
+        size = self._size
+        k = 1
+        steps = 0
+
+        while k <= size:
+            steps += 1
+            k = 2 * k + (layout[k] < target)
+
+        # Drop the trailing right turns (and the last left turn) from the path
+        k >>= ((~k) & (k + 1)).bit_length()
+
+        if k and layout[k] == target:
+            return self._ranks[k], steps
+        return -1, steps
+
+    def search_many(self, targets):
+        """
+        Search a batch of targets with NumPy, one tree level at a time.
+
+        Each level gathers the next probe for every target at once, which
+        keeps many independent memory loads in flight the way a prefetching
+        C loop would.
+
+        Args:
+            targets: An array-like of values to search for.
+
+        Returns:
+            A tuple of (indices, steps) NumPy int64 arrays, as `search`.
+        """
+        import numpy as np
+
+        layout = np.frombuffer(self._layout, dtype=np.int64)
+        ranks = np.frombuffer(self._ranks, dtype=np.int64)
+        queries = np.asarray(targets, dtype=np.int64).ravel()
+
+        k = np.ones(queries.size, dtype=np.int64)
+        steps = np.zeros(queries.size, dtype=np.int64)
+        for _ in range(self._size.bit_length()):
+            # Finished descents point past the layout; park their probe on slot 0
+            inside = k <= self._size
+            probe = np.where(inside, k, 0)
+            k = np.where(inside, 2 * k + (layout[probe] < queries), k)
+            steps += inside
+
+        # Drop trailing ones plus one bit; lowest_clear is a power of two
+        lowest_clear = ~k & (k + 1)
+        k >>= np.log2(lowest_clear).astype(np.int64) + 1
+
+        found = (k > 0) & (layout[k] == queries)
+        indices = np.where(found, ranks[k], -1)
+        return indices, steps
+
+
+def test_eytzinger_search():
+    """
+    Run unit tests to verify EytzingerIndex against binary_search semantics.
+
+    Tests cover an empty index, every size of a small incomplete tree,
+    boundaries, absent targets, duplicate values, and batched lookups.
+    """
+    # Test empty index
+    assert EytzingerIndex([]).search(5)[0] == -1
+
+    # Every key, and every gap between keys, for incomplete trees of all shapes
+    for size in range(1, 20):
+        keys = list(range(0, 2 * size, 2))
+        index = EytzingerIndex(keys)
+        for target in range(-1, 2 * size + 1):
+            expected = keys.index(target) if target in keys else -1
+            assert index.search(target)[0] == expected
+
+    # With duplicates, the first occurrence is returned
+    assert EytzingerIndex([1, 2, 2, 2, 3]).search(2)[0] == 1
+
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        # Batched lookups agree with search and binary_search, steps included
+        indices, steps = EytzingerIndex([]).search_many([5, -1])
+        assert indices.tolist() == [-1, -1] and steps.tolist() == [0, 0]
+        for keys in ([7], list(range(0, 38, 2)), [1, 2, 2, 2, 3, 3, 9, 9, 9, 9]):
+            index = EytzingerIndex(keys)
+            targets = list(range(-1, max(keys) + 2))
+            indices, steps = index.search_many(np.array(targets))
+            assert list(zip(indices.tolist(), steps.tolist())) == [index.search(target) for target in targets]
+            for target, found in zip(targets, indices.tolist()):
+                assert (found == -1) == (binary_search(keys, target)[0] == -1)
+                assert found == -1 or found == keys.index(target)
+
+    print("All Eytzinger tests passed.")
+
+
+def eytzinger_comparison(list_sizes=(10 ** 6, 10 ** 7, 10 ** 8), num_searches=1000):
+    """
+    Benchmark Eytzinger-layout search vs classic binary search.
+
+    Both searches run over compact int64 arrays of the same keys, so the
+    difference comes from the memory access pattern, not from storage. With
+    NumPy installed, the batched `search_many` is timed too (per target).
+
+    Args:
+        list_sizes: Key counts to benchmark.
+        num_searches: Number of random lookups per size.
+    """
+    print("=" * 130)
+    print(f"EYTZINGER vs BINARY SEARCH (Average of {num_searches} searches)")
+    print("=" * 130)
+    print(
+        f"{'List Size (N)':<15} {'Build Time(s)':<15} {'Bin. Time(s)':<15}"
+        f" {'Bin. Steps':<15} {'Eytz. Time(s)':<15} {'Eytz. Steps':<15} {'Batch Time(s)':<15} {'Speedup'}")
+    print("-" * 130)
+
+    for size in list_sizes:
+        sorted_keys = array("q", range(size))
+
+        start_time = timeit.default_timer()
+        index = EytzingerIndex(sorted_keys)
+        build_time = timeit.default_timer() - start_time
+
+        targets = [random.randint(0, size - 1) for _ in range(num_searches)]
+
+        total_binary_time = 0
+        total_eytzinger_time = 0
+        total_binary_steps = 0
+        total_eytzinger_steps = 0
+
+        for target in targets:
+            # Time Binary Search
+            start_time = timeit.default_timer()
+            _, steps = binary_search(sorted_keys, target)
+            total_binary_time += timeit.default_timer() - start_time
+            total_binary_steps += steps
+
+            # Time Eytzinger Search
+            start_time = timeit.default_timer()
+            _, steps = index.search(target)
+            total_eytzinger_time += timeit.default_timer() - start_time
+            total_eytzinger_steps += steps
+
+        batch_time = "-"
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            batch = measure_batch(EytzingerIndex.search_many, index, np.array(targets), "eytzinger_batch",
+                                  max_time=0.5)
+            batch_time = f"{batch.median:.3g}"
+
+        avg_binary_time = total_binary_time / num_searches
+        avg_eytzinger_time = total_eytzinger_time / num_searches
+        speedup = (avg_binary_time / avg_eytzinger_time) if avg_eytzinger_time > 0 else float('inf')
+
+        print(
+            f"{size:<15,d} {build_time:<15.3f} {avg_binary_time:<15.6f}"
+            f" {total_binary_steps / num_searches:<15.1f} {avg_eytzinger_time:<15.6f}"
+            f" {total_eytzinger_steps / num_searches:<15.1f} {batch_time:<15} {speedup:.2f}x")
+
+        # Release the large arrays before building the next size
+        del sorted_keys, index
+
+    print("=" * 130)
+
+
+if __name__ == "__main__":
+    test_eytzinger_search()
+    eytzinger_comparison()
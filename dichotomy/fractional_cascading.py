@@ -0,0 +1,335 @@
+"""
+Fractional Cascading Module.
+
+This module finds one target in each of k sorted lists with a single binary
+search. `FractionalCascade` builds augmented lists M_0..M_(k-1) from the
+bottom up: M_(k-1) is the last list, and M_i merges list i with every
+other element of M_(i+1). Each element of M_i stores its lower bound in
+list i and in M_(i+1). A query therefore runs `lower_bound` on M_0 only,
+then follows the bridge to the next level. There, at most one element lies
+between the bridge and the true lower bound, so each further list costs at
+most two comparisons: O(log n + k) in total instead of O(k log n).
+
+The augmented lists take at most twice the total number of keys.
+"""
+import random
+from array import array
+from bisect import bisect_left
+from heapq import merge
+
+from .benchmark import measure_batch
+from .bounds import lower_bound
+from .core import binary_search
+from .merge_join import is_sorted
+
+
+class FractionalCascade:
+    """
+    Search structure answering "position of target in every list" at once.
+
+    The lists are referenced, not copied, and must not change after the
+    structure is built.
+    """
+
+    def __init__(self, lists):
+        """
+        Args:
+            lists: Sequence of sorted lists (any sequences of comparable
+                values, duplicates allowed).
+
+        Raises:
+            ValueError: If one of the lists is not sorted.
+        """
+        self.lists = list(lists)
+        for number, values in enumerate(self.lists):
+            if not is_sorted(values):
+                raise ValueError(f"list {number} is not sorted")
+
+        levels = len(self.lists)
+        self._merged = [None] * levels
+        # _own[i][j]: lower bound of M_i[j] in list i
+        # _bridges[i][j]: lower bound of M_i[j] in M_(i+1); both arrays have a
+        # trailing entry for the position past the end of M_i
+        self._own = [None] * levels
+        self._bridges = [None] * levels
+        self._arrays = None
+
+        below = []
+        for level in reversed(range(levels)):
+            values = self.lists[level]
+            merged = list(merge(values, below[1::2]))
+            own = array("q")
+            bridges = array("q")
+
+            # One forward sweep finds every lower bound in both lists
+            in_values = 0
+            in_below = 0
+            for value in merged:
+                while in_values < len(values) and values[in_values] < value:
+                    in_values += 1
+                while in_below < len(below) and below[in_below] < value:
+                    in_below += 1
+                own.append(in_values)
+                bridges.append(in_below)
+            own.append(len(values))
+            bridges.append(len(below))
+
+            self._merged[level] = merged
+            self._own[level] = own
+            self._bridges[level] = bridges
+            below = merged
+
+    def __len__(self):
+        return len(self.lists)
+
+    @property
+    def augmented_size(self):
+        """Total number of elements in the augmented lists."""
+        return sum(len(merged) for merged in self._merged)
+
+    def lower_bounds(self, target):
+        """
+        Find the first position >= target in every list.
+
+        Returns:
+            A tuple of (positions, steps) lists, one entry per list, where
+            steps counts the comparisons spent on that list: about log2 of
+            the augmented size for the first list and at most two for the
+            others.
+        """
+        if not self._merged:
+            return [], []
+        return self._cascade(target, *lower_bound(self._merged[0], target))
+
+    def _cascade(self, target, position, first_steps):
+        """Follow the bridges down from target's lower bound in M_0."""
+        positions = [self._own[0][position]]
+        steps = [first_steps]
+
+        for level in range(1, len(self._merged)):
+            merged = self._merged[level]
+            position = self._bridges[level - 1][position]
+            level_steps = 0
+            # Walk back over the (at most one) element between the bridge
+            # and the lower bound of target
+            while position > 0:
+                level_steps += 1
+                if merged[position - 1] < target:
+                    break
+                position -= 1
+            positions.append(self._own[level][position])
+            steps.append(level_steps)
+
+        return positions, steps
+
+    def _results(self, target, positions, steps):
+        """Turn lower bounds into (index, steps) tuples, -1 where absent."""
+        results = []
+        for values, position, level_steps in zip(self.lists, positions, steps):
+            found = position < len(values) and values[position] == target
+            results.append((position if found else -1, level_steps))
+        return results
+
+    def search(self, target):
+        """
+        Look target up in every list.
+
+        Args:
+            target: The value to search for.
+
+        Returns:
+            A list with one (index, steps) tuple per list, where:
+                - index: First position of the target in that list, or -1 if not found.
+                - steps: Comparisons spent on that list (see `lower_bounds`).
+        """
+        return self._results(target, *self.lower_bounds(target))
+
+    def search_many(self, targets):
+        """
+        Look a batch of targets up in every list.
+
+        With NumPy installed and numeric keys, every level is processed for
+        the whole batch at once. Otherwise targets are searched one by one,
+        in ascending order so that each first-level search starts where the
+        previous one ended. Both give the same indices as `search`; the
+        sequential path counts the steps of these shorter first-list
+        searches.
+
+        Args:
+            targets: The values to search for.
+
+        Returns:
+            A tuple of (indices, steps), each a list with one list per
+            target holding one entry per list.
+        """
+        if self._merged and len(targets):
+            arrays = self._numpy_arrays()
+            if arrays is not None:
+                return self._search_many_vectorized(arrays, targets)
+
+        indices = [[] for _ in targets]
+        steps = [[] for _ in targets]
+        if not self._merged:
+            return indices, steps
+
+        low = 0
+        for number in sorted(range(len(targets)), key=targets.__getitem__):
+            target = targets[number]
+            # Ascending targets have ascending lower bounds in M_0
+            low, first_steps = lower_bound(self._merged[0], target, low)
+            results = self._results(target, *self._cascade(target, low, first_steps))
+            indices[number] = [index for index, _ in results]
+            steps[number] = [level_steps for _, level_steps in results]
+        return indices, steps
+
+    def _numpy_arrays(self):
+        """Return the levels as NumPy arrays, or None if unavailable."""
+        if self._arrays is None:
+            try:
+                import numpy as np
+            except ImportError:
+                self._arrays = False
+                return None
+            merged = [np.asarray(values) for values in self._merged]
+            lists = [np.asarray(values) for values in self.lists]
+            if any(values.dtype.kind not in "iuf" for values in merged + lists):
+                self._arrays = False
+                return None
+            own = [np.frombuffer(positions, dtype=np.int64) for positions in self._own]
+            bridges = [np.frombuffer(positions, dtype=np.int64) for positions in self._bridges]
+            self._arrays = (np, merged, lists, own, bridges)
+        return self._arrays or None
+
+    def _search_many_vectorized(self, arrays, targets):
+        """NumPy version of `search_many`: one pass per level for the batch."""
+        from .batch_search import lower_bound_many
+
+        np, merged, lists, own, bridges = arrays
+        queries = np.asarray(targets).ravel()
+        levels = len(merged)
+        indices = np.empty((queries.size, levels), dtype=np.int64)
+        steps = np.zeros((queries.size, levels), dtype=np.int64)
+
+        position, steps[:, 0] = lower_bound_many(merged[0], queries)
+        for level in range(levels):
+            if level:
+                position = bridges[level - 1][position]
+                # Same walk back as lower_bounds, for the whole batch
+                walking = np.ones(queries.size, dtype=bool)
+                for _ in range(2):
+                    walking &= position > 0
+                    steps[walking, level] += 1
+                    previous = merged[level][np.maximum(position - 1, 0)]
+                    walking &= previous >= queries
+                    position = position - walking
+            found_at = own[level][position]
+            values = lists[level]
+            found = found_at < values.size
+            found[found] = values[found_at[found]] == queries[found]
+            indices[:, level] = np.where(found, found_at, -1)
+
+        return indices.tolist(), steps.tolist()
+
+
+def test_fractional_cascade():
+    """
+    Run unit tests to verify the cascade against binary_search.
+
+    Tests cover empty inputs, duplicates, targets beyond both ends, the
+    constant per-list cost, batched lookups with and without NumPy, and
+    rejection of unsorted lists.
+    """
+    lists = [[1, 3, 3, 3, 7, 9], [], [2, 3, 8, 8, 8, 20], [0, 1, 3, 9, 12, 15, 18]]
+    cascade = FractionalCascade(lists)
+    targets = [-1, 0, 1, 2, 3, 7, 8, 9, 15, 20, 25]
+
+    # Test empty structure
+    assert FractionalCascade([]).search(5) == [] and FractionalCascade([]).search_many([5]) == ([[]], [[]])
+
+    for target in targets:
+        positions, steps = cascade.lower_bounds(target)
+        assert positions == [bisect_left(values, target) for values in lists]
+        assert all(level_steps <= 2 for level_steps in steps[1:])
+        indices = [index for index, _ in cascade.search(target)]
+        assert indices == [bisect_left(values, target) if target in values else -1 for values in lists]
+
+    # Agreement with binary_search on random lists, with and without NumPy
+    lists = [sorted(random.randrange(1000) for _ in range(random.randrange(300))) for _ in range(12)]
+    cascade = FractionalCascade(lists)
+    assert cascade.augmented_size <= 2 * sum(len(values) for values in lists)
+    targets = [random.randrange(-10, 1010) for _ in range(200)]
+    for target in targets:
+        for values, (index, _) in zip(lists, cascade.search(target)):
+            assert (index == -1) == (binary_search(values, target)[0] == -1)
+            assert index == -1 or (values[index] == target and bisect_left(values, target) == index)
+
+    expected = [[index for index, _ in cascade.search(target)] for target in targets]
+    expected_steps = [[steps for _, steps in cascade.search(target)] for target in targets]
+    assert cascade.search_many(targets) == (expected, expected_steps)
+    # Without NumPy, first-level searches resume from the previous target
+    cascade._arrays = False
+    indices, steps = cascade.search_many(targets)
+    assert indices == expected
+    assert [level_steps[1:] for level_steps in steps] == [level[1:] for level in expected_steps]
+
+    try:
+        FractionalCascade([[1, 2], [3, 1]])
+        raise AssertionError("Expected ValueError for an unsorted list")
+    except ValueError:
+        pass
+
+    print("All fractional cascading tests passed.")
+
+
+def fractional_cascade_comparison(list_sizes=(10 ** 3, 10 ** 5), list_counts=(4, 16, 64), num_targets=1000):
+    """
+    Benchmark k binary searches per target against one cascaded search.
+
+    Args:
+        list_sizes: Keys per list.
+        list_counts: Numbers of lists (k).
+        num_targets: Random targets per measurement.
+    """
+    print("=" * 120)
+    print("FRACTIONAL CASCADING vs ONE BINARY SEARCH PER LIST (median time per target)")
+    print("=" * 120)
+    print(
+        f"{'N per list':<12} {'Lists (k)':<10} {'Loop Time(s)':<15} {'Loop Steps':<12}"
+        f" {'Cascade Time(s)':<17} {'Steps':<10} {'Batch Time(s)':<15} {'Speedup'}")
+    print("-" * 120)
+
+    def search_loop(lists, batch):
+        results = [[binary_search(values, target) for values in lists] for target in batch]
+        return None, [sum(steps for _, steps in result) for result in results]
+
+    def search_cascade(cascade, batch):
+        results = [cascade.search(target) for target in batch]
+        return None, [sum(steps for _, steps in result) for result in results]
+
+    def search_batched(cascade, batch):
+        _, steps = cascade.search_many(batch)
+        return None, [sum(level_steps) for level_steps in steps]
+
+    for list_size in list_sizes:
+        for list_count in list_counts:
+            # Shards with interleaved keys, like one list per time bucket
+            lists = [sorted(random.sample(range(list_size * list_count * 4), list_size))
+                     for _ in range(list_count)]
+            cascade = FractionalCascade(lists)
+            targets = [random.randrange(list_size * list_count * 4) for _ in range(num_targets)]
+
+            loop = measure_batch(search_loop, lists, targets, "binary_loop", max_time=0.5)
+            cascaded = measure_batch(search_cascade, cascade, targets, "cascade", max_time=0.5)
+            batched = measure_batch(search_batched, cascade, targets, "cascade_batch", max_time=0.5)
+            speedup = (loop.median / cascaded.median) if cascaded.median > 0 else float('inf')
+
+            print(
+                f"{list_size:<12,d} {list_count:<10d} {loop.median:<15.3g} {loop.steps:<12.1f}"
+                f" {cascaded.median:<17.3g} {cascaded.steps:<10.1f} {batched.median:<15.3g} {speedup:.2f}x")
+
+    print("=" * 120)
+
+
+if __name__ == "__main__":
+    test_fractional_cascade()
+    fractional_cascade_comparison()
@@ -0,0 +1,70 @@
+"""
+Import Time Guard Module.
+
+This module measures what `import dichotomy` costs in a fresh interpreter and
+checks that it stays within a time budget and loads none of the heavy modules,
+so the package remains usable as a library.
+"""
+import json
+import os
+import subprocess
+import sys
+
+# Modules that only the features needing them may load
+HEAVY_MODULES = ("numpy", "multiprocessing", "concurrent.futures", "tracemalloc")
+
+# Runs in the child interpreter; prints the import time and the heavy modules loaded
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [name for name in {heavy!r} if name in sys.modules]]))
+"""
+
+
+def measure_import_time(module="dichotomy", repeats=5):
+    """
+    Time `import module` in fresh interpreters.
+
+    Args:
+        module: Dotted module name to import.
+        repeats: Number of fresh interpreters to start.
+
+    Returns:
+        A tuple of (median_seconds, heavy_modules) where heavy_modules lists
+        the modules of HEAVY_MODULES that the import loaded.
+    """
+    # Run from the directory containing the package, whatever the caller's cwd
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+
+    times = []
+    heavy = set()
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, "-c", code], cwd=root, check=True,
+                                capture_output=True, text=True).stdout
+        elapsed, loaded = json.loads(output)
+        times.append(elapsed)
+        heavy.update(loaded)
+
+    times.sort()
+    return times[len(times) // 2], sorted(heavy)
+
+
+def test_import_time(budget=0.05):
+    """
+    Check that importing the package is cheap and side-effect free.
+
+    Args:
+        budget: Maximum median import time, in seconds.
+    """
+    elapsed, heavy = measure_import_time()
+    assert not heavy, f"import dichotomy loaded heavy modules: {heavy}"
+    assert elapsed < budget, f"import dichotomy took {elapsed:.4f}s (budget {budget}s)"
+
+    print(f"Import time test passed ({elapsed * 1000:.2f} ms).")
+
+
+if __name__ == "__main__":
+    test_import_time()
@@ -0,0 +1,403 @@
+"""
+Search Instrumentation Module.
+
+This module measures what search functions actually do on real traffic,
+without editing them: `SearchInstrument` wraps any function with the
+`binary_search` signature and records, per call,
+
+    - the latency, in a log2 histogram of nanoseconds (the median and p99
+      come from the last LATENCY_SAMPLES calls, so memory stays bounded);
+    - the returned step count, in a histogram next to the log2(N) expectation;
+    - optionally, every position the search read and every comparison it
+      made, by handing it a recording view of the list.
+
+Reading positions through the view shows how far apart consecutive probes
+land: probes more than a cache line (or page) from the previous one are the
+cache misses that make binary search slower than its step count suggests.
+
+A disabled instrument calls the wrapped function straight away, and
+`instrument_strategies` only swaps the registry entries for the duration of
+a `with` block, so code that is not being observed pays nothing.
+"""
+import json
+import random
+import time
+from collections import Counter, deque
+from collections.abc import Sequence
+from contextlib import contextmanager
+
+from .benchmark import percentile
+
+# Distances, in 8-byte keys, beyond which a probe leaves the previous
+# probe's cache line (64 bytes) or page (4 KiB)
+CACHE_LINE_KEYS = 8
+PAGE_KEYS = 512
+# Number of equal-width bins of the probe position histogram
+POSITION_BINS = 16
+# Latencies kept for the percentiles; older calls only stay in the histogram
+LATENCY_SAMPLES = 4096
+
+# Comparisons made against _CountedKey values since the last reset; a list so
+# the class can update it in place (not thread-safe, like the instruments)
+_comparisons = [0]
+
+
+class _CountedKey(int):
+    """An int that counts every comparison it takes part in."""
+
+    def __eq__(self, other):
+        _comparisons[0] += 1
+        return int.__eq__(self, other)
+
+    def __ne__(self, other):
+        _comparisons[0] += 1
+        return int.__ne__(self, other)
+
+    def __lt__(self, other):
+        _comparisons[0] += 1
+        return int.__lt__(self, other)
+
+    def __le__(self, other):
+        _comparisons[0] += 1
+        return int.__le__(self, other)
+
+    def __gt__(self, other):
+        _comparisons[0] += 1
+        return int.__gt__(self, other)
+
+    def __ge__(self, other):
+        _comparisons[0] += 1
+        return int.__ge__(self, other)
+
+    __hash__ = int.__hash__
+
+
+class ProbeRecorder(Sequence):
+    """
+    Sequence view that records every position read through it.
+
+    Integer keys are returned as counting ints, so the comparisons the search
+    makes against them are counted too (Python calls the subclass's reflected
+    comparison even for `target > key`).
+    """
+
+    def __init__(self, values):
+        self.values = values
+        self.positions = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        value = self.values[index]
+        if isinstance(index, slice):
+            return value
+        self.positions.append(index if index >= 0 else index + len(self.values))
+        return _CountedKey(value) if type(value) is int else value
+
+
+class SearchInstrument:
+    """
+    Recording wrapper around one search function.
+
+    Call it exactly like the wrapped function; it returns the same result.
+    """
+
+    def __init__(self, search, name=None, record_probes=False, enabled=True):
+        """
+        Args:
+            search: Function(sorted_list, target, ...) returning (index, steps).
+            name: Name used in reports (defaults to the function's name).
+            record_probes: If True, also record probe positions and count
+                comparisons. This slows every call, so latencies measured
+                with it are only comparable with each other.
+            enabled: If False, calls go straight to search until enabled.
+        """
+        self.search = search
+        self.name = name or getattr(search, "__name__", "search")
+        self.record_probes = record_probes
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        self.calls = 0
+        self.latency_total = 0
+        # Bucket b counts latencies in [2^(b-1), 2^b) nanoseconds
+        self.latency_buckets = Counter()
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.steps = Counter()
+        self.sizes = Counter()
+        self.probes = 0
+        self.comparisons = 0
+        self.near_probes = 0
+        self.far_probes = 0
+        self.page_probes = 0
+        self.positions = Counter()
+
+    def __call__(self, sorted_list, target, *args, **kwargs):
+        if not self.enabled:
+            # Skip re-spreading empty extras on the common two-argument call
+            if args or kwargs:
+                return self.search(sorted_list, target, *args, **kwargs)
+            return self.search(sorted_list, target)
+
+        size = len(sorted_list)
+        if self.record_probes:
+            recorder = ProbeRecorder(sorted_list)
+            comparisons_before = _comparisons[0]
+            start = time.perf_counter_ns()
+            result = self.search(recorder, target, *args, **kwargs)
+            elapsed = time.perf_counter_ns() - start
+            self.comparisons += _comparisons[0] - comparisons_before
+            self._record_positions(recorder.positions, size)
+        else:
+            start = time.perf_counter_ns()
+            result = self.search(sorted_list, target, *args, **kwargs)
+            elapsed = time.perf_counter_ns() - start
+
+        self.calls += 1
+        self.latency_total += elapsed
+        self.latency_buckets[elapsed.bit_length()] += 1
+        self.latencies.append(elapsed)
+        self.sizes[size] += 1
+        if isinstance(result, tuple) and len(result) == 2:
+            self.steps[result[1]] += 1
+        return result
+
+    def _record_positions(self, positions, size):
+        """Accumulate the probe count, distances and position bins of one call."""
+        self.probes += len(positions)
+        previous = None
+        for position in positions:
+            self.positions[position * POSITION_BINS // max(size, 1)] += 1
+            if previous is not None:
+                distance = abs(position - previous)
+                if distance >= PAGE_KEYS:
+                    self.page_probes += 1
+                if distance >= CACHE_LINE_KEYS:
+                    self.far_probes += 1
+                else:
+                    self.near_probes += 1
+            previous = position
+
+    def summary(self):
+        """
+        Return everything recorded as a JSON-serializable dictionary.
+
+        steps.expected_log2n is the mean of floor(log2(N)) + 1 over the calls, the
+        worst case of binary search on each call's list size. The latency mean
+        and histogram cover every call; the median and p99 cover the last
+        LATENCY_SAMPLES calls.
+        """
+        latencies = sorted(self.latencies)
+        calls = max(self.calls, 1)
+        expected = sum(size.bit_length() * count for size, count in self.sizes.items()) / calls
+        steps_total = sum(steps * count for steps, count in self.steps.items())
+
+        summary = {
+            "name": self.name,
+            "calls": self.calls,
+            "latency_ns": {
+                "median": percentile(latencies, 0.5) if latencies else None,
+                "p99": percentile(latencies, 0.99) if latencies else None,
+                "mean": self.latency_total / calls,
+                "log2_histogram": dict(sorted(self.latency_buckets.items())),
+            },
+            "steps": {
+                "mean": steps_total / calls,
+                "max": max(self.steps, default=0),
+                "expected_log2n": expected,
+                "histogram": dict(sorted(self.steps.items())),
+            },
+        }
+        if self.record_probes:
+            transitions = max(self.near_probes + self.far_probes, 1)
+            summary["probes"] = {
+                "mean": self.probes / calls,
+                "comparisons_mean": self.comparisons / calls,
+                "far_share": self.far_probes / transitions,
+                "page_share": self.page_probes / transitions,
+                "position_histogram": dict(sorted(self.positions.items())),
+            }
+        return summary
+
+
+@contextmanager
+def instrument_strategies(names=None, record_probes=False):
+    """
+    Temporarily replace registered strategies with instruments.
+
+    Code that looks strategies up in `STRATEGIES` (such as
+    `strategy_comparison`) is observed for the duration of the block.
+
+    Args:
+        names: Strategy names to instrument (defaults to all).
+        record_probes: Passed to every SearchInstrument.
+
+    Yields:
+        A dict of name -> SearchInstrument.
+    """
+    from .search_strategies import STRATEGIES
+
+    originals = {name: STRATEGIES[name] for name in (names or list(STRATEGIES))}
+    instruments = {name: SearchInstrument(search, name, record_probes) for name, search in originals.items()}
+    STRATEGIES.update(instruments)
+    try:
+        yield instruments
+    finally:
+        STRATEGIES.update(originals)
+
+
+def write_instrument_json(path, instruments, metadata=None):
+    """
+    Write the summaries of several instruments to a JSON file.
+
+    Args:
+        path: Destination file path.
+        instruments: Iterable of SearchInstrument.
+        metadata: Optional dictionary stored next to the summaries.
+    """
+    document = {
+        "metadata": metadata or {},
+        "instruments": [instrument.summary() for instrument in instruments],
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+
+
+def render_instruments(instruments):
+    """
+    Render a text summary of several instruments, one row each.
+
+    Returns:
+        The table as a string.
+    """
+    width = 125
+    lines = [
+        "=" * width,
+        "SEARCH INSTRUMENTATION (per call)",
+        "=" * width,
+        f"{'Search':<16} {'Calls':<9} {'Median(ns)':<12} {'p99(ns)':<12} {'Steps':<8}"
+        f" {'log2(N)':<9} {'Max Steps':<11} {'Probes':<8} {'Compares':<10} {'Far':<8} {'Page'}",
+        "-" * width,
+    ]
+
+    for instrument in instruments:
+        summary = instrument.summary()
+        latency = summary["latency_ns"]
+        steps = summary["steps"]
+        probes = summary.get("probes")
+        probe_columns = "-        -          -        -"
+        if probes is not None:
+            probe_columns = (
+                f"{probes['mean']:<8.1f} {probes['comparisons_mean']:<10.1f}"
+                f" {probes['far_share']:<8.0%} {probes['page_share']:.0%}")
+        lines.append(
+            f"{summary['name']:<16} {summary['calls']:<9,d} {latency['median'] or 0:<12,.0f}"
+            f" {latency['p99'] or 0:<12,.0f} {steps['mean']:<8.1f} {steps['expected_log2n']:<9.1f}"
+            f" {steps['max']:<11d} {probe_columns}")
+
+    lines.append("=" * width)
+    return "\n".join(lines)
+
+
+def test_instrumentation():
+    """
+    Run unit tests to verify the instruments.
+
+    Tests cover unchanged results, step and probe recording, exact
+    comparison counts, bounded latency samples, disabled instruments, strategy swapping and the
+    JSON and text exporters.
+    """
+    import os
+    import tempfile
+
+    from .core import binary_search
+    from .search_strategies import STRATEGIES
+
+    values = list(range(0, 200, 2))
+    instrument = SearchInstrument(binary_search, record_probes=True)
+
+    # Results are unchanged and every probe is recorded
+    assert instrument(values, 100) == binary_search(values, 100)
+    assert instrument.calls == 1 and instrument.probes == binary_search(values, 100)[1]
+    assert instrument.steps == Counter({binary_search(values, 100)[1]: 1})
+
+    # An absent target makes two comparisons per step (== then >)
+    instrument.reset()
+    _, steps = instrument(values, 101)
+    assert instrument.comparisons == 2 * steps and instrument.probes == steps
+
+    # Latencies stay bounded; the histogram still counts every call
+    timed = SearchInstrument(binary_search)
+    for target in range(LATENCY_SAMPLES + 10):
+        timed(values, target % 200)
+    assert len(timed.latencies) == LATENCY_SAMPLES
+    latency = timed.summary()["latency_ns"]
+    assert sum(latency["log2_histogram"].values()) == timed.calls == LATENCY_SAMPLES + 10
+    assert latency["median"] <= latency["p99"]
+
+    # Disabled instruments record nothing
+    instrument.enabled = False
+    assert instrument(values, 4) == (2, binary_search(values, 4)[1]) and instrument.calls == 1
+
+    # Strategies are swapped only inside the block
+    original = STRATEGIES["binary"]
+    with instrument_strategies(["binary"], record_probes=True) as instruments:
+        assert STRATEGIES["binary"] is instruments["binary"]
+        STRATEGIES["binary"](values, 50)
+    assert STRATEGIES["binary"] is original and instruments["binary"].calls == 1
+
+    summary = instruments["binary"].summary()
+    assert summary["steps"]["expected_log2n"] == len(values).bit_length()
+    assert sum(summary["probes"]["position_histogram"].values()) == summary["probes"]["mean"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "instruments.json")
+        write_instrument_json(path, instruments.values(), {"list_size": len(values)})
+        with open(path) as file:
+            assert json.load(file)["instruments"][0]["name"] == "binary"
+    assert "binary" in render_instruments(instruments.values())
+
+    print("All instrumentation tests passed.")
+
+
+def instrumentation_report(list_size=10 ** 6, num_searches=2000, json_path=None):
+    """
+    Instrument every registered strategy on random lookups and print the report.
+
+    Also times binary search bare, through a disabled instrument, and
+    through an enabled one without probes, to show the wrapper overhead.
+
+    Args:
+        list_size: Size of the searched list.
+        num_searches: Random lookups per strategy.
+        json_path: If given, also write the summaries there as JSON.
+    """
+    from .core import binary_search
+
+    sorted_list = list(range(0, 2 * list_size, 2))
+    targets = [random.randrange(2 * list_size) for _ in range(num_searches)]
+
+    with instrument_strategies(record_probes=True) as instruments:
+        for search in instruments.values():
+            for target in targets:
+                search(sorted_list, target)
+    print(render_instruments(instruments.values()))
+    if json_path is not None:
+        write_instrument_json(json_path, instruments.values(), {"list_size": list_size})
+
+    disabled = SearchInstrument(binary_search, enabled=False)
+    enabled = SearchInstrument(binary_search)
+    print(f"{'Wrapper overhead':<20} {'Time(s)':<15}")
+    for name, search in (("bare", binary_search), ("disabled", disabled), ("enabled", enabled)):
+        start = time.perf_counter()
+        for target in targets:
+            search(sorted_list, target)
+        print(f"{name:<20} {(time.perf_counter() - start) / num_searches:<15.3g}")
+
+
+if __name__ == "__main__":
+    test_instrumentation()
+    instrumentation_report()
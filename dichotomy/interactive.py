@@ -0,0 +1,370 @@
+"""
+1 : demander target, low et high number
+2 : construire la liste sorted avec pour borne : low and high
+3 : calculer la moyenne de la liste
+4 : faire boucle while pour trouver si le target est dans la 1ʳᵉ moitie ou dans la 2e
+5 : Dans la boucle, si c'est dans la 1ʳᵉ moitie, réduire la borne high jusqu'à mid
+6 : Faire de meme pour cas contraire
+7 : Faire dans la boucle un compteur pour savoir combien de boucle, il a fallu pour trouver le target
+8 : Dans la boucle, si target trouver, finir la boucle en annonçant le nombre target et le total de
+    boucle demander pour le trouver
+9 :
+"""
+
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from itertools import chain
+from typing import BinaryIO
+
+from .lazy_range import ArithmeticRange
+from .sorted_file import SortedKeyFile
+
+# Targets read, searched and written per chunk in batch mode, so memory does
+# not grow with the length of the input
+BATCH_CHUNK = 1 << 14
+
+
+def read_int(prompt: str) -> int:
+    """Read an integer from the user."""
+    return int(input(prompt))
+
+
+def get_search_params() -> tuple[int, int, int]:
+    """Ask for target, low, and high."""
+    target = read_int("Give a target number: ")
+    low = read_int("Give a lower number: ")
+    high = read_int("Give a higher number: ")
+
+    if low > high:
+        low, high = high, low  # normalize bounds
+
+    return target, low, high
+
+
+def build_sorted_range(low: int, high: int) -> ArithmeticRange:
+    """Construct the lazy sorted range with bounds low and high (inclusive)."""
+    return ArithmeticRange(low, high + 1)
+
+
+def binary_search_steps(values: Sequence[int], target: int) -> tuple[bool, int, int]:
+    """
+    Binary search in a sorted list.
+    Returns: (found, index, steps). index is -1 when not found.
+    """
+    left = 0
+    right = len(values) - 1
+    steps = 0
+
+    while left <= right:
+        steps += 1
+        mid = (left + right) // 2
+        mid_value = values[mid]
+
+        if mid_value == target:
+            return True, mid, steps
+        if target > mid_value:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+    return False, -1, steps
+
+
+def read_targets(source: BinaryIO, binary: bool = False,
+                 chunk_size: int = BATCH_CHUNK) -> Iterator[Sequence[int]]:
+    """
+    Yield the targets of a stream in chunks of about chunk_size.
+
+    Text input holds one integer per line (blank lines are skipped); binary
+    input is a flat sequence of little-endian int64 values.
+
+    Raises:
+        ValueError: On a line that is not an integer, or a truncated
+            binary value.
+    """
+    if binary:
+        while True:
+            data = source.read(chunk_size * 8)
+            if not data:
+                return
+            if len(data) % 8:
+                # A short read is only an error at the real end of the stream
+                rest = source.read(8 - len(data) % 8)
+                if len(rest) != 8 - len(data) % 8:
+                    raise ValueError("binary input ends with a partial int64 value")
+                data += rest
+            chunk = array("q", data)
+            if sys.byteorder == "big":
+                chunk.byteswap()
+            yield chunk
+
+    # readlines(hint) stops after about hint bytes; ~8 bytes per line
+    while True:
+        lines = source.readlines(chunk_size * 8)
+        if not lines:
+            return
+        # int() accepts bytes with surrounding whitespace, so no decoding
+        yield [int(line) for line in lines if not line.isspace()]
+
+
+def batch_searcher(values: Sequence[int]):
+    """
+    Build a function that searches a whole chunk of targets in values.
+
+    With NumPy installed, ranges are searched by `ArithmeticRange.find_many`
+    from their formula, in O(1) memory whatever their length, and key files,
+    SortedIntArrays and lists by the vectorized `binary_search_many`.
+    Without NumPy, or for a range whose values do not fit in int64, each
+    target takes one `binary_search_steps` call. All paths give the same
+    indices and steps.
+
+    Returns:
+        A function(targets) returning (indices, steps) lists. On the
+        vectorized path it raises ValueError for targets outside int64.
+    """
+    try:
+        import numpy as np
+
+        from .batch_search import binary_search_many
+    except ImportError:
+        np = None
+
+    if np is not None and isinstance(values, ArithmeticRange):
+        try:
+            # Fails up front if the range itself cannot be searched in int64
+            values.find_many([], count_steps=True)
+        except OverflowError:
+            np = None
+
+    if np is not None:
+        if isinstance(values, ArithmeticRange):
+            def search_many(queries):
+                return values.find_many(queries, count_steps=True)
+        else:
+            keys = np.asarray(values)
+
+            def search_many(queries):
+                return binary_search_many(keys, queries)
+
+        def search_chunk(targets):
+            try:
+                queries = np.asarray(targets, dtype=np.int64)
+            except OverflowError:
+                raise ValueError("targets must fit in a signed 64-bit integer") from None
+            indices, steps = search_many(queries)
+            return indices.tolist(), steps.tolist()
+
+        return search_chunk
+
+    def search_chunk(targets):
+        results = [binary_search_steps(values, target) for target in targets]
+        return [index for _, index, _ in results], [steps for _, _, steps in results]
+
+    return search_chunk
+
+
+def stream_search(values: Sequence[int], source: BinaryIO, sink: BinaryIO, binary: bool = False,
+                  chunk_size: int = BATCH_CHUNK) -> int:
+    """
+    Answer every target of a stream and write one result line per target.
+
+    Each output line is "target<TAB>index<TAB>steps", with index -1 for
+    absent targets. Lines are written a chunk at a time through sink, so
+    memory stays bounded whatever the input length.
+
+    Args:
+        values: The sorted keys (range, key file, list, ...).
+        source: Binary stream of targets, see `read_targets`.
+        sink: Binary stream receiving the results.
+        binary: If True, source holds int64 values rather than text lines.
+        chunk_size: Targets per chunk.
+
+    Returns:
+        The number of targets answered.
+    """
+    search_chunk = batch_searcher(values)
+    count = 0
+
+    for targets in read_targets(source, binary, chunk_size):
+        indices, steps = search_chunk(targets)
+        # One %-format over the whole chunk is faster than a format per line
+        fields = tuple(chain.from_iterable(zip(targets, indices, steps)))
+        sink.write((("%d\t%d\t%d\n" * len(targets)) % fields).encode())
+        count += len(targets)
+
+    sink.flush()
+    return count
+
+
+def main(target: int | None = None, low: int | None = None, high: int | None = None,
+         batch: str | None = None, key_file: str | None = None, binary: bool = False) -> None:
+    """
+    Search target in [low, high]; any parameter left out is asked for.
+
+    Args:
+        target: Value to search for (single query mode).
+        low: Lower bound of the range.
+        high: Upper bound of the range.
+        batch: Path of a file of targets, or "-" for stdin, to answer many
+            targets with `stream_search` instead of a single query.
+        key_file: Search this sorted key file instead of [low, high].
+        binary: Batch input holds little-endian int64 values, not text lines.
+
+    Raises:
+        ValueError: In batch mode, if neither key_file nor both low and
+            high are given (stdin carries the targets, so nothing is asked).
+    """
+    if batch is not None:
+        if key_file is None and (low is None or high is None):
+            raise ValueError("batch mode needs a key file or both low and high")
+        source = sys.stdin.buffer if batch == "-" else open(batch, "rb")
+        try:
+            if key_file is not None:
+                with SortedKeyFile(key_file) as values:
+                    stream_search(values, source, sys.stdout.buffer, binary)
+            else:
+                stream_search(build_sorted_range(min(low, high), max(low, high)),
+                              source, sys.stdout.buffer, binary)
+        finally:
+            if source is not sys.stdin.buffer:
+                source.close()
+        return
+
+    if key_file is not None:
+        if target is None:
+            target = read_int("Give a target number: ")
+        with SortedKeyFile(key_file) as values:
+            found, index, steps = binary_search_steps(values, target)
+        if found:
+            print(f"Target {target} found at index {index} in {steps} step(s).")
+        else:
+            print(f"Target {target} not found in {key_file} after {steps} step(s).")
+        return
+
+    if target is None or low is None or high is None:
+        target, low, high = get_search_params()
+    elif low > high:
+        low, high = high, low  # normalize bounds
+
+    values = build_sorted_range(low, high)
+
+    found, index, steps = binary_search_steps(values, target)
+
+    if found:
+        print(f"Target {target} found at index {index} in {steps} step(s).")
+    else:
+        print(f"Target {target} not found in range [{low}, {high}] after {steps} step(s).")
+
+
+def test_stream_search():
+    """
+    Run unit tests to verify batch mode.
+
+    Tests cover text input with blank lines, binary input, a key file,
+    a 2^40-key range and one beyond int64, an empty stream and agreement with
+    `binary_search_steps`.
+    """
+    import io
+    import os
+    import tempfile
+
+    from .sorted_file import write_sorted_file
+
+    def run(values, data, binary=False, chunk_size=3):
+        sink = io.BytesIO()
+        count = stream_search(values, io.BytesIO(data), sink, binary, chunk_size)
+        lines = sink.getvalue().decode().splitlines()
+        assert len(lines) == count
+        return [tuple(map(int, line.split("\t"))) for line in lines]
+
+    values = build_sorted_range(1, 100)
+    targets = [50, 1, 100, 0, 101, 73, -7, 50]
+    expected = [(target,) + binary_search_steps(values, target)[1:] for target in targets]
+
+    # Text and binary input give the same answers as the scalar search
+    text = "\n".join(map(str, targets)).encode() + b"\n\n"
+    assert run(values, text) == expected
+    assert run(values, b"".join(value.to_bytes(8, "little", signed=True) for value in targets),
+               binary=True) == expected
+    assert run(values, b"") == []
+
+    # A range of 2^40 keys is searched from its formula, never built
+    huge = build_sorted_range(-5, 2 ** 40)
+    huge_targets = [-(2 ** 63), -6, -5, 0, 12345678, 2 ** 39, 2 ** 40, 2 ** 40 + 1, 2 ** 63 - 1]
+    assert run(huge, "\n".join(map(str, huge_targets)).encode()) == [
+        (target,) + binary_search_steps(huge, target)[1:] for target in huge_targets]
+
+    # A range beyond int64 falls back to the scalar search
+    wide = ArithmeticRange(-(2 ** 64), 2 ** 64, 16)
+    assert run(wide, b"0\n7\n") == [(target,) + binary_search_steps(wide, target)[1:] for target in (0, 7)]
+
+    # Key files are searched in place
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "keys.bin")
+        write_sorted_file(path, range(1, 101))
+        with SortedKeyFile(path) as keys:
+            assert run(keys, text) == expected
+
+    # Truncated binary input, bad lines and targets outside int64 are rejected
+    for data, binary in ((b"\x01\x02", True), (b"5\nfive\n", False), (b"99999999999999999999\n", False)):
+        try:
+            run(values, data, binary=binary)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"invalid input {data!r} was accepted")
+
+    # A failed stream still lets the key file close under the searcher's view
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "keys.bin")
+        write_sorted_file(path, range(1, 101))
+        try:
+            with SortedKeyFile(path) as keys:
+                run(keys, b"5\nfive\n")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("a bad line was accepted")
+
+    print("All stream search tests passed.")
+
+
+def stream_throughput(num_queries: int = 10 ** 6, high: int = 10 ** 6) -> None:
+    """
+    Measure batch-mode throughput in queries per second, text and binary.
+
+    Args:
+        num_queries: Number of random targets streamed.
+        high: Upper bound of the searched range [1, high].
+    """
+    import io
+    import random
+    import timeit
+
+    values = build_sorted_range(1, high)
+    targets = array("q", (random.randint(0, high + 1) for _ in range(num_queries)))
+    inputs = {
+        "text": ("\n".join(map(str, targets)) + "\n").encode(),
+        "binary": targets.tobytes() if sys.byteorder == "little" else None,
+    }
+
+    print("=" * 80)
+    print(f"BATCH MODE THROUGHPUT ({num_queries:,d} queries, range [1, {high:,d}])")
+    print("=" * 80)
+    print(f"{'Input':<15} {'Time(s)':<15} {'Queries/s'}")
+    print("-" * 80)
+
+    for name, data in inputs.items():
+        if data is None:
+            continue
+        start_time = timeit.default_timer()
+        stream_search(values, io.BytesIO(data), io.BytesIO(), binary=name == "binary")
+        elapsed = timeit.default_timer() - start_time
+        print(f"{name:<15} {elapsed:<15.3f} {num_queries / elapsed:,.0f}")
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
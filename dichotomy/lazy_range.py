@@ -0,0 +1,251 @@
+"""
+Lazy Arithmetic Range Module.
+
+This module provides a sorted sequence for arithmetic progressions that
+computes its elements on demand instead of materializing a list, so searching
+[low, high] costs O(1) memory regardless of the size of the range.
+"""
+from collections.abc import Sequence
+
+
+class ArithmeticRange(Sequence):
+    """
+    Sorted, read-only view of the progression start, start + step, ... < stop.
+
+    Indexing, len() and membership are O(1), so `binary_search` and
+    `binary_search_steps` accept it unchanged in place of a list.
+    """
+
+    __slots__ = ("_range",)
+
+    def __init__(self, start: int, stop: int, step: int = 1) -> None:
+        """
+        Args:
+            start: First value of the progression.
+            stop: Exclusive upper bound, as for range().
+            step: Positive distance between consecutive values.
+
+        Raises:
+            ValueError: If step is not positive (the sequence must be ascending).
+        """
+        if step <= 0:
+            raise ValueError(f"step must be positive for a sorted range, got {step}")
+        self._range = range(start, stop, step)
+
+    @property
+    def start(self) -> int:
+        return self._range.start
+
+    @property
+    def stop(self) -> int:
+        return self._range.stop
+
+    @property
+    def step(self) -> int:
+        return self._range.step
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __getitem__(self, index):
+        value = self._range[index]
+        if isinstance(value, range):
+            # Slices of an ascending progression are ascending progressions
+            return ArithmeticRange(value.start, value.stop, value.step)
+        return value
+
+    def __iter__(self):
+        return iter(self._range)
+
+    def __reversed__(self):
+        return reversed(self._range)
+
+    def __contains__(self, value) -> bool:
+        return value in self._range
+
+    def index(self, value, start: int = 0, stop: int | None = None) -> int:
+        return self._range.index(value, start, len(self._range) if stop is None else stop)
+
+    def count(self, value) -> int:
+        return self._range.count(value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ArithmeticRange):
+            return self._range == other._range
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._range)
+
+    def __repr__(self) -> str:
+        return f"ArithmeticRange({self.start}, {self.stop}, {self.step})"
+
+    def __array__(self, dtype=None, copy=None):
+        # Let NumPy build the array arithmetically instead of iterating
+        import numpy as np
+
+        return np.arange(self.start, self.stop, self.step, dtype=dtype)
+
+    def find(self, target: int, count_steps: bool = False) -> tuple[int, int]:
+        """
+        Locate target directly from the progression's formula.
+
+        Args:
+            target: The value to search for.
+            count_steps: If True, also simulate the low/high/mid loop of
+                `binary_search` (without touching any element) and report its
+                iteration count, so results stay comparable with it.
+
+        Returns:
+            A tuple of (index, steps) where:
+                - index: Position of target in the range, or -1 if not found.
+                - steps: Simulated binary search iterations if count_steps,
+                    otherwise 1 for the single direct computation.
+        """
+        offset = target - self.start
+        if offset % self.step == 0 and 0 <= offset // self.step < len(self._range):
+            index = offset // self.step
+        else:
+            index = -1
+
+        if not count_steps:
+            return index, 1
+        return index, self._simulate_steps(target)
+
+    def find_many(self, targets, count_steps: bool = False):
+        """
+        Locate a batch of int64 targets with NumPy, without building the range.
+
+        Each target is placed at a doubled position (2k for the value at
+        index k, 2k + 1 between indices k and k + 1), so the simulated
+        low/high/mid loop compares indices only and runs for the whole batch
+        at once, the way `binary_search_many` does on real keys.
+
+        Args:
+            targets: An array-like of values that fit in int64.
+            count_steps: As for `find`.
+
+        Returns:
+            A tuple of (indices, steps) NumPy int64 arrays, as `find` per target.
+
+        Raises:
+            OverflowError: If a target, or a value of the range, does not fit
+                in a signed 64-bit integer, or the range has 2^62 values or
+                more (doubled positions would not fit).
+        """
+        import numpy as np
+
+        queries = np.asarray(targets, dtype=np.int64).ravel()
+        size = len(self._range)
+        indices = np.full(queries.size, -1, dtype=np.int64)
+        if size == 0:
+            return indices, np.zeros(queries.size, dtype=np.int64)
+        if size >= 1 << 62:
+            raise OverflowError("ranges of 2^62 values or more cannot be searched in int64")
+        start = np.int64(self.start)
+        last = np.int64(self._range[-1])
+
+        # Offsets from start fit in uint64 even when start - target would not fit in int64
+        inside = (queries >= start) & (queries <= last)
+        offsets = queries[inside].astype(np.uint64) - start.astype(np.uint64)
+        below, remainder = np.divmod(offsets, np.uint64(self.step))
+        below = below.astype(np.int64)
+        hit = remainder == 0
+        inside_indices = indices[inside]
+        inside_indices[hit] = below[hit]
+        indices[inside] = inside_indices
+
+        if not count_steps:
+            return indices, np.ones(queries.size, dtype=np.int64)
+
+        positions = np.where(queries < start, -1, 2 * size - 1)
+        positions[inside] = 2 * below + ~hit
+        return indices, self._simulate_steps_many(np, positions, size)
+
+    @staticmethod
+    def _simulate_steps_many(np, positions, size):
+        """Count `binary_search` iterations for doubled target positions."""
+        low = np.zeros(positions.size, dtype=np.int64)
+        high = np.full(positions.size, size - 1, dtype=np.int64)
+        steps = np.zeros(positions.size, dtype=np.int64)
+        active = np.arange(positions.size)
+
+        while active.size:
+            mid = (low[active] + high[active]) // 2
+            position = positions[active]
+            steps[active] += 1
+
+            found = 2 * mid == position
+            go_right = position > 2 * mid
+            low[active[go_right]] = mid[go_right] + 1
+            go_left = ~found & ~go_right
+            high[active[go_left]] = mid[go_left] - 1
+
+            active = active[~found]
+            active = active[low[active] <= high[active]]
+
+        return steps
+
+    def _simulate_steps(self, target: int) -> int:
+        """Count the iterations `binary_search` would take for target."""
+        start, step = self.start, self.step
+        low = 0
+        high = len(self._range) - 1
+        steps = 0
+
+        while low <= high:
+            mid = (low + high) // 2
+            mid_value = start + mid * step
+            steps += 1
+
+            if mid_value == target:
+                break
+            elif target > mid_value:
+                low = mid + 1
+            else:
+                high = mid - 1
+
+        return steps
+
+
+def test_arithmetic_range():
+    """
+    Run unit tests to verify ArithmeticRange behaves like the equivalent list.
+    """
+    values = ArithmeticRange(3, 20, 4)
+    assert list(values) == [3, 7, 11, 15, 19]
+    assert values[-1] == 19 and len(values) == 5
+    assert list(values[1:4]) == [7, 11, 15]
+
+    # Direct lookup: hits, absent values between elements and outside bounds
+    assert values.find(11)[0] == 2
+    assert values.find(12)[0] == -1
+    assert values.find(23)[0] == -1
+    assert values.find(-1)[0] == -1
+
+    # Simulated steps match binary search on the materialized list
+    assert values.find(19, count_steps=True) == (4, 3)
+    assert ArithmeticRange(0, 0).find(5, count_steps=True) == (-1, 0)
+
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        # Batched lookups agree with find, including around the int64 limits
+        for batch_range in (values, ArithmeticRange(0, 0), ArithmeticRange(-2 ** 63, 2 ** 63 - 1, 2 ** 61 + 1),
+                            ArithmeticRange(-2 ** 62, 2 ** 62 - 7, 3),
+                            ArithmeticRange(-5, 2 ** 40)):
+            targets = [-2 ** 63, -7, -5, -1, 0, 3, 5, 12, 19, 23, 2 ** 39, 2 ** 40 - 1, 2 ** 63 - 1]
+            targets += [batch_range[i] for i in range(0, len(batch_range), max(1, len(batch_range) // 7))]
+            indices, steps = batch_range.find_many(targets, count_steps=True)
+            assert list(zip(indices.tolist(), steps.tolist())) == [
+                batch_range.find(target, count_steps=True) for target in targets], batch_range
+        assert values.find_many(np.array([11, 12]))[0].tolist() == [2, -1]
+        assert values.find_many([11])[1].tolist() == [1]
+
+    print("All range tests passed.")
+
+
+if __name__ == "__main__":
+    test_arithmetic_range()
@@ -0,0 +1,224 @@
+"""
+Learned (Piecewise-Linear) Index Module.
+
+This module models the position of each key in a sorted array with a few
+linear segments whose prediction error is bounded by epsilon. A lookup finds
+its segment among the (few) segment start keys, predicts a position, and runs
+a bounded `binary_search` over the 2 * epsilon + 3 slots around it, so the
+last mile costs about log2(epsilon) steps whatever the array size.
+"""
+import math
+import random
+import sys
+import timeit
+from array import array
+from collections.abc import Sequence
+
+from .core import binary_search
+
+
+class LearnedIndex:
+    """
+    Piecewise-linear position model over a sorted sequence of int64 keys.
+
+    The keys are not copied: the index keeps a reference to the sequence and
+    only adds three small arrays per segment.
+    """
+
+    def __init__(self, sorted_keys: Sequence[int], epsilon: int = 32) -> None:
+        """
+        Build the segments in one pass with the shrinking-cone algorithm.
+
+        Args:
+            sorted_keys: Integer keys sorted in ascending order.
+            epsilon: Maximum distance between a predicted and a true position.
+
+        Raises:
+            ValueError: If epsilon is negative.
+        """
+        if epsilon < 0:
+            raise ValueError(f"epsilon must be non-negative, got {epsilon}")
+
+        self.keys = sorted_keys
+        self.epsilon = epsilon
+        self._first_keys = array("q")
+        self._slopes = array("d")
+        self._starts = array("q")
+
+        origin_key = origin_rank = None
+        slope_low, slope_high = 0.0, math.inf
+
+        for rank, key in enumerate(sorted_keys):
+            if origin_key is not None:
+                run = key - origin_key
+                if run == 0:
+                    # A repeated first key is predicted at origin_rank exactly
+                    if rank - origin_rank <= epsilon:
+                        continue
+                else:
+                    # Narrow the cone of slopes that keep every point within epsilon
+                    new_low = max(slope_low, (rank - epsilon - origin_rank) / run)
+                    new_high = min(slope_high, (rank + epsilon - origin_rank) / run)
+                    if new_low <= new_high:
+                        slope_low, slope_high = new_low, new_high
+                        continue
+                self._close_segment(origin_key, origin_rank, slope_low, slope_high)
+
+            # Start a new segment anchored at this key
+            origin_key, origin_rank = key, rank
+            slope_low, slope_high = 0.0, math.inf
+
+        if origin_key is not None:
+            self._close_segment(origin_key, origin_rank, slope_low, slope_high)
+
+    def _close_segment(self, origin_key, origin_rank, slope_low, slope_high) -> None:
+        """Record a segment using the middle of its feasible slope range."""
+        self._first_keys.append(origin_key)
+        self._slopes.append(0.0 if slope_high == math.inf else (slope_low + slope_high) / 2)
+        self._starts.append(origin_rank)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._starts)
+
+    def memory_bytes(self) -> int:
+        """Return the size of the index arrays, excluding the keys themselves."""
+        return sum(sys.getsizeof(part) for part in (self._first_keys, self._slopes, self._starts))
+
+    def search(self, target) -> tuple[int, int]:
+        """
+        Find target through its segment's prediction and a bounded binary search.
+
+        Args:
+            target: The value to search for.
+
+        Returns:
+            A tuple of (index, steps) where:
+                - index: Position of target in the keys, or -1 if not found.
+                - steps: Iterations spent locating the segment plus iterations
+                    of the bounded binary search.
+        """
+        first_keys = self._first_keys
+
+        # Rightmost segment whose first key is <= target
+        low = 0
+        high = len(first_keys) - 1
+        segment = -1
+        steps = 0
+        while low <= high:
+            mid = (low + high) // 2
+            steps += 1
+            if first_keys[mid] <= target:
+                segment = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+
+        if segment < 0:
+            return -1, steps
+
+        start = self._starts[segment]
+        end = self._starts[segment + 1] - 1 if segment + 1 < len(self._starts) else len(self.keys) - 1
+        predicted = start + int(self._slopes[segment] * (target - first_keys[segment]))
+
+        # One extra slot each side absorbs the rounding of the prediction
+        low = max(start, predicted - self.epsilon - 1)
+        high = min(end, predicted + self.epsilon + 1)
+        index, window_steps = binary_search(self.keys, target, low, high)
+        return index, steps + window_steps
+
+
+def test_learned_index():
+    """
+    Run unit tests to verify LearnedIndex finds every key and rejects absent ones.
+
+    Tests cover an empty index, boundaries, gaps, long duplicate runs, and
+    skewed keys that need many segments.
+    """
+    # Test empty index
+    assert LearnedIndex([]).search(5)[0] == -1
+
+    # Target at the beginning, at the end, and absent
+    assert LearnedIndex([1, 2, 3, 4, 5], epsilon=0).search(1)[0] == 0
+    assert LearnedIndex([1, 2, 3, 4, 5], epsilon=0).search(5)[0] == 4
+    assert LearnedIndex([1, 2, 3, 4, 5], epsilon=0).search(6)[0] == -1
+    assert LearnedIndex([1, 2, 3, 4, 5], epsilon=0).search(0)[0] == -1
+
+    # Duplicate runs longer than epsilon, and squared (non-linear) keys
+    keys = sorted([7] * 20 + [i * i for i in range(500)])
+    present = set(keys)
+    for epsilon in (0, 1, 4, 16):
+        index = LearnedIndex(keys, epsilon)
+        for target in list(present) + list(range(-2, 500 * 500, 7)):
+            position = index.search(target)[0]
+            if target in present:
+                assert keys[position] == target, (epsilon, target)
+            else:
+                assert position == -1, (epsilon, target)
+
+    print("All learned index tests passed.")
+
+
+def learned_index_comparison(list_sizes=(10 ** 6, 10 ** 7), num_searches=1000, epsilon=32):
+    """
+    Benchmark the learned index vs plain binary search on random sorted keys.
+
+    Reports build time, index memory, and average lookup time and steps of
+    both searches over the same int64 array.
+
+    Args:
+        list_sizes: Key counts to benchmark.
+        num_searches: Number of random lookups (all hits) per size.
+        epsilon: Error bound of the learned index.
+    """
+    print("=" * 135)
+    print(f"LEARNED INDEX vs BINARY SEARCH (epsilon={epsilon}, Average of {num_searches} searches)")
+    print("=" * 135)
+    print(
+        f"{'List Size (N)':<15} {'Build Time(s)':<15} {'Segments':<12} {'Index Bytes':<14}"
+        f" {'Bin. Time(s)':<15} {'Bin. Steps':<12} {'Lrn. Time(s)':<15} {'Lrn. Steps':<12} {'Speedup'}")
+    print("-" * 135)
+
+    for size in list_sizes:
+        # Uniformly random distinct keys, so the model has real gaps to fit
+        sorted_keys = array("q", sorted(random.sample(range(size * 10), size)))
+
+        start_time = timeit.default_timer()
+        index = LearnedIndex(sorted_keys, epsilon)
+        build_time = timeit.default_timer() - start_time
+
+        targets = [sorted_keys[random.randrange(size)] for _ in range(num_searches)]
+
+        total_binary_time = 0
+        total_learned_time = 0
+        total_binary_steps = 0
+        total_learned_steps = 0
+
+        for target in targets:
+            # Time Binary Search
+            start_time = timeit.default_timer()
+            _, steps = binary_search(sorted_keys, target)
+            total_binary_time += timeit.default_timer() - start_time
+            total_binary_steps += steps
+
+            # Time Learned Index
+            start_time = timeit.default_timer()
+            _, steps = index.search(target)
+            total_learned_time += timeit.default_timer() - start_time
+            total_learned_steps += steps
+
+        avg_binary_time = total_binary_time / num_searches
+        avg_learned_time = total_learned_time / num_searches
+        speedup = (avg_binary_time / avg_learned_time) if avg_learned_time > 0 else float('inf')
+
+        print(
+            f"{size:<15,d} {build_time:<15.3f} {index.segment_count:<12,d} {index.memory_bytes():<14,d}"
+            f" {avg_binary_time:<15.6f} {total_binary_steps / num_searches:<12.1f}"
+            f" {avg_learned_time:<15.6f} {total_learned_steps / num_searches:<12.1f} {speedup:.2f}x")
+
+    print("=" * 135)
+
+
+if __name__ == "__main__":
+    test_learned_index()
+    learned_index_comparison()
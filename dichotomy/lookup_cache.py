@@ -0,0 +1,238 @@
+"""
+Hot-Key Lookup Cache Module.
+
+Real query streams are skewed: a few hot targets account for most lookups,
+and each of them repeats the same ~log2(n) probes into the same keys. This
+module memoizes search results for one sorted container in a bounded LRU
+table, so a repeated target costs one dictionary lookup instead of a search.
+
+The cache trusts the container not to change unless it says so: containers
+with a `version` attribute (such as `SortedBlockList`) are checked on every
+lookup and a new version drops every cached result. Containers without one
+(lists, ranges, `SortedIntArray`) are treated as immutable.
+"""
+import random
+import timeit
+from collections import OrderedDict
+from itertools import accumulate
+
+from .core import binary_search
+from .lazy_range import ArithmeticRange
+
+
+class CachedSearch:
+    """
+    LRU-memoized search over one sorted container.
+
+    Calling the cache with a target returns the same (index, steps) tuple as
+    the wrapped search, except that steps is 0 for a cache hit.
+    """
+
+    def __init__(self, sorted_keys, capacity=1024, search=binary_search):
+        """
+        Args:
+            sorted_keys: The sorted container every lookup runs against.
+            capacity: Maximum number of cached targets.
+            search: Function(sorted_keys, target) returning (index, steps).
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.sorted_keys = sorted_keys
+        self.capacity = capacity
+        self._search = search
+        self._results = OrderedDict()
+        self._version = getattr(sorted_keys, "version", None)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __call__(self, target):
+        """
+        Look up target, from the cache when possible.
+
+        Returns:
+            A tuple of (index, steps) where:
+                - index: Position of target, or -1 if not found.
+                - steps: Iterations of the wrapped search, or 0 for a hit.
+        """
+        version = getattr(self.sorted_keys, "version", None)
+        if version != self._version:
+            # The container changed: every cached position may be stale
+            self._results.clear()
+            self._version = version
+            self.invalidations += 1
+
+        index = self._results.get(target)
+        if index is not None:
+            self._results.move_to_end(target)
+            self.hits += 1
+            return index, 0
+
+        self.misses += 1
+        index, steps = self._search(self.sorted_keys, target)
+        self._results[target] = index
+        if len(self._results) > self.capacity:
+            # Evict the least recently used target
+            self._results.popitem(last=False)
+            self.evictions += 1
+        return index, steps
+
+    def __len__(self):
+        return len(self._results)
+
+    @property
+    def hit_rate(self):
+        """Share of lookups answered from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Return the counters as a dictionary."""
+        return {
+            "capacity": self.capacity,
+            "size": len(self._results),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self):
+        """Drop every cached result and reset the counters."""
+        self._results.clear()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+
+def zipf_targets(sorted_keys, count, exponent=1.1, seed=None):
+    """
+    Draw targets from sorted_keys with Zipf-distributed popularity.
+
+    The key of popularity rank r is drawn with probability proportional to
+    1 / r ** exponent; ranks are assigned to keys at random, so hot keys are
+    spread over the whole container.
+
+    Args:
+        sorted_keys: The keys to draw from.
+        count: Number of targets.
+        exponent: Skew of the distribution; higher is more skewed.
+        seed: Seed for a reproducible stream.
+
+    Returns:
+        A list of count targets.
+    """
+    rng = random.Random(seed)
+    size = len(sorted_keys)
+    cumulative = list(accumulate(1.0 / rank ** exponent for rank in range(1, size + 1)))
+    ranked_positions = rng.sample(range(size), size)
+    ranks = rng.choices(range(size), cum_weights=cumulative, k=count)
+    return [sorted_keys[ranked_positions[rank]] for rank in ranks]
+
+
+def test_cached_search():
+    """
+    Run unit tests to verify CachedSearch.
+
+    Tests cover hits and misses, absent targets, LRU eviction order,
+    invalidation after a container change, and an invalid capacity.
+    """
+    from .sorted_blocks import SortedBlockList
+
+    values = [1, 3, 5, 7, 9]
+    cache = CachedSearch(values, capacity=2)
+
+    # Misses return the search's result, hits return the same index with 0 steps
+    assert cache(5) == binary_search(values, 5)
+    assert cache(5) == (2, 0) and cache(4)[0] == -1 and cache(4) == (-1, 0)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Capacity 2: caching 9 evicts the least recently used target (5)
+    cache(9)
+    assert cache.evictions == 1 and len(cache) == 2
+    assert cache(5)[1] > 0 and cache(9)[1] == 0
+    assert cache.stats()["hit_rate"] == cache.hits / (cache.hits + cache.misses)
+
+    # A version change drops every cached position
+    keys = SortedBlockList([10, 20, 30], load=4)
+    cache = CachedSearch(keys, search=type(keys).search)
+    assert cache(20)[0] == 1 and cache(20) == (1, 0)
+    keys.add(15)
+    assert cache(20)[0] == 2 and cache.invalidations == 1
+    keys.discard(15)
+    assert cache(20)[0] == 1 and cache.invalidations == 2
+
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == cache.misses == 0
+
+    try:
+        CachedSearch(values, capacity=0)
+        raise AssertionError("Expected ValueError for capacity 0")
+    except ValueError:
+        pass
+
+    # Zipf streams are reproducible and skewed towards a few keys
+    targets = zipf_targets(ArithmeticRange(0, 1000), 5000, seed=1)
+    assert targets == zipf_targets(ArithmeticRange(0, 1000), 5000, seed=1)
+    assert max(targets.count(target) for target in set(targets)) > 5000 / 20
+
+    print("All lookup cache tests passed.")
+
+
+def lookup_cache_comparison(list_size=10 ** 6, num_searches=10 ** 5, exponents=(0.8, 1.1, 1.5),
+                            capacities=(256, 4096)):
+    """
+    Replay Zipf-distributed targets with the cache off and on.
+
+    Args:
+        list_size: Size of the sorted list.
+        num_searches: Targets per replay.
+        exponents: Zipf exponents to replay.
+        capacities: Cache capacities to compare against no cache.
+    """
+    sorted_list = list(range(0, 2 * list_size, 2))
+
+    print("=" * 115)
+    print(f"LOOKUP CACHE (N = {list_size:,d}, {num_searches:,d} Zipf lookups, time per lookup)")
+    print("=" * 115)
+    print(
+        f"{'Zipf s':<10} {'Capacity':<12} {'Time(s)':<15} {'Steps':<12} {'Hit Rate':<12}"
+        f" {'Evictions':<12} {'Speedup'}")
+    print("-" * 115)
+
+    for exponent in exponents:
+        targets = zipf_targets(sorted_list, num_searches, exponent, seed=42)
+
+        total_steps = 0
+        start_time = timeit.default_timer()
+        for target in targets:
+            total_steps += binary_search(sorted_list, target)[1]
+        plain_time = (timeit.default_timer() - start_time) / num_searches
+        print(
+            f"{exponent:<10.1f} {'off':<12} {plain_time:<15.3g} {total_steps / num_searches:<12.1f}"
+            f" {'-':<12} {'-':<12} 1.00x")
+
+        for capacity in capacities:
+            cache = CachedSearch(sorted_list, capacity)
+            total_steps = 0
+            start_time = timeit.default_timer()
+            for target in targets:
+                total_steps += cache(target)[1]
+            cached_time = (timeit.default_timer() - start_time) / num_searches
+            speedup = (plain_time / cached_time) if cached_time > 0 else float('inf')
+            print(
+                f"{exponent:<10.1f} {capacity:<12,d} {cached_time:<15.3g} {total_steps / num_searches:<12.1f}"
+                f" {cache.hit_rate:<12.1%} {cache.evictions:<12,d} {speedup:.2f}x")
+
+        print("-" * 115)
+
+    print("=" * 115)
+
+
+if __name__ == "__main__":
+    test_cached_search()
+    lookup_cache_comparison()
@@ -0,0 +1,482 @@
+"""
+Lookup Server Module.
+
+This module keeps sorted key sets loaded in a local asyncio server and
+answers lookups from many concurrent clients. Instead of one search call per
+request, requests that arrive within a short window (by default, the same
+event loop iteration; at most max_batch of them) are coalesced and answered
+by one vectorized search per key set (see `batch_searcher`), so the per-call
+overhead is paid once per batch.
+
+Protocol (one line per request over TCP on localhost or a Unix socket,
+answered in order):
+    - "TARGET" or "KEYSET TARGET" -> "INDEX STEPS" (INDEX is -1 if absent)
+    - "stats"                     -> one JSON object with the server stats
+    - anything else               -> "error MESSAGE"
+
+A line longer than the stream reader's limit (64 KiB) is answered with an
+error, and the connection is then closed.
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import deque
+
+from .benchmark import percentile
+from .interactive import batch_searcher
+
+# Default coalescing window, in seconds, and batch size cap. A zero window
+# batches whatever arrived during one event loop iteration, which adds no
+# latency when idle and still forms large batches under load
+DEFAULT_WINDOW = 0.0
+DEFAULT_MAX_BATCH = 1024
+# Targets must fit the int64 keys the vectorized searcher compares against
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+class LookupServer:
+    """
+    Coalescing lookup server over named sorted key sets.
+
+    Lookups can also be made in-process with `lookup`, which returns a
+    future resolved when the lookup's batch is searched.
+    """
+
+    def __init__(self, key_sets, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH, history=10000):
+        """
+        Args:
+            key_sets: Mapping of name -> sorted keys (range, key file,
+                SortedIntArray, list, ...). The first one is the default.
+            window: Longest time, in seconds, a request waits for others to
+                join its batch; 0 still coalesces the requests that arrive
+                in the same event loop iteration.
+            max_batch: Batch size that triggers an immediate search.
+            history: Number of recent latencies and batch sizes kept for stats.
+
+        Raises:
+            ValueError: If key_sets is empty or max_batch is not positive.
+        """
+        if not key_sets:
+            raise ValueError("at least one key set is required")
+        if max_batch <= 0:
+            raise ValueError(f"max_batch must be positive, got {max_batch}")
+        self.key_sets = dict(key_sets)
+        self.default = next(iter(self.key_sets))
+        self.window = window
+        self.max_batch = max_batch
+
+        self._searchers = {name: batch_searcher(keys) for name, keys in self.key_sets.items()}
+        # Waiting requests, as (key set, target, future, arrival time)
+        self._pending = []
+        self._flush_handle = None
+        self._server = None
+        self._connections = {}
+
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self._latencies = deque(maxlen=history)
+        self._batch_sizes = deque(maxlen=history)
+        self._started = time.perf_counter()
+
+    def lookup(self, target, name=None):
+        """
+        Queue a lookup for the next batch.
+
+        Args:
+            target: Integer to search for.
+            name: Key set to search (defaults to the first one).
+
+        Returns:
+            An asyncio future resolving to (index, steps).
+
+        Raises:
+            KeyError: If the key set does not exist.
+            ValueError: If target does not fit in a signed 64-bit integer.
+        """
+        name = self.default if name is None else name
+        if name not in self._searchers:
+            raise KeyError(f"unknown key set {name!r}")
+        if not INT64_MIN <= target <= INT64_MAX:
+            raise ValueError(f"target {target} does not fit in int64")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((name, target, future, time.perf_counter()))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.window > 0:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        """Answer every waiting request with one batched search per key set."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        by_name = {}
+        for request in pending:
+            by_name.setdefault(request[0], []).append(request)
+
+        for name, requests in by_name.items():
+            try:
+                indices, steps = self._searchers[name]([target for _, target, _, _ in requests])
+            except Exception as error:
+                # Fail this key set's batch instead of leaving its futures
+                # unresolved, which would hang every waiting client
+                self.errors += len(requests)
+                for _, _, future, _ in requests:
+                    if not future.cancelled():
+                        future.set_exception(error)
+                continue
+            done = time.perf_counter()
+            for (_, _, future, arrival), index, step in zip(requests, indices, steps):
+                if not future.cancelled():
+                    future.set_result((index, step))
+                self._latencies.append(done - arrival)
+
+        self.requests += len(pending)
+        self.batches += 1
+        self._batch_sizes.append(len(pending))
+
+    def stats(self):
+        """
+        Return throughput and latency statistics.
+
+        Latency runs from a request's arrival to its batch being searched,
+        over the last `history` requests.
+        """
+        uptime = time.perf_counter() - self._started
+        latencies = sorted(self._latencies)
+        sizes = self._batch_sizes
+        return {
+            "key_sets": {name: len(keys) for name, keys in self.key_sets.items()},
+            "window": self.window,
+            "max_batch": self.max_batch,
+            "requests": self.requests,
+            "batches": self.batches,
+            "errors": self.errors,
+            "uptime": uptime,
+            "throughput": self.requests / uptime if uptime > 0 else 0.0,
+            "mean_batch": sum(sizes) / len(sizes) if sizes else 0.0,
+            "latency_p50": percentile(latencies, 0.5) if latencies else None,
+            "latency_p99": percentile(latencies, 0.99) if latencies else None,
+        }
+
+    def _answer(self, line):
+        """Turn one request line into a future, or an immediate reply string."""
+        fields = line.split()
+        if fields == [b"stats"]:
+            return json.dumps(self.stats())
+        try:
+            if len(fields) == 1:
+                return self.lookup(int(fields[0]))
+            if len(fields) == 2:
+                return self.lookup(int(fields[1]), fields[0].decode())
+            raise ValueError("expected 'TARGET', 'KEYSET TARGET' or 'stats'")
+        except (ValueError, KeyError) as error:
+            self.errors += 1
+            return f"error {error}"
+
+    async def _handle_client(self, reader, writer):
+        """Read requests as they come and reply to them in order."""
+        self._connections[asyncio.current_task()] = writer
+        replies = asyncio.Queue()
+        writer_task = asyncio.create_task(self._write_replies(replies, writer))
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    replies.put_nowait(self._answer(line))
+        except ConnectionError:
+            pass
+        except ValueError:
+            # readline() raises ValueError once a line exceeds the reader's
+            # limit; the rest of the stream cannot be split reliably
+            self.errors += 1
+            replies.put_nowait("error request line too long")
+        finally:
+            replies.put_nowait(None)
+            await writer_task
+            del self._connections[asyncio.current_task()]
+
+    @staticmethod
+    async def _write_replies(replies, writer):
+        try:
+            while (reply := await replies.get()) is not None:
+                if isinstance(reply, str):
+                    writer.write(reply.encode() + b"\n")
+                else:
+                    try:
+                        index, steps = await reply
+                    except Exception as error:
+                        writer.write(f"error {error}\n".encode())
+                    else:
+                        writer.write(b"%d %d\n" % (index, steps))
+                # Flush once the replies ready so far are written
+                if replies.empty():
+                    await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """
+        Start listening on localhost TCP, or on a Unix socket if path is given.
+
+        Returns:
+            The address: path for a Unix socket, otherwise (host, port).
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_client, path)
+            return path
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop listening, answer any waiting requests and end open connections."""
+        self._flush()
+        if self._server is not None:
+            self._server.close()
+            # Closing a connection ends its handler at its next read
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+
+
+async def open_connection(address):
+    """Connect to a server address returned by `LookupServer.start`."""
+    if isinstance(address, str):
+        return await asyncio.open_unix_connection(address)
+    return await asyncio.open_connection(*address)
+
+
+async def remote_lookup(reader, writer, target, name=None):
+    """
+    Send one lookup over an open connection and wait for its reply.
+
+    Returns:
+        A tuple of (index, steps).
+    """
+    writer.write(b"%d\n" % target if name is None else b"%s %d\n" % (name.encode(), target))
+    reply = await reader.readline()
+    index, steps = reply.split()
+    return int(index), int(steps)
+
+
+async def remote_stats(address):
+    """Fetch the stats of a running server."""
+    reader, writer = await open_connection(address)
+    writer.write(b"stats\n")
+    stats = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return stats
+
+
+async def generate_load(address, targets, concurrency):
+    """
+    Replay targets from concurrent clients, one request in flight per client.
+
+    Args:
+        address: Server address (path or (host, port)).
+        targets: Targets to send, split round-robin between clients.
+        concurrency: Number of client connections.
+
+    Returns:
+        A tuple of (latencies, elapsed) where latencies are the sorted
+        round-trip times in seconds and elapsed is the wall time of the run.
+    """
+    async def client(chunk):
+        reader, writer = await open_connection(address)
+        latencies = []
+        for target in chunk:
+            start_time = time.perf_counter()
+            await remote_lookup(reader, writer, target)
+            latencies.append(time.perf_counter() - start_time)
+        writer.close()
+        await writer.wait_closed()
+        return latencies
+
+    start_time = time.perf_counter()
+    results = await asyncio.gather(*(client(targets[offset::concurrency]) for offset in range(concurrency)))
+    elapsed = time.perf_counter() - start_time
+    return sorted(latency for latencies in results for latency in latencies), elapsed
+
+
+def run_server(key_sets, host="127.0.0.1", port=0, path=None, window=DEFAULT_WINDOW,
+               max_batch=DEFAULT_MAX_BATCH):
+    """
+    Serve key_sets until interrupted, printing the address once listening.
+    """
+    async def serve():
+        server = LookupServer(key_sets, window, max_batch)
+        address = await server.start(host, port, path)
+        shown = address if isinstance(address, str) else f"{address[0]}:{address[1]}"
+        print(f"listening on {shown}", flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def test_lookup_server():
+    """
+    Run unit tests to verify the lookup server.
+
+    Tests cover coalescing of concurrent lookups into one batch, the size
+    cap, several key sets, the line protocol with malformed and out-of-range
+    requests, the stats over TCP, a failing batch that must not hang the
+    server, and an overlong request line.
+    """
+    from .core import binary_search
+    from .lazy_range import ArithmeticRange
+
+    async def scenario():
+        values = ArithmeticRange(0, 1000, 2)
+        server = LookupServer({"even": values, "small": [1, 2, 3]}, window=0.01, max_batch=8)
+
+        # Concurrent in-process lookups share one batch
+        results = await asyncio.gather(*(server.lookup(target) for target in (10, 11, 998)))
+        assert results == [binary_search(values, target) for target in (10, 11, 998)]
+        assert server.batches == 1
+
+        # The size cap answers a full batch without waiting for the window
+        futures = [server.lookup(target) for target in range(8)]
+        assert all(future.done() for future in futures) and server.batches == 2
+
+        address = await server.start()
+        reader, writer = await open_connection(address)
+        assert await remote_lookup(reader, writer, 500) == binary_search(values, 500)
+        assert (await remote_lookup(reader, writer, 3, "small"))[0] == 2
+
+        # Pipelined requests are answered in order, errors included
+        writer.write(b"4\nnope\nmissing 1\n1 2 3\n6\n")
+        replies = [await reader.readline() for _ in range(5)]
+        assert replies[0] == b"%d %d\n" % binary_search(values, 4)
+        assert all(reply.startswith(b"error") for reply in replies[1:4])
+        assert replies[4].split()[0] == b"3"
+
+        stats = await remote_stats(address)
+        assert stats["requests"] == 15 and stats["errors"] == 3 and stats["latency_p99"] >= 0
+
+        # Targets outside int64 are rejected without breaking the batch
+        writer.write(b"99999999999999999999\n8\n")
+        replies = [await reader.readline() for _ in range(2)]
+        assert replies[0].startswith(b"error") and replies[1] == b"%d %d\n" % binary_search(values, 8)
+
+        # A failing search fails its own batch only; the server stays usable
+        searcher = server._searchers["small"]
+        server._searchers["small"] = lambda targets: 1 / 0
+        failed, answered = server.lookup(1, "small"), server.lookup(4)
+        try:
+            await failed
+            raise AssertionError("Expected the failed batch to raise")
+        except ZeroDivisionError:
+            pass
+        assert await answered == binary_search(values, 4)
+        server._searchers["small"] = searcher
+
+        writer.close()
+        await writer.wait_closed()
+
+        # An overlong line gets an error, then the connection is closed
+        reader, writer = await open_connection(address)
+        writer.write(b"1" * (1 << 17) + b"\n")
+        assert (await reader.readline()).startswith(b"error") and await reader.read() == b""
+        writer.close()
+        await writer.wait_closed()
+        await asyncio.wait_for(server.close(), 5)
+
+    asyncio.run(scenario())
+
+    try:
+        LookupServer({})
+        raise AssertionError("Expected ValueError for no key sets")
+    except ValueError:
+        pass
+
+    print("All lookup server tests passed.")
+
+
+def lookup_server_benchmark(list_size=10 ** 6, num_requests=20000, concurrencies=(1, 16, 128),
+                            max_batches=(1, 64, 1024), window=DEFAULT_WINDOW):
+    """
+    Measure round-trip latency and throughput against the batch size cap.
+
+    Each max_batch runs in a fresh `python -m dichotomy serve` process (the
+    load generator runs here), so client and server do not share a GIL.
+    max_batch=1 searches every request on its own, i.e. no coalescing.
+
+    Args:
+        list_size: Size of the served range [1, list_size].
+        num_requests: Lookups per run.
+        concurrencies: Numbers of concurrent clients.
+        max_batches: Batch size caps to compare.
+        window: Coalescing window, in seconds.
+    """
+    import random
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    targets = [random.randint(1, list_size) for _ in range(num_requests)]
+
+    print("=" * 115)
+    print(f"LOOKUP SERVER (N = {list_size:,d}, {num_requests:,d} requests, window {window * 1e3:g} ms)")
+    print("=" * 115)
+    print(
+        f"{'Max Batch':<12} {'Clients':<10} {'p50(s)':<12} {'p99(s)':<12} {'Requests/s':<15}"
+        f" {'Mean Batch':<12}")
+    print("-" * 115)
+
+    for max_batch in max_batches:
+        process = subprocess.Popen(
+            [sys.executable, "-m", __package__, "serve", "--low", "1", "--high", str(list_size),
+             "--port", "0", "--window-ms", str(window * 1e3), "--max-batch", str(max_batch)],
+            cwd=root, stdout=subprocess.PIPE, text=True)
+        try:
+            host, port = process.stdout.readline().split()[-1].rsplit(":", 1)
+            address = (host, int(port))
+
+            for concurrency in concurrencies:
+                before = asyncio.run(remote_stats(address))
+                latencies, elapsed = asyncio.run(generate_load(address, targets, concurrency))
+                after = asyncio.run(remote_stats(address))
+                batches = after["batches"] - before["batches"]
+                mean_batch = (after["requests"] - before["requests"]) / batches if batches else 0.0
+                print(
+                    f"{max_batch:<12,d} {concurrency:<10d} {percentile(latencies, 0.5):<12.3g}"
+                    f" {percentile(latencies, 0.99):<12.3g} {num_requests / elapsed:<15,.0f}"
+                    f" {mean_batch:<12.1f}")
+        finally:
+            process.terminate()
+            process.wait()
+
+        print("-" * 115)
+
+    print("=" * 115)
+
+
+if __name__ == "__main__":
+    test_lookup_server()
+    lookup_server_benchmark()
@@ -0,0 +1,281 @@
+"""
+Sorted-Target Merge Join Module.
+
+This module looks up a whole batch of targets in one pass over a sorted list.
+When the targets are sorted too, each lookup can start where the previous one
+ended instead of restarting from the full range: galloping forward from the
+last position costs O(log d) for a gap of d, so m lookups cost
+O(m log(n/m)) in total instead of O(m log n). Galloping spends about two
+probes per halving, so a small batch (m below a few sqrt(n)) does better
+with a binary search that only keeps the previous position as its lower
+bound, and a dense batch (n/m small) with a plain linear merge of the lists.
+"""
+import random
+
+from .benchmark import measure_batch
+from .bounds import lower_bound
+from .core import binary_search
+from .lazy_range import ArithmeticRange
+
+# Use the linear merge when the list is at most this many times the batch:
+# the merge then takes about n/m + 1 steps per target, no more than the
+# ~2 log2(n/m) + 3 probes of galloping
+MERGE_RATIO = 8
+
+
+def is_sorted(values):
+    """Return True if values are in ascending order (O(m), stops at the first inversion)."""
+    return all(values[index] <= values[index + 1] for index in range(len(values) - 1))
+
+
+def _gallop_lower_bound(sorted_list, target, low, size):
+    """
+    Find the first position >= low whose value is not less than target.
+
+    Probes low, low + 1, low + 3, low + 7, ... until a value >= target, then
+    runs `lower_bound` on the last gap.
+
+    Returns:
+        A tuple of (position, steps), with position == size if every value
+        from low on is smaller.
+    """
+    steps = 0
+    offset = 1
+    high = size
+
+    while low < size:
+        steps += 1
+        if not sorted_list[low] < target:
+            high = low
+            break
+        probe = low + offset
+        if probe >= size:
+            # Every value up to low is smaller; the gap runs to the end
+            low += 1
+            break
+        steps += 1
+        if not sorted_list[probe] < target:
+            low, high = low + 1, probe
+            break
+        low = probe + 1
+        offset *= 2
+
+    position, search_steps = lower_bound(sorted_list, target, low, max(low, high))
+    return position, steps + search_steps
+
+
+def _bisect_join(sorted_list, targets):
+    """Look up ascending targets, bisecting from the previous lower bound to the end."""
+    size = len(sorted_list)
+    results = []
+    cursor = 0
+
+    for target in targets:
+        cursor, steps = lower_bound(sorted_list, target, cursor, size)
+        if cursor < size and sorted_list[cursor] == target:
+            results.append((cursor, steps))
+        else:
+            results.append((-1, steps))
+
+    return results
+
+
+def choose_join(size, batch_size):
+    """
+    Pick the cheapest join for a sorted batch of batch_size targets.
+
+    Returns:
+        "merge" if size <= MERGE_RATIO * batch_size, "gallop" if
+        batch_size ** 2 >= MERGE_RATIO * size (where 2 log2(n/m) + 3 drops
+        below log2(n)), and "bisect" otherwise.
+    """
+    if size <= MERGE_RATIO * batch_size:
+        return "merge"
+    if batch_size * batch_size >= MERGE_RATIO * size:
+        return "gallop"
+    return "bisect"
+
+
+def _gallop_join(sorted_list, targets):
+    """Look up ascending targets, galloping from the previous lower bound."""
+    size = len(sorted_list)
+    results = []
+    cursor = 0
+
+    for target in targets:
+        # Keep the cursor at the lower bound, not past it, so repeated
+        # targets are found again
+        cursor, steps = _gallop_lower_bound(sorted_list, target, cursor, size)
+        if cursor < size and sorted_list[cursor] == target:
+            results.append((cursor, steps))
+        else:
+            results.append((-1, steps))
+
+    return results
+
+
+def _linear_join(sorted_list, targets):
+    """Look up ascending targets by merging them with the list."""
+    size = len(sorted_list)
+    results = []
+    cursor = 0
+
+    for target in targets:
+        steps = 0
+        while cursor < size and sorted_list[cursor] < target:
+            cursor += 1
+            steps += 1
+        if cursor < size:
+            # Comparison that stopped the merge
+            steps += 1
+            if sorted_list[cursor] == target:
+                results.append((cursor, steps))
+                continue
+        results.append((-1, steps))
+
+    return results
+
+
+# Join name -> function(sorted_list, ascending_targets) returning [(index, steps)]
+JOINS = {"bisect": _bisect_join, "gallop": _gallop_join, "merge": _linear_join}
+
+
+def merge_join_search(sorted_list, targets, targets_sorted=None, method=None):
+    """
+    Look up a batch of targets with one forward pass over sorted_list.
+
+    Unsorted targets are sorted first and the results returned in the
+    caller's order, so the output always lines up with targets.
+
+    Args:
+        sorted_list: A list sorted in ascending order.
+        targets: The values to search for.
+        targets_sorted: True if targets are known to be ascending, False if
+            not; None detects it in O(m).
+        method: "bisect", "gallop" or "merge" to force a join; None lets
+            `choose_join` pick one from the list and batch sizes.
+
+    Returns:
+        A list with one (index, steps) tuple per target, in the order of
+        targets, where:
+            - index: First position of the target in the list, or -1 if not found.
+            - steps: Comparisons spent on this target since the previous one.
+
+    Raises:
+        ValueError: If method is not None or one of JOINS.
+    """
+    if method is None:
+        method = choose_join(len(sorted_list), len(targets))
+    join = JOINS.get(method)
+    if join is None:
+        raise ValueError(f"Unknown join method {method!r}; expected one of {sorted(JOINS)}")
+
+    if targets_sorted is None:
+        targets_sorted = is_sorted(targets)
+    if targets_sorted:
+        return join(sorted_list, targets)
+
+    # Join in ascending order, then scatter back to the caller's order
+    order = sorted(range(len(targets)), key=targets.__getitem__)
+    sorted_results = join(sorted_list, [targets[index] for index in order])
+    results = [None] * len(targets)
+    for position, index in enumerate(order):
+        results[index] = sorted_results[position]
+    return results
+
+
+def test_merge_join_search():
+    """
+    Run unit tests to verify merge_join_search against binary_search.
+
+    Tests cover empty inputs, every join method, duplicates in the list and
+    the targets, absent targets beyond both ends, and unsorted targets.
+    """
+    values = [1, 3, 3, 3, 7, 9, 12, 12, 20]
+    targets = [0, 1, 3, 3, 4, 12, 20, 25]
+
+    for method in ("bisect", "gallop", "merge", None):
+        # Test empty inputs
+        assert merge_join_search([], [1, 2], method=method) == [(-1, 0), (-1, 0)]
+        assert merge_join_search(values, [], method=method) == []
+
+        results = merge_join_search(values, targets, method=method)
+        assert [index for index, _ in results] == [-1, 0, 1, 1, -1, 6, 8, -1]
+
+        # Unsorted targets come back in the caller's order
+        shuffled = [20, 0, 3, 12, 25, 1]
+        results = merge_join_search(values, shuffled, method=method)
+        assert [index for index, _ in results] == [8, -1, 1, 6, -1, 0]
+        assert merge_join_search(values, shuffled, targets_sorted=False, method=method) == results
+
+    # Every hit agrees with binary_search on a large list
+    sorted_list = ArithmeticRange(0, 10 ** 5, 3)
+    targets = sorted(random.randrange(-10, 3 * 10 ** 5 + 10) for _ in range(500))
+    for method in JOINS:
+        for target, (index, _) in zip(targets, merge_join_search(sorted_list, targets, method=method)):
+            assert (index == -1) == (binary_search(sorted_list, target)[0] == -1)
+            assert index == -1 or sorted_list[index] == target
+
+    # The chosen join never costs more than restarting every search, and
+    # galloping or merging a dense batch costs much less
+    for batch_size in (20, 2000, 20000):
+        batch = sorted(sorted_list[random.randrange(len(sorted_list))] for _ in range(batch_size))
+        join_steps = sum(steps for _, steps in merge_join_search(sorted_list, batch))
+        binary_steps = sum(binary_search(sorted_list, target)[1] for target in batch)
+        assert join_steps <= binary_steps + batch_size
+        if choose_join(len(sorted_list), batch_size) != "bisect":
+            assert join_steps < binary_steps * 0.75
+
+    try:
+        merge_join_search(values, targets, method="skip")
+        raise AssertionError("Expected ValueError for an unknown method")
+    except ValueError:
+        pass
+
+    print("All merge join tests passed.")
+
+
+def merge_join_comparison(list_size=10 ** 6, batch_sizes=(10, 100, 1000, 10 ** 4, 10 ** 5)):
+    """
+    Benchmark sorted batches: one binary search per target vs the merge join.
+
+    Args:
+        list_size: Size of the sorted list.
+        batch_sizes: Numbers of sorted random targets per batch.
+    """
+    sorted_list = ArithmeticRange(0, list_size)
+
+    def search_each(keys, batch):
+        results = [binary_search(keys, target) for target in batch]
+        return [index for index, _ in results], [steps for _, steps in results]
+
+    def search_joined(keys, batch):
+        results = merge_join_search(keys, batch, targets_sorted=True)
+        return [index for index, _ in results], [steps for _, steps in results]
+
+    print("=" * 115)
+    print(f"MERGE JOIN vs BINARY SEARCH (N = {list_size:,d}, median time per target)")
+    print("=" * 115)
+    print(
+        f"{'Batch (M)':<15} {'Join':<10} {'Bin. Time(s)':<15} {'Bin. Steps':<15}"
+        f" {'Join Time(s)':<15} {'Join Steps':<15} {'Speedup'}")
+    print("-" * 115)
+
+    for batch_size in batch_sizes:
+        targets = sorted(random.randrange(list_size) for _ in range(batch_size))
+        method = choose_join(list_size, batch_size)
+
+        binary = measure_batch(search_each, sorted_list, targets, "binary", max_time=0.5)
+        joined = measure_batch(search_joined, sorted_list, targets, "merge_join", max_time=0.5)
+        speedup = (binary.median / joined.median) if joined.median > 0 else float('inf')
+
+        print(
+            f"{batch_size:<15,d} {method:<10} {binary.median:<15.3g} {binary.steps:<15.1f}"
+            f" {joined.median:<15.3g} {joined.steps:<15.1f} {speedup:.2f}x")
+
+    print("=" * 115)
+
+
+if __name__ == "__main__":
+    test_merge_join_search()
+    merge_join_comparison()
@@ -0,0 +1,176 @@
+"""
+Parallel Benchmark Sweep Module.
+
+This module spreads the benchmark sweep over a process pool. The sorted keys
+of every size are built once in shared memory as int64 and attached by name
+in the workers, so only (size, algorithm, target chunk) work units and their
+raw samples cross process boundaries. The samples of all chunks are merged
+into the same Measurement records as the sequential `performance_comparison`.
+"""
+import itertools
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Queue, shared_memory
+
+from .benchmark import collect_search_samples, summarize
+from .core import linear_search
+from .search_strategies import STRATEGIES
+
+# Shared memory blocks attached by this worker process, by block name
+_attached = {}
+
+
+def resolve_algorithm(name):
+    """
+    Return the search function registered under name.
+
+    "linear" is the linear search baseline; every other name is looked up in
+    the search strategy registry.
+
+    Raises:
+        KeyError: If no algorithm has that name.
+    """
+    if name == "linear":
+        return linear_search
+    return STRATEGIES[name]
+
+
+def create_shared_keys(values, count, fill_chunk=1 << 20):
+    """
+    Copy count integers from values into a new int64 shared memory block.
+
+    The keys are written one chunk at a time, so an iterable such as range()
+    or a file is never materialized as a full-size list.
+
+    Args:
+        values: An iterable of at least count integers.
+        count: Number of values to copy.
+        fill_chunk: Number of values converted per chunk.
+
+    Returns:
+        The SharedMemory block; the caller must close() and unlink() it.
+    """
+    block = shared_memory.SharedMemory(create=True, size=max(count, 1) * 8)
+    keys = block.buf.cast("q")
+    iterator = iter(values)
+    try:
+        for start in range(0, count, fill_chunk):
+            stop = min(start + fill_chunk, count)
+            keys[start:stop] = array("q", itertools.islice(iterator, stop - start))
+    finally:
+        keys.release()
+    return block
+
+
+def attach_shared_keys(block_name, count):
+    """
+    Attach (once per process) to a shared key block and view it as int64.
+
+    Args:
+        block_name: Name of a block made by `create_shared_keys`.
+        count: Number of keys in the block.
+
+    Returns:
+        A memoryview of count int64 keys, usable as a sequence.
+    """
+    if block_name not in _attached:
+        block = shared_memory.SharedMemory(name=block_name)
+        _attached[block_name] = (block, block.buf.cast("q")[:count])
+    return _attached[block_name][1]
+
+
+def _init_worker(cpu_queue):
+    """Pin the worker to one CPU taken from cpu_queue, if pinning is enabled."""
+    if cpu_queue is not None:
+        os.sched_setaffinity(0, {cpu_queue.get()})
+
+
+def _run_unit(block_name, size, algorithm, targets, max_time):
+    """
+    Measure one (size, algorithm, target chunk) work unit in a worker.
+
+    Returns:
+        A tuple of (size, algorithm, samples, loops, total_steps, target_count).
+    """
+    sorted_keys = attach_shared_keys(block_name, size)
+    samples, loops, total_steps = collect_search_samples(
+        resolve_algorithm(algorithm), sorted_keys, targets, max_time=max_time)
+    return size, algorithm, samples, loops, total_steps, len(targets)
+
+
+def parallel_comparison(list_sizes=(10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7), algorithms=("linear", "binary"),
+                        num_searches=100, chunk_size=25, workers=None, pin_cpus=False, max_time=0.25):
+    """
+    Benchmark every (size, algorithm) pair on a process pool.
+
+    All algorithms of one size search the same random targets. Each target
+    chunk of each pair is a separate work unit, so the slow linear search
+    units of the large sizes no longer serialize the whole sweep.
+
+    Args:
+        list_sizes: List sizes to benchmark.
+        algorithms: Names accepted by `resolve_algorithm`.
+        num_searches: Number of random targets per size.
+        chunk_size: Number of targets per work unit.
+        workers: Number of worker processes (defaults to the usable CPUs).
+        pin_cpus: If True, pin each worker to its own CPU (Linux only) so
+            concurrently timed kernels do not migrate between cores.
+        max_time: Time budget per work unit, in seconds.
+
+    Returns:
+        A list of Measurement objects, one per (size, algorithm), with
+        memory_bytes set to the size of the shared key block.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+    if workers is None:
+        workers = len(cpus)
+
+    cpu_queue = None
+    if pin_cpus:
+        if not hasattr(os, "sched_setaffinity"):
+            raise OSError("CPU pinning needs os.sched_setaffinity, which this platform lacks")
+        workers = min(workers, len(cpus))
+        cpu_queue = Queue()
+        for cpu in cpus[:workers]:
+            cpu_queue.put(cpu)
+
+    blocks = {}
+    try:
+        units = []
+        for size in list_sizes:
+            blocks[size] = create_shared_keys(range(size), size)
+            targets = [random.randint(0, size - 1) for _ in range(num_searches)]
+            for algorithm in algorithms:
+                for start in range(0, num_searches, chunk_size):
+                    units.append((blocks[size].name, size, algorithm, targets[start:start + chunk_size], max_time))
+
+        # Slowest units first: big sizes and linear scans dominate the wall time
+        units.sort(key=lambda unit: (unit[2] != "linear", -unit[1]))
+
+        merged = {}
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(cpu_queue,)) as pool:
+            futures = [pool.submit(_run_unit, *unit) for unit in units]
+            for future in futures:
+                size, algorithm, samples, loops, total_steps, target_count = future.result()
+                entry = merged.setdefault((size, algorithm), [[], 0, 0, 0])
+                entry[0].extend(samples)
+                entry[1] = max(entry[1], loops)
+                entry[2] += total_steps
+                entry[3] += target_count
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+    measurements = []
+    for (size, algorithm), (samples, loops, total_steps, target_count) in merged.items():
+        measurement = summarize(samples, loops, size, algorithm, total_steps / target_count)
+        measurement.memory_bytes = size * 8
+        measurements.append(measurement)
+
+    return sorted(measurements, key=lambda item: (item.size, item.algorithm))
@@ -0,0 +1,239 @@
+"""
+Parallel Linear Scan Module.
+
+This module scans unsorted int64 keys on several cores. The keys live once in
+shared memory; each worker scans one contiguous chunk block by block with the
+C-level array.index, and skips the rest of its chunk as soon as an earlier
+chunk has reported a match, since only the lowest matching index counts.
+A batched mode answers many targets in the same single pass over the data.
+"""
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .benchmark import measure_batch, measure_search, render_statistics
+from .core import linear_search
+from .parallel_benchmark import attach_shared_keys, create_shared_keys
+
+
+def _scan_chunk(block_name, size, start, stop, targets, hint_name, block_size):
+    """
+    Find the first index of each target inside keys[start:stop], in a worker.
+
+    hints holds, per target, the lowest index any chunk has reported so far
+    (size while unknown). It is written without a lock: it only decides when
+    a worker may stop early, while the exact answer is the minimum of the
+    indices returned by all chunks.
+
+    Returns:
+        A tuple of (found, examined) where found maps target positions to
+        indices and examined is the number of keys scanned, counted per block.
+    """
+    keys = attach_shared_keys(block_name, size)
+    hint_block = shared_memory.SharedMemory(name=hint_name)
+    hints = hint_block.buf.cast("q")
+
+    found = {}
+    examined = 0
+    try:
+        remaining = dict(enumerate(targets))
+        for block_start in range(start, stop, block_size):
+            # Forget targets that an earlier chunk has already matched
+            remaining = {position: target for position, target in remaining.items()
+                         if hints[position] >= start}
+            if not remaining:
+                break
+
+            block = array("q")
+            block.frombytes(keys[block_start:min(block_start + block_size, stop)].cast("B"))
+
+            if len(remaining) == 1:
+                candidates = remaining.items()
+            else:
+                # One hashing pass over the block instead of one scan per target
+                present = set(block).intersection(remaining.values())
+                candidates = [(position, target) for position, target in remaining.items() if target in present]
+            examined += len(block)
+
+            for position, target in list(candidates):
+                try:
+                    offset = block.index(target)
+                except ValueError:
+                    continue
+                found[position] = block_start + offset
+                del remaining[position]
+                if found[position] < hints[position]:
+                    hints[position] = found[position]
+
+            if not remaining:
+                break
+    finally:
+        hints.release()
+        hint_block.close()
+
+    return found, examined
+
+
+class ParallelScanner:
+    """
+    Multi-process linear scanner over keys copied once into shared memory.
+
+    The worker pool and the shared keys live until close(); use as a
+    context manager to release them.
+    """
+
+    def __init__(self, values, workers=None, chunks_per_worker=4, block_size=1 << 16):
+        """
+        Args:
+            values: A sequence of integers (sorting not required).
+            workers: Number of worker processes (defaults to the CPU count).
+            chunks_per_worker: Chunks per worker; smaller chunks let a match
+                near the front stop the later chunks sooner.
+            block_size: Keys examined between two checks of the early-stop hints.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        self._size = len(values)
+        self._block = create_shared_keys(values, self._size)
+        self._pool = ProcessPoolExecutor(workers)
+        self._block_size = block_size
+
+        chunk_count = workers * chunks_per_worker
+        chunk_length = max(1, -(-self._size // chunk_count))
+        self._chunks = [(start, min(start + chunk_length, self._size))
+                        for start in range(0, self._size, chunk_length)]
+
+    def __len__(self):
+        return self._size
+
+    def search(self, target):
+        """
+        Find the lowest index of target.
+
+        Returns:
+            A tuple of (index, steps) where:
+                - index: Lowest position of target, or -1 if not found.
+                - steps: Number of keys examined by all workers together.
+        """
+        indices, steps = self.search_many([target])
+        return indices[0], steps
+
+    def search_many(self, targets):
+        """
+        Find the lowest index of every target in one pass over the keys.
+
+        Args:
+            targets: A list of values to search for.
+
+        Returns:
+            A tuple of (indices, steps) where:
+                - indices: List with the lowest position of each target, or -1.
+                - steps: Number of keys examined by all workers together.
+        """
+        unique_targets = list(dict.fromkeys(targets))
+        if not unique_targets or not self._size:
+            return [-1] * len(targets), 0
+
+        hint_block = shared_memory.SharedMemory(create=True, size=8 * len(unique_targets))
+        hints = hint_block.buf.cast("q")
+        try:
+            for position in range(len(unique_targets)):
+                hints[position] = self._size
+
+            # Chunks are submitted front to back, so early chunks report first
+            futures = [
+                self._pool.submit(_scan_chunk, self._block.name, self._size, start, stop,
+                                  unique_targets, hint_block.name, self._block_size)
+                for start, stop in self._chunks
+            ]
+
+            best = [self._size] * len(unique_targets)
+            steps = 0
+            for future in futures:
+                found, examined = future.result()
+                steps += examined
+                for position, index in found.items():
+                    best[position] = min(best[position], index)
+        finally:
+            hints.release()
+            hint_block.close()
+            hint_block.unlink()
+
+        index_of = {target: (index if index < self._size else -1)
+                    for target, index in zip(unique_targets, best)}
+        return [index_of[target] for target in targets], steps
+
+    def close(self):
+        """Shut down the workers and free the shared keys."""
+        self._pool.shutdown()
+        self._block.close()
+        self._block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def test_parallel_scan():
+    """
+    Run unit tests to verify ParallelScanner against linear_search.
+
+    Tests cover unsorted keys with duplicates across chunks, absent targets,
+    and a batch with repeated targets.
+    """
+    values = [5, 3, 9, 3, 7, 1, 9, 5, 0, 2, 8, 3]
+    with ParallelScanner(values, workers=2, chunks_per_worker=3, block_size=2) as scanner:
+        for target in range(-1, 11):
+            assert scanner.search(target)[0] == linear_search(values, target)[0], target
+
+        indices, _ = scanner.search_many([9, 4, 3, 9, 0])
+        assert indices == [2, -1, 1, 2, 8]
+
+    print("All parallel scan tests passed.")
+
+
+def parallel_scan_comparison(list_sizes=(10 ** 6, 10 ** 7), num_searches=20, workers=None):
+    """
+    Benchmark linear_search vs the parallel scan on shuffled keys.
+
+    Reports per-search time of one scan per target, and of one batched scan
+    answering all targets at once.
+
+    Args:
+        list_sizes: Key counts to benchmark.
+        num_searches: Number of random targets (all present) per size.
+        workers: Number of worker processes (defaults to the CPU count).
+    """
+    measurements = []
+
+    for size in list_sizes:
+        values = array("q", range(size))
+        random.shuffle(values)
+        targets = [random.randint(0, size - 1) for _ in range(num_searches)]
+
+        measurements.append(measure_search(linear_search, values, targets, "linear", max_time=5.0))
+
+        with ParallelScanner(values, workers) as scanner:
+            measurements.append(measure_search(
+                lambda keys, target: scanner.search(target), values, targets, "parallel", max_time=5.0))
+
+            def scan_batch(keys, batch):
+                indices, steps = scanner.search_many(batch)
+                # measure_batch averages per-target steps; share the single pass evenly
+                return indices, [steps / len(batch)] * len(batch)
+
+            measurements.append(measure_batch(scan_batch, values, targets, "parallel-batch", max_time=5.0))
+
+        del values
+
+    print(render_statistics(measurements))
+
+
+if __name__ == "__main__":
+    test_parallel_scan()
+    parallel_scan_comparison()
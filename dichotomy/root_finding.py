@@ -0,0 +1,332 @@
+"""
+Vectorized Root-Finding Module.
+
+Binary search halves an interval of integer positions until it holds the
+target; bisection halves an interval of real numbers until it holds a root
+of a continuous function. This module solves a whole batch of bracketed
+equations f(x) = 0 at once with NumPy: one function call per iteration
+evaluates every element that has not converged yet.
+
+Methods share one API and report per-element iteration counts, like the
+`steps` of `binary_search`:
+    - "bisection": halves every bracket; ~log2(width / tolerance) iterations.
+    - "illinois": regula falsi (secant through the bracket ends), halving the
+        stale end's value when the same end is kept twice, which restores
+        superlinear convergence.
+    - "brent": Brent's method, inverse quadratic / secant steps guarded by
+        bisection, so it is never much slower than bisection.
+"""
+import timeit
+
+import numpy as np
+
+METHODS = ("bisection", "illinois", "brent")
+
+
+def _prepare(function, low, high, args):
+    """Broadcast brackets and arguments, and evaluate the bracket ends."""
+    low, high, *args = np.broadcast_arrays(np.asarray(low, dtype=float), np.asarray(high, dtype=float),
+                                           *map(np.asarray, args))
+    # Copies: the solvers update the brackets in place
+    low = low.astype(float).ravel()
+    high = high.astype(float).ravel()
+    args = tuple(np.ravel(arg) for arg in args)
+    f_low = np.asarray(function(low, *args), dtype=float)
+    f_high = np.asarray(function(high, *args), dtype=float)
+    return low, high, args, f_low, f_high
+
+
+def find_roots(function, low, high, args=(), method="bisection", xtol=1e-12, rtol=4 * np.finfo(float).eps,
+               max_iterations=200):
+    """
+    Solve function(x, *args) = 0 for a batch of brackets [low, high].
+
+    Args:
+        function: Vectorized function(x, *args) returning an array shaped
+            like x. It is only called on the elements still iterating, with
+            the matching elements of args.
+        low: Lower bracket ends (array-like or scalar).
+        high: Upper bracket ends, broadcast against low.
+        args: Extra per-element arrays (or scalars) passed to function.
+        method: One of METHODS.
+        xtol: Absolute tolerance on the root.
+        rtol: Relative tolerance on the root.
+        max_iterations: Iteration cap per element.
+
+    Returns:
+        A tuple of (roots, iterations) arrays, one entry per bracket, where:
+            - roots: The root, or NaN if f(low) and f(high) have the same
+                sign (no bracketed root).
+            - iterations: Function evaluations spent on the element after
+                the two bracket ends; max_iterations if it did not converge.
+
+    Raises:
+        ValueError: If method is unknown.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {METHODS}")
+    low, high, args, f_low, f_high = _prepare(function, low, high, args)
+    solver = {"bisection": _bisection, "illinois": _illinois, "brent": _brent}[method]
+
+    roots = np.full(low.shape, np.nan)
+    iterations = np.zeros(low.shape, dtype=np.int64)
+
+    # Roots on a bracket end need no iteration
+    roots[f_low == 0] = low[f_low == 0]
+    on_high = (f_high == 0) & (f_low != 0)
+    roots[on_high] = high[on_high]
+    valid = np.flatnonzero(np.sign(f_low) * np.sign(f_high) < 0)
+
+    if valid.size:
+        def evaluate(x, active):
+            return np.asarray(function(x, *(arg[valid[active]] for arg in args)), dtype=float)
+
+        roots[valid], iterations[valid] = solver(
+            evaluate, low[valid], high[valid], f_low[valid], f_high[valid], xtol, rtol, max_iterations)
+
+    return roots, iterations
+
+
+def invert(function, targets, low, high, method="bisection", **options):
+    """
+    Solve function(x) = target for a batch of targets, function monotone on [low, high].
+
+    This covers quantiles (function is a CDF) and threshold searches.
+
+    Returns:
+        A tuple of (solutions, iterations) arrays, as `find_roots`.
+    """
+    return find_roots(lambda x, target: function(x) - target, low, high, (targets,), method, **options)
+
+
+def _bisection(evaluate, low, high, f_low, f_high, xtol, rtol, max_iterations):
+    """Halve every bracket, keeping the half whose ends change sign."""
+    iterations = np.zeros(low.shape, dtype=np.int64)
+    roots = low + (high - low) / 2
+    active = np.arange(low.size)
+
+    for _ in range(max_iterations):
+        mid = low[active] + (high[active] - low[active]) / 2
+        roots[active] = mid
+        done = (high[active] - low[active]) / 2 <= xtol + rtol * np.abs(mid)
+        active, mid = active[~done], mid[~done]
+        if not active.size:
+            break
+
+        f_mid = evaluate(mid, active)
+        iterations[active] += 1
+        # Root is in the upper half; discard lower half
+        go_right = np.sign(f_mid) == np.sign(f_low[active])
+        low[active[go_right]] = mid[go_right]
+        f_low[active[go_right]] = f_mid[go_right]
+        # Root is in the lower half; discard upper half
+        high[active[~go_right]] = mid[~go_right]
+
+        exact = f_mid == 0
+        roots[active[exact]] = mid[exact]
+        active = active[~exact]
+
+    return roots, iterations
+
+
+def _illinois(evaluate, low, high, f_low, f_high, xtol, rtol, max_iterations):
+    """Regula falsi with the Illinois modification."""
+    iterations = np.zeros(low.shape, dtype=np.int64)
+    roots = low + (high - low) / 2
+    # End replaced by the previous step: +1 high, -1 low, 0 none yet
+    kept = np.zeros(low.shape, dtype=np.int8)
+    active = np.arange(low.size)
+
+    for _ in range(max_iterations):
+        a, b, fa, fb = low[active], high[active], f_low[active], f_high[active]
+        x = (a * fb - b * fa) / (fb - fa)
+        # A degenerate secant (equal values) falls back to the midpoint
+        x = np.where(np.isfinite(x) & (x > a) & (x < b), x, a + (b - a) / 2)
+        roots[active] = x
+
+        fx = evaluate(x, active)
+        iterations[active] += 1
+
+        replace_high = np.sign(fx) == np.sign(fb)
+        replace_low = ~replace_high
+        high[active[replace_high]] = x[replace_high]
+        f_high[active[replace_high]] = fx[replace_high]
+        low[active[replace_low]] = x[replace_low]
+        f_low[active[replace_low]] = fx[replace_low]
+
+        # Same end moved twice: halve the value kept at the other end
+        stale_low = replace_high & (kept[active] == 1)
+        f_low[active[stale_low]] /= 2
+        stale_high = replace_low & (kept[active] == -1)
+        f_high[active[stale_high]] /= 2
+        kept[active] = np.where(replace_high, 1, -1)
+
+        width = high[active] - low[active]
+        done = (fx == 0) | (width <= 2 * (xtol + rtol * np.abs(x)))
+        active = active[~done]
+        if not active.size:
+            break
+
+    return roots, iterations
+
+
+def _brent(evaluate, low, high, f_low, f_high, xtol, rtol, max_iterations):
+    """Brent's method (zeroin), with every branch taken per element by masks."""
+    iterations = np.zeros(low.shape, dtype=np.int64)
+    a, b, fa, fb = low, high, f_low, f_high
+    c, fc = a.copy(), fa.copy()
+    d = b - a
+    e = d.copy()
+    active = np.arange(low.size)
+
+    for _ in range(max_iterations):
+        index = active
+        # Keep the root bracketed between b and c
+        same_side = np.sign(fb[index]) == np.sign(fc[index])
+        reset = index[same_side]
+        c[reset], fc[reset] = a[reset], fa[reset]
+        d[reset] = e[reset] = b[reset] - a[reset]
+
+        # Make b the best estimate so far
+        swap = index[np.abs(fc[index]) < np.abs(fb[index])]
+        a[swap], fa[swap] = b[swap], fb[swap]
+        b[swap], fb[swap] = c[swap], fc[swap]
+        c[swap], fc[swap] = a[swap], fa[swap]
+
+        tol = 2 * rtol * np.abs(b[index]) + xtol / 2
+        xm = (c[index] - b[index]) / 2
+        done = (np.abs(xm) <= tol) | (fb[index] == 0)
+        index, tol, xm = index[~done], tol[~done], xm[~done]
+        active = index
+        if not index.size:
+            break
+
+        # Try interpolation where the previous step was large enough
+        bisect = np.ones(index.size, dtype=bool)
+        step = xm.copy()
+        interpolate = (np.abs(e[index]) >= tol) & (np.abs(fa[index]) > np.abs(fb[index]))
+        if interpolate.any():
+            i = index[interpolate]
+            s = fb[i] / fa[i]
+            secant = a[i] == c[i]
+            q_ac = fa[i] / np.where(secant, 1.0, fc[i])
+            r_bc = fb[i] / np.where(secant, 1.0, fc[i])
+            xm_i = xm[interpolate]
+            p = np.where(secant, 2 * xm_i * s,
+                         s * (2 * xm_i * q_ac * (q_ac - r_bc) - (b[i] - a[i]) * (r_bc - 1)))
+            q = np.where(secant, 1 - s, (q_ac - 1) * (r_bc - 1) * (s - 1))
+            q = np.where(p > 0, -q, q)
+            p = np.abs(p)
+            tol_i = tol[interpolate]
+            accept = 2 * p < np.minimum(3 * xm_i * q - np.abs(tol_i * q), np.abs(e[i] * q))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                step[interpolate] = np.where(accept, p / q, xm_i)
+            bisect[interpolate] = ~accept
+
+        # Accepted interpolation: e keeps the previous step; bisection resets both
+        e[index] = np.where(bisect, step, d[index])
+        d[index] = step
+
+        a[index], fa[index] = b[index], fb[index]
+        b[index] += np.where(np.abs(step) > tol, step, np.copysign(tol, xm))
+        fb[index] = evaluate(b[index], index)
+        iterations[index] += 1
+
+    return b.copy(), iterations
+
+
+def test_root_finding():
+    """
+    Run unit tests to verify every method against known roots.
+
+    Tests cover cube roots, a transcendental equation (Kepler's), roots on
+    a bracket end, brackets without a sign change, quantile inversion and
+    the expected iteration counts of bisection.
+    """
+    targets = np.array([-27.0, -1.0, 0.5, 2.0, 8.0, 1000.0])
+    anomalies = np.linspace(0.1, 3.0, 50)
+
+    for method in METHODS:
+        roots, iterations = invert(lambda x: x ** 3, targets, -20.0, 20.0, method=method)
+        assert np.allclose(roots, np.cbrt(targets), atol=1e-10)
+        assert np.all(iterations > 0)
+
+        # Kepler's equation E - e sin(E) = M, with a per-element argument
+        roots, _ = find_roots(lambda x, m: x - 0.8 * np.sin(x) - m, 0.0, np.pi, (anomalies,), method=method)
+        assert np.allclose(roots - 0.8 * np.sin(roots), anomalies, atol=1e-10)
+
+        # Roots on a bracket end, and brackets without a sign change
+        roots, iterations = find_roots(lambda x: x - 1.0, [1.0, 0.0, 2.0], [3.0, 1.0, 3.0], method=method)
+        assert roots[0] == roots[1] == 1.0 and np.isnan(roots[2]) and not iterations.any()
+
+    # Bisection needs about log2(width / tolerance) iterations
+    _, iterations = invert(lambda x: x, np.array([0.3]), 0.0, 1.0, xtol=1e-6, rtol=0.0)
+    assert iterations[0] == int(np.ceil(np.log2(1.0 / 1e-6))) - 1
+
+    # Hybrid methods beat bisection on smooth functions
+    counts = {method: find_roots(lambda x, m: x - 0.8 * np.sin(x) - m, 0.0, np.pi, (anomalies,),
+                                 method=method)[1].mean() for method in METHODS}
+    assert counts["brent"] < counts["bisection"] and counts["illinois"] < counts["bisection"]
+
+    try:
+        find_roots(lambda x: x, 0.0, 1.0, method="newton")
+        raise AssertionError("Expected ValueError for an unknown method")
+    except ValueError:
+        pass
+
+    print("All root finding tests passed.")
+
+
+def root_finding_comparison(batch_sizes=(10 ** 3, 10 ** 5), xtol=1e-12):
+    """
+    Benchmark iterations and time of every method on three batched problems.
+
+    Problems:
+        - quantile: invert the logistic-normal CDF 1 / (1 + exp(-1.702 x)).
+        - cubic: solve x^3 + x = c (an implicit equation).
+        - kepler: solve E - 0.9 sin(E) = M (slow near M = 0).
+
+    Args:
+        batch_sizes: Numbers of equations solved per batch.
+        xtol: Absolute tolerance.
+    """
+    rng = np.random.default_rng(0)
+
+    print("=" * 115)
+    print(f"ROOT FINDING (xtol = {xtol:g})")
+    print("=" * 115)
+    print(
+        f"{'Problem':<12} {'Batch':<12} {'Method':<12} {'Time(s)':<15} {'Mean Iter.':<12}"
+        f" {'Max Iter.':<12} {'vs. Bisection'}")
+    print("-" * 115)
+
+    for batch_size in batch_sizes:
+        problems = {
+            "quantile": (lambda x, p: 1 / (1 + np.exp(-1.702 * x)) - p, -20.0, 20.0,
+                         (rng.uniform(1e-6, 1 - 1e-6, batch_size),)),
+            "cubic": (lambda x, c: x ** 3 + x - c, -1e3, 1e3, (rng.uniform(-1e6, 1e6, batch_size),)),
+            "kepler": (lambda x, m: x - 0.9 * np.sin(x) - m, 0.0, np.pi,
+                       (rng.uniform(0, np.pi, batch_size),)),
+        }
+
+        for name, (function, low, high, args) in problems.items():
+            bisection_time = None
+            for method in METHODS:
+                start_time = timeit.default_timer()
+                _, iterations = find_roots(function, low, high, args, method, xtol=xtol)
+                elapsed = timeit.default_timer() - start_time
+                if bisection_time is None:
+                    bisection_time = elapsed
+                relative = (bisection_time / elapsed) if elapsed > 0 else float('inf')
+                print(
+                    f"{name:<12} {batch_size:<12,d} {method:<12} {elapsed:<15.6f}"
+                    f" {iterations.mean():<12.1f} {iterations.max():<12d} {relative:.2f}x")
+
+        print("-" * 115)
+
+    print("=" * 115)
+
+
+if __name__ == "__main__":
+    test_root_finding()
+    root_finding_comparison()
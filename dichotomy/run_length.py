@@ -0,0 +1,317 @@
+"""
+Run-Length Compressed Sorted Keys Module.
+
+Sorted keys with many duplicates repeat each value over a contiguous run,
+so a run can be stored once as (value, start position). This module keeps
+the distinct values and the run starts in two int64 arrays (16 bytes per
+run, whatever its length) and searches the distinct values only: a lookup
+costs log2(runs) comparisons instead of log2(n).
+
+Every result is a position in the original, uncompressed list, so
+`RunLengthKeys` can replace that list: `search` returns the same first
+occurrence as `lower_bound`, and indexing it (which `binary_search` does)
+returns the key at an original position.
+"""
+import bisect
+import random
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import repeat
+
+from .benchmark import measure_memory, measure_search, render_statistics
+from .bounds import lower_bound
+from .core import binary_search
+from .sorted_array import SortedIntArray
+
+
+class RunLengthKeys(Sequence):
+    """
+    Read-only sorted sequence of int64 keys stored as runs of equal values.
+
+    len() and indexing use positions of the uncompressed list; indexing
+    costs O(log runs).
+    """
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        """
+        Args:
+            values: Integers in ascending order; each must fit in int64.
+
+        Raises:
+            ValueError: If values are not in ascending order.
+            OverflowError: If a value does not fit in a signed 64-bit integer.
+        """
+        self._values = array("q")
+        self._starts = array("q")
+        size = 0
+        previous = None
+
+        for value in values:
+            if previous is None or value != previous:
+                if previous is not None and value < previous:
+                    raise ValueError(f"values must be sorted: {value} follows {previous} at position {size}")
+                self._values.append(value)
+                self._starts.append(size)
+                previous = value
+            size += 1
+
+        self._size = size
+
+    @classmethod
+    def from_runs(cls, values: Iterable[int], counts: Iterable[int]) -> "RunLengthKeys":
+        """
+        Build from distinct values and their run lengths, without expanding them.
+
+        Args:
+            values: Distinct integers in strictly ascending order.
+            counts: Positive run length of each value.
+
+        Raises:
+            ValueError: If values are not strictly ascending, a count is not
+                positive, or the two iterables differ in length.
+        """
+        instance = cls()
+        size = 0
+        for value, count in zip(values, counts, strict=True):
+            if count <= 0:
+                raise ValueError(f"run lengths must be positive, got {count} for {value}")
+            if instance._values and value <= instance._values[-1]:
+                raise ValueError(
+                    f"run values must be strictly ascending: {value} follows {instance._values[-1]}")
+            instance._values.append(value)
+            instance._starts.append(size)
+            size += count
+        instance._size = size
+        return instance
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _run_stop(self, run: int) -> int:
+        """Position one past the last key of a run."""
+        return self._starts[run + 1] if run + 1 < len(self._starts) else self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RunLengthKeys index out of range")
+        return self._values[bisect.bisect_right(self._starts, index) - 1]
+
+    def __iter__(self):
+        for run, value in enumerate(self._values):
+            yield from repeat(value, self._run_stop(run) - self._starts[run])
+
+    def __contains__(self, target) -> bool:
+        run = bisect.bisect_left(self._values, target)
+        return run < len(self._values) and self._values[run] == target
+
+    def __repr__(self) -> str:
+        return f"RunLengthKeys({self._size} keys in {len(self._values)} runs)"
+
+    def __array__(self, dtype=None, copy=None):
+        # Expands the runs; the result is a new array
+        import numpy as np
+
+        starts = np.frombuffer(self._starts, dtype=np.int64)
+        lengths = np.diff(starts, append=self._size)
+        keys = np.repeat(np.frombuffer(self._values, dtype=np.int64), lengths)
+        return keys if dtype is None else keys.astype(dtype, copy=False)
+
+    @property
+    def runs(self) -> int:
+        """Number of distinct values."""
+        return len(self._values)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the values and run starts in bytes (16 per run)."""
+        return self._values.itemsize * len(self._values) + self._starts.itemsize * len(self._starts)
+
+    def tolist(self) -> list:
+        return list(self)
+
+    def search(self, target: int, count_steps: bool = False) -> tuple[int, int]:
+        """
+        Find the first position of target in the uncompressed list.
+
+        Args:
+            target: The value to search for.
+            count_steps: If True, run the Python `lower_bound` loop over the
+                distinct values so the reported steps are exact; otherwise
+                use C `bisect`.
+
+        Returns:
+            A tuple of (index, steps) where:
+                - index: First position of target, or -1 if not found.
+                - steps: Iterations of `lower_bound` over the runs if
+                    count_steps, otherwise runs.bit_length(), an upper bound
+                    on them.
+        """
+        if count_steps:
+            run, steps = lower_bound(self._values, target)
+        else:
+            run = bisect.bisect_left(self._values, target)
+            steps = len(self._values).bit_length()
+        if run < len(self._values) and self._values[run] == target:
+            return self._starts[run], steps
+        return -1, steps
+
+    def lower_bound(self, target: int) -> int:
+        """Return the first position whose value is >= target."""
+        run = bisect.bisect_left(self._values, target)
+        return self._starts[run] if run < len(self._starts) else self._size
+
+    def upper_bound(self, target: int) -> int:
+        """Return the first position whose value is > target."""
+        run = bisect.bisect_right(self._values, target)
+        return self._starts[run] if run < len(self._starts) else self._size
+
+    def equal_range(self, target: int) -> tuple[int, int]:
+        """Return (start, stop) such that self[start:stop] holds exactly the keys equal to target."""
+        run = bisect.bisect_left(self._values, target)
+        if run < len(self._values) and self._values[run] == target:
+            return self._starts[run], self._run_stop(run)
+        position = self._starts[run] if run < len(self._starts) else self._size
+        return position, position
+
+    def count(self, target: int) -> int:
+        """Count the keys equal to target in O(log runs)."""
+        start, stop = self.equal_range(target)
+        return stop - start
+
+    def index(self, target: int, start: int = 0, stop: int = None) -> int:
+        """
+        Return the first position of target in self[start:stop].
+
+        Raises:
+            ValueError: If target is not present.
+        """
+        stop = self._size if stop is None else stop
+        first, last = self.equal_range(target)
+        position = max(first, start)
+        if position < min(last, stop):
+            return position
+        raise ValueError(f"{target} is not in RunLengthKeys")
+
+
+def duplicate_keys(size, duplicate_ratio, seed=None):
+    """
+    Generate sorted keys in which duplicate_ratio of the keys repeat a previous one.
+
+    Args:
+        size: Number of keys.
+        duplicate_ratio: Fraction of keys equal to their predecessor, in [0, 1).
+        seed: Optional random seed.
+
+    Returns:
+        A tuple of (values, counts): the distinct keys and their random run
+        lengths, summing to size.
+    """
+    generator = random.Random(seed)
+    runs = max(1, round(size * (1 - duplicate_ratio)))
+    cuts = sorted(generator.sample(range(1, size), runs - 1)) if runs > 1 else []
+    counts = [stop - start for start, stop in zip([0] + cuts, cuts + [size])]
+    values = sorted(generator.sample(range(runs * 10), runs))
+    return [value + 2 ** 40 for value in values], counts
+
+
+def test_run_length_keys():
+    """
+    Run unit tests to verify RunLengthKeys against the uncompressed list.
+
+    Tests cover an empty container, single and long runs, absent keys
+    inside and beyond the runs, `binary_search` over the container, and
+    rejection of unsorted input.
+    """
+    values = [1, 2, 2, 2, 3, 7, 7, 9, 9, 9, 9, 12]
+    keys = RunLengthKeys(values)
+
+    # Test empty container
+    empty = RunLengthKeys()
+    assert len(empty) == 0 and empty.search(1)[0] == -1 and empty.equal_range(1) == (0, 0)
+
+    # Sequence behaviour in original positions, 16 bytes per run
+    assert list(keys) == values and len(keys) == len(values) and keys.runs == 6
+    assert keys[-1] == 12 and keys[3] == 2 and keys[4:7] == [3, 7, 7] and keys.nbytes == 16 * 6
+
+    # Every query agrees with bisect on the uncompressed list
+    for target in range(0, 14):
+        first = bisect.bisect_left(values, target)
+        last = bisect.bisect_right(values, target)
+        assert keys.lower_bound(target) == first and keys.upper_bound(target) == last
+        assert keys.equal_range(target) == ((first, last) if first < last else (first, first))
+        assert keys.count(target) == last - first
+        expected = first if first < last else -1
+        assert keys.search(target)[0] == keys.search(target, count_steps=True)[0] == expected
+
+        # binary_search works on the container and lands inside the run
+        index, _ = binary_search(keys, target)
+        assert (index == -1) == (expected == -1) and (index == -1 or values[index] == target)
+
+    assert keys.index(9) == 7 and keys.index(9, 9) == 9 and (9 in keys) and (8 not in keys)
+    built = RunLengthKeys.from_runs([1, 2, 3, 7, 9, 12], [1, 3, 1, 2, 4, 1])
+    assert list(built) == values and built.equal_range(9) == (7, 11)
+
+    # Test unsorted input is rejected
+    for build in (lambda: RunLengthKeys([1, 3, 2]), lambda: RunLengthKeys.from_runs([1, 1], [1, 2]),
+                  lambda: RunLengthKeys.from_runs([1, 2], [1, 0]), lambda: keys.index(8)):
+        try:
+            build()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("invalid input was accepted")
+
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        assert np.asarray(keys).tolist() == values
+
+    print("All run-length tests passed.")
+
+
+def run_length_comparison(list_size=10 ** 6, duplicate_ratios=(0.0, 0.5, 0.9, 0.99, 0.999), num_searches=1000):
+    """
+    Benchmark memory per key and lookup time across duplicate ratios.
+
+    Rows:
+        - list: `binary_search` on a Python list.
+        - array: SortedIntArray.search, C bisect on all keys.
+        - rle: RunLengthKeys.search, C bisect on the distinct keys.
+
+    Args:
+        list_size: Number of keys.
+        duplicate_ratios: Fractions of keys that repeat their predecessor.
+        num_searches: Number of random lookups (all hits) per ratio.
+    """
+    for duplicate_ratio in duplicate_ratios:
+        values, counts = duplicate_keys(list_size, duplicate_ratio)
+        # One int object per key, as when the keys are read from a file
+        sorted_list, list_bytes = measure_memory(
+            lambda: [value + 0 for value, count in zip(values, counts) for value in repeat(value, count)])
+        keys, array_bytes = measure_memory(lambda: SortedIntArray(sorted_list, assume_sorted=True))
+        runs, run_bytes = measure_memory(lambda: RunLengthKeys.from_runs(values, counts))
+        targets = [sorted_list[random.randrange(list_size)] for _ in range(num_searches)]
+
+        measurements = []
+        for algorithm, search, structure, memory_bytes in (
+                ("list", binary_search, sorted_list, list_bytes),
+                ("array", SortedIntArray.search, keys, array_bytes),
+                ("rle", RunLengthKeys.search, runs, run_bytes)):
+            measurement = measure_search(search, structure, targets, algorithm, repeats=5, max_time=0.5)
+            measurement.memory_bytes = memory_bytes
+            measurements.append(measurement)
+
+        print(f"\nDuplicate ratio {duplicate_ratio:.1%}: {runs.runs:,d} runs")
+        print(render_statistics(measurements))
+
+
+if __name__ == "__main__":
+    test_run_length_keys()
+    run_length_comparison()
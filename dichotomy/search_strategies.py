@@ -0,0 +1,263 @@
+"""
+Search Strategy Registry Module.
+
+This module collects interchangeable search strategies that all share the
+`binary_search` contract: strategy(sorted_list, target) -> (index, steps).
+Besides the classic midpoint rule it provides interpolation search, which
+converges in O(log log n) probes on near-uniform keys, and exponential
+(galloping) search, which is cheapest for targets near the front.
+"""
+import random
+import timeit
+from array import array
+from itertools import accumulate
+
+from .core import binary_search
+
+# Strategy name -> function(sorted_list, target) returning (index, steps)
+STRATEGIES = {}
+
+
+def register_strategy(name):
+    """
+    Register a search function under a name, as a decorator.
+
+    Args:
+        name: Unique strategy name used in reports and lookups.
+
+    Returns:
+        A decorator that records the function and returns it unchanged.
+
+    Raises:
+        ValueError: If a strategy with the same name is already registered.
+    """
+    def decorator(function):
+        if name in STRATEGIES:
+            raise ValueError(f"search strategy {name!r} is already registered")
+        STRATEGIES[name] = function
+        return function
+
+    return decorator
+
+
+register_strategy("binary")(binary_search)
+
+
+@register_strategy("interpolation")
+def interpolation_search(sorted_list, target):
+    """
+    Perform interpolation search with a binary search fallback.
+
+    Probes where target should sit if the keys between low and high were
+    evenly spaced. Whenever a probe fails to at least halve the interval, the
+    next probe uses the binary midpoint instead, so skewed keys still cost at
+    most about twice the steps of `binary_search`.
+
+    Args:
+        sorted_list: A list of numbers sorted in ascending order.
+        target: The value to search for.
+
+    Returns:
+        A tuple of (index, steps) where:
+            - index: Position of target in list, or -1 if not found.
+            - steps: Number of iterations performed.
+    """
+    low = 0
+    high = len(sorted_list) - 1
+    steps = 0
+    interpolate = True
+
+    while low <= high:
+        steps += 1
+        low_value = sorted_list[low]
+        high_value = sorted_list[high]
+
+        # Target outside the remaining value range cannot be present
+        if target < low_value or target > high_value:
+            return -1, steps
+        if low_value == high_value:
+            return low, steps
+
+        if interpolate:
+            position = low + int((target - low_value) * (high - low) // (high_value - low_value))
+        else:
+            position = (low + high) // 2
+
+        width = high - low
+        position_value = sorted_list[position]
+
+        if position_value == target:
+            return position, steps
+        elif target > position_value:
+            low = position + 1
+        else:
+            high = position - 1
+
+        # Fall back to the midpoint rule after a poorly placed probe
+        interpolate = high - low <= width // 2
+
+    return -1, steps
+
+
+def galloping_search(sorted_list, target, start=0):
+    """
+    Perform galloping search forward from a starting position.
+
+    Probes start, start + 1, start + 3, start + 7, ... doubling the distance
+    until it passes target, then runs `binary_search` on the last gap. The
+    cost is O(log d) where d is the distance from start to target.
+
+    Args:
+        sorted_list: A list sorted in ascending order.
+        target: The value to search for.
+        start: Position to gallop from; only sorted_list[start:] is searched.
+
+    Returns:
+        A tuple of (index, steps) where:
+            - index: Position of target in list, or -1 if not found.
+            - steps: Number of probes performed, including the final binary search.
+    """
+    size = len(sorted_list)
+    if start >= size:
+        return -1, 0
+
+    steps = 1
+    start_value = sorted_list[start]
+    if start_value == target:
+        return start, steps
+    if target < start_value:
+        return -1, steps
+
+    # Invariant: sorted_list[low - 1] < target
+    low = start + 1
+    offset = 1
+    high = size - 1
+
+    while start + offset < size:
+        probe = start + offset
+        probe_value = sorted_list[probe]
+        steps += 1
+
+        if probe_value == target:
+            return probe, steps
+        elif probe_value > target:
+            high = probe - 1
+            break
+
+        low = probe + 1
+        offset *= 2
+
+    index, binary_steps = binary_search(sorted_list, target, low, high)
+    return index, steps + binary_steps
+
+
+@register_strategy("exponential")
+def exponential_search(sorted_list, target):
+    """
+    Perform exponential search, i.e. galloping search from the front.
+
+    Args:
+        sorted_list: A list sorted in ascending order.
+        target: The value to search for.
+
+    Returns:
+        A tuple of (index, steps) where:
+            - index: Position of target in list, or -1 if not found.
+            - steps: Number of probes performed.
+    """
+    return galloping_search(sorted_list, target, 0)
+
+
+def test_search_strategies():
+    """
+    Run the `test_binary_search` edge cases against every registered strategy,
+    plus skewed keys that defeat pure interpolation.
+    """
+    for name, strategy in STRATEGIES.items():
+        # Test empty list
+        assert strategy([], 5)[0] == -1, name
+
+        # Test target at the beginning and at the end
+        assert strategy([1, 2, 3, 4, 5], 1)[0] == 0, name
+        assert strategy([1, 2, 3, 4, 5], 5)[0] == 4, name
+
+        # Test target absent, below, between and above the keys
+        assert strategy([1, 2, 3, 4, 5], 0)[0] == -1, name
+        assert strategy([1, 3, 5, 7, 9], 4)[0] == -1, name
+        assert strategy([1, 2, 3, 4, 5], 6)[0] == -1, name
+
+        # With duplicates, any valid index containing the target is acceptable
+        assert strategy([1, 2, 2, 2, 3], 2)[0] in [1, 2, 3], name
+
+        # Exponentially spaced keys: every key, found within 2 * log2(n) + 2 steps
+        skewed = [2 ** i for i in range(60)]
+        for index, value in enumerate(skewed):
+            found, steps = strategy(skewed, value)
+            assert found == index and steps <= 2 * 6 + 2, (name, value, steps)
+
+    print("All strategy tests passed.")
+
+
+def random_gap_keys(size, rng, skewed=False):
+    """
+    Build size distinct sorted int64 keys separated by random gaps of 1 to 19.
+
+    The keys are near-uniform, as in most real key sets, but not a perfect
+    progression, where interpolation would land on every target at once.
+    With skewed, each key is squared, so the keys thin out towards the end
+    and interpolation has to fall back to binary steps.
+    """
+    keys = accumulate(rng.randrange(1, 20) for _ in range(size))
+    return array("q", (key * key for key in keys) if skewed else keys)
+
+
+def strategy_comparison(list_sizes=(10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7), num_searches=100):
+    """
+    Benchmark every registered strategy on the same random targets.
+
+    Each size is run on near-uniform random keys and on skewed (squared)
+    keys; see `random_gap_keys`. Targets are keys drawn at random.
+
+    Args:
+        list_sizes: List sizes to benchmark.
+        num_searches: Number of random searches per size, shared by all strategies.
+    """
+    print("=" * 115)
+    print(f"STRATEGY COMPARISON (Average of {num_searches} searches)")
+    print("=" * 115)
+    print(f"{'List Size (N)':<15} {'Keys':<10} {'Strategy':<15} {'Time(s)':<15} {'Steps':<15} {'vs. Binary'}")
+    print("-" * 115)
+
+    rng = random.Random()
+    for size in list_sizes:
+        for distribution in ("uniform", "skewed"):
+            sorted_list = random_gap_keys(size, rng, skewed=distribution == "skewed")
+            targets = [sorted_list[rng.randrange(size)] for _ in range(num_searches)]
+            results = {}
+
+            # Looked up at call time, so instrument_strategies can observe the run
+            for name, strategy in STRATEGIES.items():
+                total_time = 0
+                total_steps = 0
+
+                for target in targets:
+                    start_time = timeit.default_timer()
+                    _, steps = strategy(sorted_list, target)
+                    total_time += timeit.default_timer() - start_time
+                    total_steps += steps
+
+                results[name] = (total_time / num_searches, total_steps / num_searches)
+
+            binary_time = results["binary"][0] if "binary" in results else None
+            for name, (avg_time, avg_steps) in results.items():
+                relative = "-" if binary_time is None or avg_time <= 0 else f"{binary_time / avg_time:.2f}x"
+                print(f"{size:<15,d} {distribution:<10} {name:<15} {avg_time:<15.6f} {avg_steps:<15.1f} {relative}")
+
+        print("-" * 115)
+
+    print("=" * 115)
+
+
+if __name__ == "__main__":
+    test_search_strategies()
+    strategy_comparison()
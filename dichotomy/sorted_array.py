@@ -0,0 +1,332 @@
+"""
+Compact Sorted Integer Array Module.
+
+A Python list of ints costs about 40 bytes per key: an 8-byte pointer plus a
+32-byte int object, and every comparison in `binary_search` follows the
+pointer to unbox it. This module keeps sorted keys as raw int64 values in one
+contiguous buffer (8 bytes per key) and answers searches with the C `bisect`
+functions directly on that buffer.
+
+The buffer can be an `array('q')` built from any iterable, or an existing
+int64 buffer (a NumPy array, a bytearray, the mapped keys of a sorted key file)
+wrapped without copying.
+"""
+import bisect
+import random
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+
+from .benchmark import measure_memory, measure_search, render_statistics
+from .bounds import lower_bound
+from .core import binary_search
+from .merge_join import merge_join_search
+
+# Byte-order prefix of buffer formats that match native int64
+_NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+
+class SortedIntArray(Sequence):
+    """
+    Read-only sorted sequence of int64 keys stored in a contiguous buffer.
+
+    Indexing and slicing never copy: a slice is another SortedIntArray over
+    the same memory. NumPy sees the keys without a copy through __array__,
+    and memoryview() works directly on Python 3.12+ (use view() before).
+    """
+
+    def __init__(self, values: Iterable[int] = (), assume_sorted: bool = False) -> None:
+        """
+        Args:
+            values: Integers in ascending order; each must fit in int64.
+            assume_sorted: If True, skip the O(n) order check.
+
+        Raises:
+            ValueError: If values are not in ascending order.
+            OverflowError: If a value does not fit in a signed 64-bit integer.
+        """
+        self._storage = array("q", values)
+        self._keys = memoryview(self._storage)
+        if not assume_sorted:
+            _check_sorted(self._keys)
+
+    @classmethod
+    def from_buffer(cls, buffer, assume_sorted: bool = False) -> "SortedIntArray":
+        """
+        Wrap an existing buffer of native int64 keys without copying it.
+
+        The buffer is shared, not copied: it must stay alive while the array
+        is used, and the caller must not write to it through its owner (the
+        array sees every such write, and unsorted keys break its searches).
+
+        Args:
+            buffer: Any object exporting the buffer protocol, e.g. a NumPy
+                int64 array, array('q'), bytearray or mmap slice. Byte
+                buffers are reinterpreted as native int64.
+            assume_sorted: If True, skip the O(n) order check.
+
+        Raises:
+            ValueError: If the buffer does not hold whole, sorted int64 values,
+                e.g. it holds floats or unsigned integers.
+        """
+        view = memoryview(buffer)
+        if view.ndim != 1 or not view.c_contiguous:
+            raise ValueError("buffer must be one-dimensional and contiguous")
+        # Only signed 8-byte integers or raw bytes are int64 keys; a float64 or
+        # uint64 buffer has the right size but would be silently misread
+        item = view.format.lstrip("@=" + _NATIVE_ORDER)
+        if not ((item in ("q", "l") and view.itemsize == 8) or item in ("B", "b", "c")) or view.nbytes % 8:
+            raise ValueError(f"buffer of {view.format!r} items does not hold whole int64 keys")
+        # Read-only only through this view: the owner can still write, and
+        # keeping the keys sorted is then the caller's job
+        keys = view.toreadonly()
+        if keys.format != "q":
+            # NumPy exports int64 as "l"; memoryview casts go through bytes
+            keys = keys.cast("B").cast("q")
+        if not assume_sorted:
+            _check_sorted(keys)
+
+        instance = cls.__new__(cls)
+        instance._storage = buffer
+        instance._keys = keys
+        return instance
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError("SortedIntArray slices must be contiguous")
+            instance = SortedIntArray.__new__(SortedIntArray)
+            instance._storage = self._storage
+            instance._keys = self._keys[index]
+            return instance
+        return self._keys[index]
+
+    def __contains__(self, target) -> bool:
+        position = bisect.bisect_left(self._keys, target)
+        return position < len(self._keys) and self._keys[position] == target
+
+    def __repr__(self) -> str:
+        if len(self) > 6:
+            shown = ", ".join(map(str, self._keys[:3].tolist() + ["..."] + self._keys[-3:].tolist()))
+        else:
+            shown = ", ".join(map(str, self._keys.tolist()))
+        return f"SortedIntArray([{shown}])"
+
+    def view(self) -> memoryview:
+        """Return a read-only, zero-copy memoryview of the keys."""
+        return self._keys.toreadonly()
+
+    def __buffer__(self, flags):
+        # Buffer protocol for Python 3.12+ (PEP 688)
+        return self.view()
+
+    def __array__(self, dtype=None, copy=None):
+        # Zero-copy NumPy view; only a dtype conversion makes a copy
+        import numpy as np
+
+        keys = np.frombuffer(self._keys, dtype=np.int64)
+        return keys if dtype is None else keys.astype(dtype, copy=False)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the keys in bytes (8 per key)."""
+        return self._keys.nbytes
+
+    def tolist(self) -> list:
+        return self._keys.tolist()
+
+    def search(self, target: int, count_steps: bool = False) -> tuple[int, int]:
+        """
+        Find the first position of target.
+
+        Args:
+            target: The value to search for.
+            count_steps: If True, run the Python `lower_bound` loop so the
+                reported steps are exact; otherwise use C `bisect`, which does
+                not report its iterations.
+
+        Returns:
+            A tuple of (index, steps) where:
+                - index: First position of target, or -1 if not found.
+                - steps: Iterations of `lower_bound` if count_steps, otherwise
+                    len(self).bit_length(), an upper bound on them.
+        """
+        if count_steps:
+            position, steps = lower_bound(self._keys, target)
+        else:
+            position = bisect.bisect_left(self._keys, target)
+            steps = len(self._keys).bit_length()
+        if position < len(self._keys) and self._keys[position] == target:
+            return position, steps
+        return -1, steps
+
+    def search_many(self, targets) -> list:
+        """
+        Look up a batch of targets with `merge_join_search`.
+
+        Returns:
+            A list with one (index, steps) tuple per target, in target order.
+        """
+        return merge_join_search(self._keys, targets)
+
+    def lower_bound(self, target: int) -> int:
+        """Return the first position whose value is >= target."""
+        return bisect.bisect_left(self._keys, target)
+
+    def upper_bound(self, target: int) -> int:
+        """Return the first position whose value is > target."""
+        return bisect.bisect_right(self._keys, target)
+
+    def equal_range(self, target: int) -> tuple[int, int]:
+        """Return (start, stop) such that self[start:stop] holds exactly the keys equal to target."""
+        start = bisect.bisect_left(self._keys, target)
+        return start, bisect.bisect_right(self._keys, target, start)
+
+    def count(self, target: int) -> int:
+        """Count the keys equal to target in O(log n)."""
+        start, stop = self.equal_range(target)
+        return stop - start
+
+    def index(self, target: int, start: int = 0, stop: int = None) -> int:
+        """
+        Return the first position of target in self[start:stop].
+
+        Raises:
+            ValueError: If target is not present.
+        """
+        stop = len(self._keys) if stop is None else stop
+        position = bisect.bisect_left(self._keys, target, start, stop)
+        if position < stop and self._keys[position] == target:
+            return position
+        raise ValueError(f"{target} is not in SortedIntArray")
+
+    def between(self, minimum: int, maximum: int) -> "SortedIntArray":
+        """Return a zero-copy slice holding the keys in [minimum, maximum]."""
+        start = bisect.bisect_left(self._keys, minimum)
+        stop = bisect.bisect_right(self._keys, maximum, start)
+        return self[start:max(start, stop)]
+
+
+def _check_sorted(keys: memoryview) -> None:
+    """Raise ValueError at the first descending pair of keys."""
+    for position in range(1, len(keys)):
+        if keys[position] < keys[position - 1]:
+            raise ValueError(
+                f"values must be sorted: {keys[position]} follows {keys[position - 1]} at position {position}")
+
+
+def test_sorted_int_array():
+    """
+    Run unit tests to verify SortedIntArray.
+
+    Tests cover an empty array, duplicates, absent keys, range queries,
+    zero-copy slices and buffers, and rejection of unsorted input.
+    """
+    values = [-5, -1, 0, 2, 2, 2, 3, 2 ** 62]
+    keys = SortedIntArray(values)
+
+    # Test empty array
+    empty = SortedIntArray()
+    assert len(empty) == 0 and empty.search(1)[0] == -1 and 1 not in empty
+
+    # Sequence behaviour and 8 bytes per key
+    assert list(keys) == values and keys[-1] == 2 ** 62 and keys.nbytes == 8 * len(values)
+
+    # Searches, duplicates and absent keys
+    assert keys.search(2)[0] == keys.search(2, count_steps=True)[0] == 3
+    assert keys.search(1)[0] == -1 and keys.search(2 ** 63 - 1)[0] == -1
+    assert keys.equal_range(2) == (3, 6) and keys.count(2) == 3 and keys.count(1) == 0
+    assert keys.index(3) == 6 and 0 in keys and 1 not in keys
+    assert [index for index, _ in keys.search_many([3, -5, 1])] == [6, 0, -1]
+
+    # Range queries return zero-copy slices
+    assert keys.between(-1, 2).tolist() == [-1, 0, 2, 2, 2]
+    assert keys.between(4, 10).tolist() == [] and keys[2:4].tolist() == [0, 2]
+    assert keys[3:].search(3)[0] == 3
+
+    # Wrapping a buffer shares its memory: writes by the owner show through
+    storage = array("q", range(0, 100, 10))
+    wrapped = SortedIntArray.from_buffer(storage)
+    storage[9] = 1000
+    assert wrapped[9] == 1000 and wrapped.search(1000)[0] == 9
+    assert SortedIntArray.from_buffer(bytearray(storage.tobytes())).tolist() == storage.tolist()
+
+    # Buffers of other 8-byte types are rejected rather than reinterpreted
+    for foreign in (array("d", [1.0, 2.0]), array("Q", [1, 2]), array("i", [1, 2])):
+        try:
+            SortedIntArray.from_buffer(foreign)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"buffer of {foreign.typecode!r} items was accepted")
+
+    # Test unsorted input is rejected
+    for build in (lambda: SortedIntArray([1, 3, 2]), lambda: SortedIntArray.from_buffer(array("q", [2, 1]))):
+        try:
+            build()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("unsorted input was accepted")
+
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        # NumPy reads the same memory in both directions
+        assert np.shares_memory(np.asarray(keys), np.asarray(keys[2:]))
+        source = np.arange(0, 50, 5, dtype=np.int64)
+        assert SortedIntArray.from_buffer(source).search(45)[0] == 9
+        assert np.shares_memory(np.asarray(SortedIntArray.from_buffer(source)), source)
+        for foreign in (source.astype(np.float64), source.astype(np.uint64), source.astype(">i8")):
+            try:
+                SortedIntArray.from_buffer(foreign)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"buffer of {foreign.dtype} items was accepted")
+
+    print("All sorted int array tests passed.")
+
+
+def sorted_array_comparison(list_sizes=(10 ** 5, 10 ** 6), num_searches=1000):
+    """
+    Benchmark a list of ints vs SortedIntArray: memory per key and lookup time.
+
+    Rows:
+        - list: `binary_search` on a Python list.
+        - array: the same `binary_search` loop on a SortedIntArray.
+        - array_bisect: SortedIntArray.search, i.e. C bisect on the buffer.
+
+    Args:
+        list_sizes: Key counts to benchmark.
+        num_searches: Number of random lookups (all hits) per size.
+    """
+    measurements = []
+
+    for size in list_sizes:
+        # Distinct large keys, so the list does not benefit from the small-int cache
+        source = sorted(random.sample(range(size * 10), size))
+        sorted_list, list_bytes = measure_memory(lambda: [key + 2 ** 40 for key in source])
+        del source
+        keys, array_bytes = measure_memory(lambda: SortedIntArray(sorted_list, assume_sorted=True))
+        targets = [sorted_list[random.randrange(size)] for _ in range(num_searches)]
+
+        for algorithm, search, structure, memory_bytes in (
+                ("list", binary_search, sorted_list, list_bytes),
+                ("array", binary_search, keys, array_bytes),
+                ("array_bisect", SortedIntArray.search, keys, array_bytes)):
+            measurement = measure_search(search, structure, targets, algorithm, repeats=5, max_time=0.5)
+            measurement.memory_bytes = memory_bytes
+            measurements.append(measurement)
+
+    print(render_statistics(measurements))
+
+
+if __name__ == "__main__":
+    test_sorted_int_array()
+    sorted_array_comparison()
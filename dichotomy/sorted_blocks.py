@@ -0,0 +1,465 @@
+"""
+Mutable Sorted Block List Module.
+
+A single sorted list answers searches in O(log n), but every insert or
+delete shifts on average n/2 pointers (one large memmove), and rebuilding
+after each change costs a full sort. This module splits the keys into a list
+of small sorted blocks of between load/2 and 2 * load keys, plus a top-level
+index holding the largest key of each block:
+
+    - search: bisect the index to find the block, then bisect the block:
+        O(log(n/load) + log(load)) = O(log n).
+    - insert/delete: the same search, then a memmove inside one block, plus a
+        rare split or merge that shifts the n/load block pointers. With load
+        near sqrt(n) both parts are O(sqrt(n)).
+
+Positions (for the `binary_search` (index, steps) contract) come from prefix
+sums of the block lengths, rebuilt in C on the first positional lookup after
+a change.
+"""
+import bisect
+import random
+import timeit
+from collections.abc import Iterable, Sequence
+from itertools import accumulate, chain, islice
+
+from .bounds import lower_bound, upper_bound
+
+# Target block size: about sqrt(n) for n = 10^6, so an insert moves at most a
+# few kilobytes of pointers
+DEFAULT_LOAD = 1000
+
+
+class SortedBlockList(Sequence):
+    """
+    Sorted multiset of comparable keys that supports fast inserts and deletes.
+
+    Iteration yields the keys in ascending order and indexing is positional,
+    so `binary_search` and the bound queries accept it unchanged, but the
+    search methods below are much faster on it.
+    """
+
+    def __init__(self, values: Iterable = (), load: int = DEFAULT_LOAD) -> None:
+        """
+        Args:
+            values: Keys in any order; they are sorted once.
+            load: Target block size; blocks hold between load // 2 and
+                2 * load keys.
+
+        Raises:
+            ValueError: If load is less than 4.
+        """
+        if load < 4:
+            raise ValueError(f"load must be at least 4, got {load}")
+        self._load = load
+        self._blocks = []
+        self._maxes = []
+        self._offsets = None
+        self._size = 0
+        # Bumped by every change, so caches can tell their results are stale
+        self._version = 0
+        self._extend_sorted(iter(sorted(values)))
+
+    @classmethod
+    def from_sorted(cls, values: Iterable, load: int = DEFAULT_LOAD) -> "SortedBlockList":
+        """
+        Bulk-load keys that are already in ascending order, in O(n).
+
+        values is consumed once, a block at a time, so it can be a generator
+        or a `SortedKeyFile`.
+
+        Raises:
+            ValueError: If values are not in ascending order.
+        """
+        instance = cls(load=load)
+        instance._extend_sorted(iter(values), check=True)
+        return instance
+
+    def _extend_sorted(self, iterator, check=False) -> None:
+        """Append blocks of `load` keys from an ascending iterator to an empty list."""
+        previous = None
+        while True:
+            block = list(islice(iterator, self._load))
+            if not block:
+                break
+            if check:
+                first = block[0] if previous is None else previous
+                for position, value in enumerate(block):
+                    if value < first:
+                        raise ValueError(
+                            f"values must be sorted: {value} follows {first}"
+                            f" at position {self._size + position}")
+                    first = value
+            self._blocks.append(block)
+            self._maxes.append(block[-1])
+            self._size += len(block)
+            previous = block[-1]
+        self._offsets = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def version(self) -> int:
+        """Change counter: differs whenever the keys may have changed."""
+        return self._version
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self):
+        return chain.from_iterable(map(reversed, reversed(self._blocks)))
+
+    def __contains__(self, value) -> bool:
+        block_index = bisect.bisect_left(self._maxes, value)
+        if block_index == len(self._maxes):
+            return False
+        block = self._blocks[block_index]
+        return block[bisect.bisect_left(block, value)] == value
+
+    def __repr__(self) -> str:
+        return f"SortedBlockList({list(islice(self, 10))}{', ...' if self._size > 10 else ''})"
+
+    def _block_offsets(self) -> list:
+        """Start position of every block, followed by the total size."""
+        if self._offsets is None:
+            self._offsets = list(accumulate(map(len, self._blocks), initial=0))
+        return self._offsets
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("sorted block list index out of range")
+
+        offsets = self._block_offsets()
+        block_index = bisect.bisect_right(offsets, index) - 1
+        return self._blocks[block_index][index - offsets[block_index]]
+
+    def add(self, value) -> None:
+        """Insert value, after any equal keys."""
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+        else:
+            block_index = bisect.bisect_right(self._maxes, value)
+            if block_index == len(self._maxes):
+                # Larger than every key: extend the last block
+                block_index -= 1
+                self._blocks[block_index].append(value)
+                self._maxes[block_index] = value
+            else:
+                bisect.insort_right(self._blocks[block_index], value)
+            if len(self._blocks[block_index]) > 2 * self._load:
+                self._split(block_index)
+        self._size += 1
+        self._offsets = None
+        self._version += 1
+
+    def update(self, values: Iterable) -> None:
+        """Insert many values; large batches are merged and re-blocked in O(n + m log m)."""
+        values = sorted(values)
+        if len(values) * 8 < self._size:
+            for value in values:
+                self.add(value)
+            return
+        merged = sorted(chain(chain.from_iterable(self._blocks), values))
+        self._blocks, self._maxes, self._size = [], [], 0
+        self._extend_sorted(iter(merged))
+        self._version += 1
+
+    def discard(self, value) -> bool:
+        """
+        Remove the first occurrence of value, if present.
+
+        Returns:
+            True if a key was removed.
+        """
+        block_index = bisect.bisect_left(self._maxes, value)
+        if block_index == len(self._maxes):
+            return False
+        block = self._blocks[block_index]
+        position = bisect.bisect_left(block, value)
+        if block[position] != value:
+            return False
+
+        del block[position]
+        self._size -= 1
+        self._offsets = None
+        self._version += 1
+        if not block:
+            del self._blocks[block_index]
+            del self._maxes[block_index]
+        else:
+            self._maxes[block_index] = block[-1]
+            if len(block) < self._load // 2 and len(self._blocks) > 1:
+                self._merge(block_index)
+        return True
+
+    def remove(self, value) -> None:
+        """
+        Remove the first occurrence of value.
+
+        Raises:
+            ValueError: If value is not present.
+        """
+        if not self.discard(value):
+            raise ValueError(f"{value!r} is not in SortedBlockList")
+
+    def _split(self, block_index) -> None:
+        """Split an oversized block in two halves."""
+        block = self._blocks[block_index]
+        half = len(block) // 2
+        right = block[half:]
+        del block[half:]
+        self._blocks.insert(block_index + 1, right)
+        self._maxes[block_index] = block[-1]
+        self._maxes.insert(block_index + 1, right[-1])
+
+    def _merge(self, block_index) -> None:
+        """Join an undersized block with a neighbour, splitting again if too big."""
+        if block_index == len(self._blocks) - 1:
+            block_index -= 1
+        left = self._blocks[block_index]
+        left.extend(self._blocks[block_index + 1])
+        del self._blocks[block_index + 1]
+        del self._maxes[block_index + 1]
+        self._maxes[block_index] = left[-1]
+        if len(left) > 2 * self._load:
+            self._split(block_index)
+
+    def _locate(self, value, side, count_steps):
+        """
+        Bisect the index, then one block, on the given side ("left" or "right").
+
+        Returns:
+            A tuple of (block_index, position, steps), where position is inside
+            the block, or block_index == len(self._blocks) past the last key.
+        """
+        if count_steps:
+            # The Python bound loops count the iterations exactly
+            bound = lower_bound if side == "left" else upper_bound
+            block_index, steps = bound(self._maxes, value)
+        else:
+            bound = bisect.bisect_left if side == "left" else bisect.bisect_right
+            block_index = bound(self._maxes, value)
+            steps = len(self._maxes).bit_length()
+        if block_index == len(self._blocks):
+            return block_index, 0, steps
+
+        block = self._blocks[block_index]
+        if count_steps:
+            position, block_steps = bound(block, value)
+        else:
+            position = bound(block, value)
+            block_steps = len(block).bit_length()
+        return block_index, position, steps + block_steps
+
+    def _position(self, block_index, position) -> int:
+        """Convert a (block, position in block) pair to a global position."""
+        return self._block_offsets()[block_index] + position
+
+    def search(self, target, count_steps: bool = False) -> tuple[int, int]:
+        """
+        Find the first position of target.
+
+        Args:
+            target: The value to search for.
+            count_steps: If True, count the iterations of both bisections
+                (top-level index, then block) exactly with the Python
+                `lower_bound` loop; otherwise use C `bisect`.
+
+        Returns:
+            A tuple of (index, steps) where:
+                - index: First position of target, or -1 if not found.
+                - steps: Iterations of both bisections if count_steps,
+                    otherwise the bit_length upper bound on them.
+        """
+        block_index, position, steps = self._locate(target, "left", count_steps)
+        if block_index < len(self._blocks) and self._blocks[block_index][position] == target:
+            return self._position(block_index, position), steps
+        return -1, steps
+
+    def lower_bound(self, target) -> int:
+        """Return the first position whose value is >= target."""
+        return self._position(*self._locate(target, "left", False)[:2])
+
+    def upper_bound(self, target) -> int:
+        """Return the first position whose value is > target."""
+        return self._position(*self._locate(target, "right", False)[:2])
+
+    def count(self, target) -> int:
+        """Count the keys equal to target in O(log n) (plus the blocks it spans)."""
+        return self.upper_bound(target) - self.lower_bound(target)
+
+    def index(self, target, start: int = 0, stop: int = None) -> int:
+        """
+        Return the first position of target at or after start and before stop.
+
+        Raises:
+            ValueError: If target is not present there.
+        """
+        stop = self._size if stop is None else stop
+        position = max(self.lower_bound(target), start)
+        if position < stop and self[position] == target:
+            return position
+        raise ValueError(f"{target!r} is not in SortedBlockList")
+
+
+def test_sorted_block_list():
+    """
+    Run unit tests to verify SortedBlockList against a plain sorted list.
+
+    Tests cover an empty container, bulk loading, duplicates spanning
+    blocks, block splits and merges under random inserts and deletes, and
+    rejection of unsorted bulk-load input.
+    """
+    # Test empty container
+    empty = SortedBlockList()
+    assert len(empty) == 0 and empty.search(1)[0] == -1 and not empty.discard(1) and 1 not in empty
+
+    # Bulk load with a tiny load to get many blocks
+    keys = SortedBlockList.from_sorted(iter(range(0, 200, 2)), load=4)
+    assert list(keys) == list(range(0, 200, 2)) and len(keys._blocks) == 25
+    assert keys.search(100)[0] == keys.search(100, count_steps=True)[0] == 50
+    assert keys.search(101)[0] == -1 and keys[-1] == 198 and keys[3:6] == [6, 8, 10]
+
+    # Random inserts and deletes, checked against a sorted list
+    rng = random.Random(7)
+    expected = list(range(0, 200, 2))
+    for _ in range(3000):
+        value = rng.randrange(60)
+        if rng.random() < 0.5:
+            keys.add(value)
+            bisect.insort_right(expected, value)
+        else:
+            assert keys.discard(value) == (value in expected)
+            if value in expected:
+                expected.remove(value)
+        assert all(0 < len(block) <= 2 * 4 for block in keys._blocks)
+
+    assert list(keys) == expected and len(keys) == len(expected)
+    assert list(reversed(keys)) == expected[::-1]
+    for value in range(-1, 205):
+        first = bisect.bisect_left(expected, value)
+        hit = first < len(expected) and expected[first] == value
+        assert keys.search(value)[0] == keys.search(value, count_steps=True)[0] == (first if hit else -1)
+        assert keys.count(value) == expected.count(value)
+        assert keys.upper_bound(value) == bisect.bisect_right(expected, value)
+
+    # Bulk update merges and re-blocks
+    keys.update(range(1, 200, 2))
+    assert list(keys) == sorted(expected + list(range(1, 200, 2)))
+
+    try:
+        keys.remove(1000)
+        raise AssertionError("Expected ValueError for a missing key")
+    except ValueError:
+        pass
+
+    # Test unsorted bulk-load input is rejected
+    try:
+        SortedBlockList.from_sorted([1, 3, 2])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unsorted input was accepted")
+
+    print("All sorted block list tests passed.")
+
+
+def sorted_blocks_comparison(list_sizes=(10 ** 5, 10 ** 6), num_operations=5000,
+                             write_fractions=(0.0, 0.1, 0.5, 0.9)):
+    """
+    Benchmark a mixed read/write workload: plain sorted list vs SortedBlockList.
+
+    The list path uses C bisect for reads, `insort` for inserts and
+    `del list[i]` for deletes, so its cost is the O(n) memmove, not the
+    interpreter. Writes alternate between inserts and deletes of random
+    existing keys so the size stays constant.
+
+    The Re-sort and Blocks Add columns show the cost of absorbing
+    num_operations random new keys at once: appending them to the list and
+    sorting it again, vs one `SortedBlockList.add` per key.
+
+    Args:
+        list_sizes: Initial key counts.
+        num_operations: Operations per workload.
+        write_fractions: Share of writes in each workload.
+    """
+    print("=" * 115)
+    print(f"SORTED BLOCK LIST vs SORTED LIST ({num_operations:,d} mixed operations)")
+    print("=" * 115)
+    print(
+        f"{'List Size (N)':<15} {'Writes':<10} {'Re-sort(s)':<15} {'Blocks Add(s)':<15}"
+        f" {'List Op(s)':<15} {'Blocks Op(s)':<15} {'Speedup'}")
+    print("-" * 115)
+
+    for size in list_sizes:
+        source = sorted(random.sample(range(size * 10), size))
+
+        # What a static list pays to absorb a batch of random writes: append
+        # them and sort again (the appended tail is not in order, so this is
+        # not timsort's presorted best case), vs adding them one by one
+        writes = [random.randrange(size * 10) for _ in range(num_operations)]
+        sorted_list = list(source)
+        start_time = timeit.default_timer()
+        sorted_list.extend(writes)
+        sorted_list.sort()
+        list_resort = timeit.default_timer() - start_time
+        keys = SortedBlockList.from_sorted(source)
+        start_time = timeit.default_timer()
+        for value in writes:
+            keys.add(value)
+        blocks_add = timeit.default_timer() - start_time
+
+        for write_fraction in write_fractions:
+            rng = random.Random(size)
+            operations = []
+            for _ in range(num_operations):
+                if rng.random() < write_fraction:
+                    operations.append(("add", rng.randrange(size * 10)))
+                    operations.append(("remove", source[rng.randrange(size)]))
+                else:
+                    operations.append(("search", source[rng.randrange(size)]))
+
+            sorted_list = list(source)
+            start_time = timeit.default_timer()
+            for operation, value in operations:
+                if operation == "search":
+                    bisect.bisect_left(sorted_list, value)
+                elif operation == "add":
+                    bisect.insort_right(sorted_list, value)
+                else:
+                    position = bisect.bisect_left(sorted_list, value)
+                    if position < len(sorted_list) and sorted_list[position] == value:
+                        del sorted_list[position]
+            list_time = (timeit.default_timer() - start_time) / len(operations)
+
+            keys = SortedBlockList.from_sorted(source)
+            start_time = timeit.default_timer()
+            for operation, value in operations:
+                if operation == "search":
+                    keys.search(value)
+                elif operation == "add":
+                    keys.add(value)
+                else:
+                    keys.discard(value)
+            blocks_time = (timeit.default_timer() - start_time) / len(operations)
+
+            speedup = (list_time / blocks_time) if blocks_time > 0 else float('inf')
+            print(
+                f"{size:<15,d} {write_fraction:<10.0%} {list_resort:<15.6f} {blocks_add:<15.6f}"
+                f" {list_time:<15.3g} {blocks_time:<15.3g} {speedup:.2f}x")
+
+        print("-" * 115)
+
+    print("=" * 115)
+
+
+if __name__ == "__main__":
+    test_sorted_block_list()
+    sorted_blocks_comparison()
@@ -0,0 +1,216 @@
+"""
+Memory-Mapped Sorted Key File Module.
+
+This module stores sorted 64-bit integer keys in a flat on-disk file and
+exposes them as a read-only sequence backed by mmap, so a binary search only
+reads the pages touched by its ~log2(N) probes instead of loading the file.
+
+File layout (little-endian):
+    - 8 bytes: magic b"SORTI64" followed by a format version byte.
+    - 8 bytes: unsigned key count.
+    - count * 8 bytes: signed int64 keys in ascending order.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+
+MAGIC = b"SORTI64\x01"
+HEADER = struct.Struct("<8sQ")
+KEY = struct.Struct("<q")
+
+
+def write_sorted_file(path, values: Iterable[int], chunk_size: int = 1 << 16) -> int:
+    """
+    Stream sorted integers into a key file without holding them in memory.
+
+    Args:
+        path: Destination file path; an existing file is overwritten.
+        values: An iterable of integers in ascending order (list, range,
+            generator, ...). It is consumed once.
+        chunk_size: Number of keys buffered before each write.
+
+    Returns:
+        The number of keys written.
+
+    Raises:
+        ValueError: If values are not in ascending order.
+        OverflowError: If a value does not fit in a signed 64-bit integer.
+    """
+    count = 0
+    previous = None
+    chunk = array("q")
+
+    with open(path, "wb") as file:
+        # Placeholder header; the count is patched in once the stream ends
+        file.write(HEADER.pack(MAGIC, 0))
+
+        for value in values:
+            if previous is not None and value < previous:
+                raise ValueError(
+                    f"values must be sorted: {value} follows {previous} at position {count}")
+            previous = value
+            chunk.append(value)
+            count += 1
+
+            if len(chunk) >= chunk_size:
+                _write_chunk(file, chunk)
+                chunk = array("q")
+
+        _write_chunk(file, chunk)
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, count))
+
+    return count
+
+
+def _write_chunk(file, chunk: array) -> None:
+    """Write a chunk of native int64 values in little-endian order."""
+    if sys.byteorder == "big":
+        chunk.byteswap()
+    chunk.tofile(file)
+
+
+class SortedKeyFile(Sequence):
+    """
+    Read-only sequence view of a sorted key file, backed by mmap.
+
+    Indexing is O(1) and only faults in the page holding the requested key,
+    so `binary_search` and `binary_search_steps` accept it unchanged.
+    Use as a context manager, or call close(), to release the mapping.
+    """
+
+    def __init__(self, path) -> None:
+        """
+        Args:
+            path: Path to a file produced by `write_sorted_file`.
+
+        Raises:
+            ValueError: If the file is not a valid sorted key file.
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._mmap) < HEADER.size:
+                raise ValueError(f"{path} is too short to be a sorted key file")
+            magic, count = HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a sorted key file (bad magic {magic!r})")
+            if len(self._mmap) < HEADER.size + count * KEY.size:
+                raise ValueError(f"{path} is truncated: header announces {count} keys")
+        except ValueError:
+            self._mmap.close()
+            raise
+
+        self._count = count
+
+        # Probes are scattered, so read-ahead would only pull in unused pages
+        if hasattr(self._mmap, "madvise") and hasattr(mmap, "MADV_RANDOM"):
+            self._mmap.madvise(mmap.MADV_RANDOM)
+
+        # On little-endian hosts the keys can be read through a typed view
+        if sys.byteorder == "little":
+            self._keys = memoryview(self._mmap)[
+                HEADER.size:HEADER.size + count * KEY.size].cast("q")
+        else:
+            self._keys = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("sorted key file index out of range")
+
+        if self._keys is not None:
+            return self._keys[index]
+        return KEY.unpack_from(self._mmap, HEADER.size + index * KEY.size)[0]
+
+    def __array__(self, dtype=None, copy=None):
+        # Zero-copy NumPy view of the mapped keys; drop it before close()
+        import numpy as np
+
+        keys = np.frombuffer(self._mmap, dtype="<i8", count=self._count, offset=HEADER.size)
+        return keys if dtype is None else keys.astype(dtype, copy=False)
+
+    def close(self) -> None:
+        """
+        Release the typed view and the memory mapping.
+
+        If NumPy views from __array__ are still alive (for instance held by
+        a traceback), the mapping stays open until the last of them is
+        garbage collected instead of raising BufferError.
+        """
+        if self._keys is not None:
+            self._keys.release()
+            self._keys = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def test_sorted_key_file():
+    """
+    Run unit tests to verify writing and reading sorted key files.
+
+    Tests cover streaming from a generator, negative keys, duplicates,
+    an empty file, and rejection of unsorted input.
+    """
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "keys.bin")
+
+        # Stream from a generator with a tiny chunk size to exercise flushing
+        values = [-5, -1, 0, 2, 2, 2, 3, 2 ** 62]
+        assert write_sorted_file(path, iter(values), chunk_size=3) == len(values)
+        with SortedKeyFile(path) as keys:
+            assert len(keys) == len(values)
+            assert list(keys) == values
+            assert keys[-1] == 2 ** 62 and keys[2:4] == [0, 2]
+
+        # Closing while a NumPy view is alive leaves the view usable
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            keys = SortedKeyFile(path)
+            view = np.asarray(keys)
+            keys.close()
+            assert view.tolist() == values
+            del view
+
+        # Test empty file
+        assert write_sorted_file(path, []) == 0
+        with SortedKeyFile(path) as keys:
+            assert len(keys) == 0
+
+        # Test unsorted input is rejected
+        try:
+            write_sorted_file(path, [1, 3, 2])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("unsorted input was accepted")
+
+    print("All sorted key file tests passed.")
+
+
+if __name__ == "__main__":
+    test_sorted_key_file()
@@ -0,0 +1,222 @@
+"""
+Search Trace Module.
+
+This module records what `binary_search` did, step by step, so the TikZ
+generator, the analytics and anything else that needs the low/high/mid
+sequence read it from one search instead of re-implementing the loop.
+
+A trace stores its steps in four typed arrays (about 25 bytes per step).
+Callers that redraw the same (list, target) pairs can keep traces in a
+`TraceCache` they own, so a visualization is regenerated without searching
+again; nothing is cached unless a cache is passed.
+"""
+from array import array
+from collections import OrderedDict
+
+from .core import binary_search
+
+
+class SearchTrace:
+    """
+    Compact record of one binary search.
+
+    Each step is (low, high, mid, comparison), with comparison -1 if the
+    target is smaller than the mid value, 0 if equal and 1 if larger.
+    Iterating yields the steps as tuples.
+    """
+
+    def __init__(self, target=None):
+        self.target = target
+        self.index = -1
+        self.lows = array("q")
+        self.highs = array("q")
+        self.mids = array("q")
+        self.comparisons = array("b")
+
+    def record(self, low, high, mid, comparison):
+        """Append one step; called by `binary_search` when tracing."""
+        self.lows.append(low)
+        self.highs.append(high)
+        self.mids.append(mid)
+        self.comparisons.append(comparison)
+
+    def __len__(self):
+        return len(self.mids)
+
+    def __iter__(self):
+        return zip(self.lows, self.highs, self.mids, self.comparisons)
+
+    def __getitem__(self, step):
+        return self.lows[step], self.highs[step], self.mids[step], self.comparisons[step]
+
+    @property
+    def steps(self):
+        """Number of steps, equal to the steps returned by `binary_search`."""
+        return len(self.mids)
+
+    @property
+    def found(self):
+        return self.index != -1
+
+    def nbytes(self):
+        """Memory used by the step arrays, in bytes."""
+        return sum(len(column) * column.itemsize
+                   for column in (self.lows, self.highs, self.mids, self.comparisons))
+
+
+class TraceCache:
+    """
+    LRU cache of traces keyed by (list, target, bounds).
+
+    Lists are identified by object identity and length (plus their
+    `version`, if any), and every cached list is kept alive by its entry so
+    its identity cannot be reused. A plain list changed in place without a
+    length change is not detected: call clear() after such a change.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self._traces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(sorted_list, target, low, high):
+        return (id(sorted_list), len(sorted_list), getattr(sorted_list, "version", None), target, low, high)
+
+    def get(self, sorted_list, target, low=0, high=None):
+        """Return the cached trace, or None."""
+        key = self._key(sorted_list, target, low, high)
+        entry = self._traces.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._traces.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, sorted_list, target, trace, low=0, high=None):
+        """Cache a trace, evicting the least recently used one if full."""
+        self._traces[self._key(sorted_list, target, low, high)] = (sorted_list, trace)
+        if len(self._traces) > self.capacity:
+            self._traces.popitem(last=False)
+
+    def __len__(self):
+        return len(self._traces)
+
+    def clear(self):
+        self._traces.clear()
+
+
+def trace_search(sorted_list, target, low=0, high=None, cache=None):
+    """
+    Run `binary_search` once and return its trace, from cache if given and possible.
+
+    Args:
+        sorted_list: A list sorted in ascending order.
+        target: The value to search for.
+        low: First index of the search interval.
+        high: Last index of the search interval, inclusive (defaults to the end).
+        cache: Optional TraceCache to read and fill; None (the default)
+            always searches and keeps nothing.
+
+    Returns:
+        A SearchTrace whose index is the search result. Cached traces are
+        shared, so treat them as read-only.
+    """
+    if cache is not None:
+        trace = cache.get(sorted_list, target, low, high)
+        if trace is not None:
+            return trace
+
+    trace = SearchTrace(target)
+    trace.index, _ = binary_search(sorted_list, target, low, high, trace=trace)
+
+    if cache is not None:
+        cache.put(sorted_list, target, trace, low, high)
+    return trace
+
+
+def trace_statistics(trace):
+    """
+    Summarize how a search narrowed its interval.
+
+    Returns:
+        A dictionary with the target, index, steps, the interval width before
+        each step, the mean ratio between consecutive widths (0.5 for perfect
+        halving) and the distance between consecutive probes.
+    """
+    widths = [high - low + 1 for low, high, _, _ in trace]
+    ratios = [after / before for before, after in zip(widths, widths[1:])]
+    return {
+        "target": trace.target,
+        "index": trace.index,
+        "steps": trace.steps,
+        "widths": widths,
+        "mean_width_ratio": sum(ratios) / len(ratios) if ratios else None,
+        "probe_distances": [abs(after - before) for before, after in zip(trace.mids, trace.mids[1:])],
+    }
+
+
+def render_trace(trace, sorted_list=None):
+    """
+    Render a trace as a text table, one row per step.
+
+    Args:
+        trace: The SearchTrace to render.
+        sorted_list: If given, the mid values are shown too.
+
+    Returns:
+        The table as a string.
+    """
+    symbols = {-1: "<", 0: "=", 1: ">"}
+    lines = [f"{'Step':<6} {'Low':<10} {'High':<10} {'Mid':<10} {'Mid Value':<12} {'Target vs Mid'}"]
+    for step, (low, high, mid, comparison) in enumerate(trace, 1):
+        value = "-" if sorted_list is None else sorted_list[mid]
+        lines.append(f"{step:<6} {low:<10} {high:<10} {mid:<10} {value!s:<12} {symbols[comparison]}")
+    outcome = f"found at index {trace.index}" if trace.found else "not found"
+    lines.append(f"Target {trace.target} {outcome} in {trace.steps} step(s).")
+    return "\n".join(lines)
+
+
+def test_search_trace():
+    """
+    Run unit tests to verify traces and their cache.
+
+    Tests cover an empty list, found and absent targets, agreement with
+    the untraced search, bounded searches and cache hits and eviction.
+    """
+    values = [14, 25, 31, 46, 52, 63, 71, 84, 96, 99]
+    cache = TraceCache(capacity=2)
+
+    # Test empty list
+    trace = trace_search([], 5, cache=None)
+    assert trace.steps == 0 and not trace.found
+
+    # Traces replay exactly what binary_search did
+    for target in values + [0, 50, 100]:
+        trace = trace_search(values, target, cache=None)
+        assert (trace.index, trace.steps) == binary_search(values, target)
+        low, high, mid, comparison = trace[-1]
+        assert low <= mid <= high and (comparison == 0) == trace.found
+
+    trace = trace_search(values, 71, cache=None)
+    assert list(trace) == [(0, 9, 4, 1), (5, 9, 7, -1), (5, 6, 5, 1), (6, 6, 6, 0)]
+    assert trace_statistics(trace)["widths"] == [10, 5, 2, 1]
+    assert "found at index 6 in 4 step(s)" in render_trace(trace, values)
+
+    # Bounded searches are traced within their bounds
+    assert trace_search(values, 99, 5, 8, cache=None).index == -1
+
+    # Repeated pairs come from the cache; the least recently used is evicted
+    first = trace_search(values, 71, cache=cache)
+    assert trace_search(values, 71, cache=cache) is first and cache.hits == 1
+    trace_search(values, 14, cache=cache)
+    trace_search(values, 99, cache=cache)
+    assert len(cache) == 2 and trace_search(values, 71, cache=cache) is not first
+
+    print("All search trace tests passed.")
+
+
+if __name__ == "__main__":
+    test_search_trace()
@@ -0,0 +1,421 @@
+"""
+Workload Scenarios Module.
+
+`performance_comparison` draws uniform hits on a dense range, which is the
+easiest case for every search. This module describes the workloads that
+production traffic actually has, as named, seeded scenarios that always
+rebuild the same keys and targets:
+
+    - key distributions: dense, sparse, clustered and duplicate-heavy;
+    - target streams: uniform hits, Zipf-skewed hits, a sequential scan and
+      50% misses;
+    - cold cache: the CPU caches are flushed before every search.
+
+`workload_comparison` runs every scenario against every search
+implementation and reports latency percentiles and steps per scenario.
+"""
+import bisect
+import gc
+import random
+import time
+from dataclasses import dataclass, replace
+from itertools import repeat
+
+from .benchmark import measure_search, summarize, write_results
+from .lookup_cache import zipf_targets
+from .run_length import duplicate_keys
+
+# Number of clusters of consecutive keys in the clustered distribution
+CLUSTERS = 100
+# Share of duplicate keys in the duplicate-heavy distribution
+DUPLICATE_RATIO = 0.9
+# Share of absent targets in the miss-heavy stream
+MISS_RATIO = 0.5
+# Bytes copied before each cold-cache search: larger than the last-level cache
+COLD_CACHE_BYTES = 32 << 20
+# Implementations that search with C bisect and report a bit_length() upper
+# bound on their steps rather than counting them
+STEP_BOUNDS = frozenset({"array", "blocks", "rle"})
+# Implementations that keep state between searches; each repeat starts from
+# a freshly built structure so earlier repeats cannot warm it
+STATEFUL = frozenset({"cached"})
+
+
+def dense_keys(size, rng):
+    """Consecutive integers 0..size-1."""
+    return list(range(size))
+
+
+def sparse_keys(size, rng):
+    """Distinct integers drawn uniformly from a range 100 times larger."""
+    return sorted(rng.sample(range(size * 100), size))
+
+
+def clustered_keys(size, rng):
+    """Runs of consecutive integers separated by large random gaps."""
+    keys = []
+    start = 0
+    for cluster in range(CLUSTERS):
+        length = size // CLUSTERS + (cluster < size % CLUSTERS)
+        start += rng.randrange(1, size * 10)
+        keys.extend(range(start, start + length))
+        start += length
+    return keys
+
+
+def duplicate_heavy_keys(size, rng):
+    """Keys where DUPLICATE_RATIO of the keys repeat their predecessor."""
+    values, counts = duplicate_keys(size, DUPLICATE_RATIO, seed=rng.randrange(2 ** 32))
+    return [value for value, count in zip(values, counts) for value in repeat(value, count)]
+
+
+def uniform_targets(keys, count, rng):
+    """Keys drawn uniformly at random (all hits)."""
+    return [keys[rng.randrange(len(keys))] for _ in range(count)]
+
+
+def zipf_stream(keys, count, rng):
+    """Keys drawn with Zipf-skewed popularity, see `zipf_targets`."""
+    return zipf_targets(keys, count, seed=rng.randrange(2 ** 32))
+
+
+def sequential_targets(keys, count, rng):
+    """Consecutive keys from a random start, like a range scan."""
+    start = rng.randrange(max(1, len(keys) - count))
+    return [keys[min(start + offset, len(keys) - 1)] for offset in range(count)]
+
+
+def miss_heavy_targets(keys, count, rng):
+    """Hits and absent values mixed, MISS_RATIO of them absent."""
+    size = len(keys)
+    targets = []
+    for _ in range(count):
+        if rng.random() >= MISS_RATIO:
+            targets.append(keys[rng.randrange(size)])
+            continue
+        # Absent values inside and around the key range
+        while True:
+            target = rng.randint(keys[0] - size, keys[-1] + size)
+            position = bisect.bisect_left(keys, target)
+            if position == size or keys[position] != target:
+                break
+        targets.append(target)
+    return targets
+
+
+KEY_DISTRIBUTIONS = {
+    "dense": dense_keys,
+    "sparse": sparse_keys,
+    "clustered": clustered_keys,
+    "duplicates": duplicate_heavy_keys,
+}
+
+TARGET_STREAMS = {
+    "uniform": uniform_targets,
+    "zipf": zipf_stream,
+    "sequential": sequential_targets,
+    "misses": miss_heavy_targets,
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A key distribution, a target stream and the cache state of a run."""
+
+    keys: str
+    targets: str
+    cold: bool = False
+
+    @property
+    def name(self):
+        return f"{self.keys}/{self.targets}" + ("/cold" if self.cold else "")
+
+    def build(self, size, count, seed=0):
+        """
+        Generate the keys and targets of this scenario.
+
+        The random generator is seeded from seed and the scenario name, so a
+        scenario always produces the same data for the same arguments, and
+        scenarios do not share random streams.
+
+        Returns:
+            A tuple of (keys, targets): a sorted list and a list of count targets.
+        """
+        rng = random.Random(f"{seed}:{self.name}")
+        keys = KEY_DISTRIBUTIONS[self.keys](size, rng)
+        return keys, TARGET_STREAMS[self.targets](keys, count, rng)
+
+
+# Every distribution with every stream, plus a cold-cache run
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in [Scenario(keys, targets) for keys in KEY_DISTRIBUTIONS for targets in TARGET_STREAMS]
+    + [Scenario("sparse", "uniform", cold=True)]
+}
+
+
+def search_implementations():
+    """
+    Return every search implementation, as name -> build(keys).
+
+    build(keys) returns (structure, search) such that search(structure,
+    target) returns (index, steps). The registered strategies search the
+    keys directly; the other implementations build their structure first.
+    Linear search is left out: it takes seconds per scenario.
+    """
+    from .bounds import first_occurrence
+    from .eytzinger import EytzingerIndex
+    from .learned_index import LearnedIndex
+    from .lookup_cache import CachedSearch
+    from .run_length import RunLengthKeys
+    from .search_strategies import STRATEGIES
+    from .sorted_array import SortedIntArray
+    from .sorted_blocks import SortedBlockList
+
+    def direct(search):
+        return lambda keys: (keys, search)
+
+    implementations = {name: direct(strategy) for name, strategy in STRATEGIES.items()}
+    implementations.update({
+        "first_occurrence": direct(first_occurrence),
+        "array": lambda keys: (SortedIntArray(keys, assume_sorted=True), SortedIntArray.search),
+        "blocks": lambda keys: (SortedBlockList.from_sorted(keys), SortedBlockList.search),
+        "eytzinger": lambda keys: (EytzingerIndex(keys), EytzingerIndex.search),
+        "learned": lambda keys: (LearnedIndex(keys), LearnedIndex.search),
+        "rle": lambda keys: (RunLengthKeys(keys), RunLengthKeys.search),
+        # Warms up over one pass of the stream; rebuilt for every repeat
+        "cached": lambda keys: (CachedSearch(keys), CachedSearch.__call__),
+    })
+    return implementations
+
+
+def measure_cold(search, structure, targets, algorithm, size, eviction_bytes=COLD_CACHE_BYTES):
+    """
+    Time each search once, right after flushing the CPU caches.
+
+    Copying a buffer larger than the last-level cache evicts the keys, so
+    every probe pays main-memory latency. Each sample is a single call,
+    since a repeated call would hit a warm cache; the timer resolution
+    (well under a microsecond) bounds its precision.
+
+    Returns:
+        A Measurement with one sample per target.
+    """
+    source = bytearray(eviction_bytes)
+    buffer = bytearray(eviction_bytes)
+
+    def flush():
+        buffer[:] = source
+
+    samples, total_steps = _time_each_once(search, structure, targets, flush)
+    return summarize(samples, 1, size, algorithm, total_steps / len(targets))
+
+
+def measure_fresh(build, keys, targets, algorithm, repeats=3):
+    """
+    Time one pass over the targets per repeat, each on a newly built structure.
+
+    Stateful implementations such as `CachedSearch` would otherwise keep
+    what earlier repeats (and warmup calls) taught them. Every search is
+    timed once, since repeating a target would hit the state it just left.
+
+    Returns:
+        A Measurement with one sample per target and repeat, and the steps
+        of the first pass.
+    """
+    samples = []
+    steps = None
+    for _ in range(repeats):
+        structure, search = build(keys)
+        pass_samples, total_steps = _time_each_once(search, structure, targets)
+        samples += pass_samples
+        if steps is None:
+            steps = total_steps / len(targets)
+    return summarize(samples, 1, len(keys), algorithm, steps)
+
+
+def _time_each_once(search, structure, targets, before=None):
+    """Time a single call per target, after before() if given; return (samples, total steps)."""
+    samples = []
+    total_steps = 0
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for target in targets:
+            if before is not None:
+                before()
+            start_time = time.perf_counter()
+            _, steps = search(structure, target)
+            samples.append(time.perf_counter() - start_time)
+            total_steps += steps
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples, total_steps
+
+
+def run_scenario(scenario, size, num_targets, seed=0, implementations=None, cold_targets=100):
+    """
+    Run one scenario against several search implementations.
+
+    Args:
+        scenario: The Scenario to run.
+        size: Number of keys.
+        num_targets: Number of targets (cold scenarios use at most cold_targets).
+        seed: Seed passed to `Scenario.build`.
+        implementations: Dict of name -> build(keys), defaults to
+            `search_implementations()`.
+        cold_targets: Cap on the targets of a cold scenario; each one costs
+            a full cache flush.
+
+    Returns:
+        A list of Measurements, one per implementation, in order.
+    """
+    if implementations is None:
+        implementations = search_implementations()
+    if scenario.cold:
+        num_targets = min(num_targets, cold_targets)
+    keys, targets = scenario.build(size, num_targets, seed)
+
+    measurements = []
+    for name, build in implementations.items():
+        if name in STATEFUL and not scenario.cold:
+            measurements.append(measure_fresh(build, keys, targets, name))
+            continue
+        structure, search = build(keys)
+        if scenario.cold:
+            measurement = measure_cold(search, structure, targets, name, len(keys))
+        else:
+            measurement = measure_search(search, structure, targets, name, size=len(keys),
+                                         repeats=3, max_time=0.2)
+        measurements.append(measurement)
+    return measurements
+
+
+def render_scenarios(results):
+    """
+    Render scenario results as a text table, one row per implementation.
+
+    Steps of the STEP_BOUNDS implementations are upper bounds, shown as
+    "<=".
+
+    Args:
+        results: List of (scenario name, list of Measurements).
+
+    Returns:
+        The table as a string.
+    """
+    width = 110
+    lines = [
+        "=" * width,
+        "WORKLOAD SCENARIOS (seconds per search)",
+        "=" * width,
+        f"{'Scenario':<24} {'Implementation':<18} {'Median':<12} {'p95':<12} {'p99':<12}"
+        f" {'Steps':<9} {'vs. Binary'}",
+    ]
+
+    for scenario_name, measurements in results:
+        lines.append("-" * width)
+        binary = next((item.median for item in measurements if item.algorithm == "binary"), None)
+        for item in measurements:
+            relative = "-" if not binary or item.median <= 0 else f"{binary / item.median:.2f}x"
+            steps = "-" if item.steps is None else f"{item.steps:.1f}"
+            if item.steps is not None and item.algorithm in STEP_BOUNDS:
+                steps = f"<={steps}"
+            lines.append(
+                f"{scenario_name:<24} {item.algorithm:<18} {item.median:<12.3g} {item.p95:<12.3g}"
+                f" {item.p99:<12.3g} {steps:<9} {relative}")
+
+    lines.append("-" * width)
+    lines.append("Steps marked <= are bit_length() upper bounds of a C bisect, not counted iterations.")
+    lines.append("=" * width)
+    return "\n".join(lines)
+
+
+def test_workloads():
+    """
+    Run unit tests to verify the scenarios and the runner.
+
+    Tests cover reproducibility from the seed, the shape of every key
+    distribution and target stream, agreement of every implementation on
+    every scenario, fresh state for stateful implementations, labelled
+    step bounds, and a cold-cache measurement.
+    """
+    from .core import binary_search
+
+    size = 2000
+
+    for scenario in SCENARIOS.values():
+        keys, targets = scenario.build(size, 100, seed=7)
+        assert (keys, targets) == scenario.build(size, 100, seed=7), scenario.name
+        assert len(keys) == size and len(targets) == 100 and keys == sorted(keys), scenario.name
+
+    # Each distribution and stream has its defining property
+    assert len(set(Scenario("sparse", "uniform").build(size, 10)[0])) == size
+    keys, targets = Scenario("duplicates", "misses").build(size, 1000)
+    assert len(set(keys)) == round(size * (1 - DUPLICATE_RATIO))
+    present = set(keys)
+    assert 0.4 < sum(target not in present for target in targets) / len(targets) < 0.6
+    keys, targets = Scenario("dense", "sequential").build(size, 100)
+    assert targets == list(range(targets[0], targets[0] + 100))
+    keys, targets = Scenario("clustered", "zipf").build(size, 1000)
+    assert max(keys[i + 1] - keys[i] for i in range(size - 1)) > 1
+    assert max(targets.count(target) for target in set(targets)) > 10
+
+    # Every implementation finds exactly the present targets
+    implementations = search_implementations()
+    for scenario in SCENARIOS.values():
+        keys, targets = scenario.build(size, 50)
+        present = set(keys)
+        for name, build in implementations.items():
+            structure, search = build(keys)
+            for target in targets:
+                index, _ = search(structure, target)
+                assert (index != -1) == (target in present), (scenario.name, name, target)
+                assert index == -1 or keys[index] == target, (scenario.name, name, target)
+
+    # A stateful implementation starts every repeat from an empty cache
+    fresh = measure_fresh(implementations["cached"], keys, targets[:5] * 2, "cached", repeats=3)
+    assert fresh.samples == 30 and fresh.loops == 1
+    assert fresh.steps == sum(binary_search(keys, target)[1] for target in targets[:5]) / 10
+
+    cold = measure_cold(implementations["binary"](keys)[1], keys, targets[:5], "binary", len(keys),
+                        eviction_bytes=1 << 16)
+    assert cold.samples == 5 and cold.loops == 1 and cold.steps > 0
+
+    results = [("dense/uniform", run_scenario(Scenario("dense", "uniform"), 500, 20,
+                                              implementations={"binary": implementations["binary"]}))]
+    assert "dense/uniform" in render_scenarios(results)
+    assert "<=" in render_scenarios([("dense/uniform", [replace(results[0][1][0], algorithm="array")])])
+
+    print("All workload tests passed.")
+
+
+def workload_comparison(scenarios=None, size=10 ** 5, num_targets=500, seed=0, results_path=None):
+    """
+    Run scenarios against every search implementation and print the report.
+
+    Args:
+        scenarios: Scenario names to run (defaults to all of SCENARIOS).
+        size: Number of keys per scenario.
+        num_targets: Targets per scenario.
+        seed: Seed of every scenario; the same seed reproduces the same data.
+        results_path: Optional JSON file for the results, with algorithms
+            named "scenario/implementation" so baselines compare per scenario.
+    """
+    implementations = search_implementations()
+    results = []
+    for name in scenarios or SCENARIOS:
+        results.append((name, run_scenario(SCENARIOS[name], size, num_targets, seed, implementations)))
+    print(render_scenarios(results))
+
+    if results_path is not None:
+        flattened = [replace(item, algorithm=f"{name}/{item.algorithm}")
+                     for name, measurements in results for item in measurements]
+        write_results(results_path, flattened, {"size": size, "num_targets": num_targets, "seed": seed})
+
+
+if __name__ == "__main__":
+    test_workloads()
+    workload_comparison()
@@ -76,7 +76,9 @@ Search time remains almost constant.
 """
 
 import random
-import timeit
+
+from dichotomy.benchmark import measure_search, render_table
+from dichotomy.lazy_range import ArithmeticRange
 
 def linear_search(sorted_list, target):
     for index, value in enumerate(sorted_list):
@@ -89,40 +91,20 @@ def performance_comparison():
     N_values = [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
     num_searches = 100
 
-    print("=" * 80)
-    print("PERFORMANCE COMPARISON ( Average of 100 searches )")
-    print("=" * 80)
-    print(f"{'List Size (N)':<20} {'Linear Search (s)':<25} {'Binary Search (s)':<25} {'Speedup'}")
-    print("-" * 80)
+    measurements = []
 
     for N in N_values:
-        sorted_list = list(range(N))
-
-        total_linear_time = 0
-        total_binary_time = 0
-
-        for _ in range(num_searches):
-            target = random.randint(0, N - 1)
-
-            # Time linear search
-            start_time = timeit.default_timer()
-            linear_search(sorted_list, target)
-            total_linear_time += timeit.default_timer() - start_time
-
-            # Time binary search
-            start_time = timeit.default_timer()
-            binary_search(sorted_list, target)
-            total_binary_time += timeit.default_timer() - start_time
-
-        avg_linear = total_linear_time / num_searches
-        avg_binary = total_binary_time / num_searches
+        sorted_list = ArithmeticRange(0, N)
+        targets = [random.randint(0, N - 1) for _ in range(num_searches)]
 
-        speedup = (avg_linear / avg_binary) if avg_binary > 0 else float('inf')
+        # The benchmark harness warms up, repeats and reports the median time per search
+        measurements.append(measure_search(linear_search, sorted_list, targets, "linear", count_steps=False))
+        measurements.append(measure_search(binary_search, sorted_list, targets, "binary", count_steps=False))
 
-        print(f"{N:<20,d} {avg_linear:<25.6f} {avg_binary:<25.6f} {speedup:,.0f}x")
+    print(render_table(measurements, show_steps=False))
 
-    print("=" * 80)
+# Running the programs (only when executed as a script, not on import)
+if __name__ == "__main__":
+    test_binary_search()
+    performance_comparison()
 
-# Running the programs
-test_binary_search()
-performance_comparison()